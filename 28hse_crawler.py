@@ -7,20 +7,16 @@
 本爬虫采用多策略提取方法，按优先级顺序尝试不同的数据提取策略：
 
 1. 面包屑导航提取（主要方法）：
-   - 方法1: 从页面文本中通过正则表达式提取面包屑模式
-   - 方法2: 从JavaScript数据对象中提取（最可靠）
-   - 方法3: 从HTML面包屑导航元素中提取
-   - 方法4: 从导航链接中提取
+   - 从HTML面包屑导航元素的链接文本中提取各项（跳过"主頁"等首页项和开头的"地產主頁"）
    
 2. 字段映射策略：
-   - 首先从面包屑中提取完整路径
-   - 生成格式化的breadcrumb字符串（用">"分隔）
-   - 然后从breadcrumb字符串中解析各个字段：
-     * category: breadcrumb的第2个字符串
-     * region: breadcrumb的第3个字符串
-     * district_level2: breadcrumb的第4个字符串
-     * sub_district: breadcrumb的第5个字符串
-     * estate_name: breadcrumb的最后一个字符串
+   - 直接按面包屑各项的位置填充字段：
+     * category: 第1项（如"住宅售盤"）
+     * region: 第2项（如"新界"）
+     * district_level2: 第3项（如"大埔,太和,白石角"）
+     * sub_district: 28hse不使用
+     * estate_name: 最后一项（最后一项是property ID时取倒数第二项）
+   - 格式化的breadcrumb字符串（用">"分隔）只由已提取的字段生成，用于保存
 
 3. 备用提取方法：
    - 从URL中提取（用于title和estate_name）
@@ -36,6 +32,7 @@
 --------------
 - Hse28Crawler: 主爬虫类
   - crawl_list_page(): 爬取列表页，提取详情页URL
+  - crawl_list_pages_parallel(): 并发爬取多个列表页（URL参数分页）
   - crawl_detail_page(): 爬取单个详情页
   - _parse_detail_page(): 解析详情页HTML（核心方法）
   - crawl_all(): 批量爬取所有页面
@@ -43,15 +40,69 @@
 """
 
 import asyncio
+import atexit
+import io
 import json
+import logging
+import logging.handlers
+import os
+import pickle
+import queue
+import random
 import re
+import sys
 import csv
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Set
 from datetime import datetime
 from urllib.parse import urljoin, urlparse
 import hashlib
+from collections import defaultdict
+from contextlib import ExitStack
+from itertools import islice
 
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    from pybloom_live import BloomFilter
+    HAS_PYBLOOM = True
+except ImportError:
+    HAS_PYBLOOM = False
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pa_parquet
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
+from bs4 import BeautifulSoup  # crawl4ai 的依赖，随 crawl4ai 一起安装
+import soupsieve  # BeautifulSoup 的CSS选择器引擎（随 beautifulsoup4 一起安装）
 from crawl4ai import AsyncWebCrawler
 from crawl4ai.async_configs import BrowserConfig
 from crawl4ai.extraction_strategy import JsonCssExtractionStrategy
@@ -59,6 +110,448 @@ from crawl4ai.extraction_strategy import JsonCssExtractionStrategy
 from sites_config import HSE28_CONFIG
 from data_models import PropertyData
 
+# BeautifulSoup 解析器（列表页和详情页）：优先使用 lxml（C 实现，解析大页面快得多），
+# 未安装 lxml 时（例如 PyPy 环境）回退到内置的 html.parser
+HTML_PARSER = 'lxml' if HAS_LXML else 'html.parser'
+
+# 日志：各协程只把日志记录放入队列（不加锁、不做系统调用），由后台线程统一写到标准输出
+logger = logging.getLogger("hse28_crawler")
+_log_listener: Optional[logging.handlers.QueueListener] = None
+_log_pid: Optional[int] = None
+
+
+def _setup_logging():
+    """
+    配置队列日志（每个进程只配置一次）
+    
+    解析进程池的子进程从父进程fork而来时，没有复制后台线程，需要重新配置
+    """
+    global _log_listener, _log_pid
+    if _log_pid == os.getpid():
+        return
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    _log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    _log_listener.start()
+    atexit.register(_log_listener.stop)  # 退出前写完队列中剩余的日志
+    _log_pid = os.getpid()
+
+# 列表页地址提取正则（预编译），格式: "地区 屋苑名称 | 座数 楼层 室号"
+# 用于房产列表项文本
+_ITEM_ADDRESS_PATTERNS = [
+    re.compile(r'([^\s|]+)\s+([^\s|]+(?:\s+[^\s|]+)?)\s*\|'),  # "地区 屋苑名称 |"
+    re.compile(r'([^\s|]+)\s+([^\s|]+(?:\s+[^\s|]+)?)(?:\s*\|)?'),  # "地区 屋苑名称"
+]
+# 用于链接父元素文本（限制长度，避免匹配到整段描述）
+_ADDRESS_PATTERNS = [
+    re.compile(r'([^\s|]{2,15})\s+([^\s|]{2,20})\s*\|'),  # "地区 屋苑名称 |"
+    re.compile(r'([^\s|]{2,15})\s+([^\s|]{2,20})(?:\s*\|)?'),  # "地区 屋苑名称"
+]
+
+# 无效URL模式（需要过滤的路径）
+_INVALID_HREF_PATTERNS = [
+    '/member/',
+    '/login',
+    '/register',
+    '/search',
+    '/about',
+    '/contact',
+    '/help',
+    '/terms',
+    '/privacy',
+    '/admin/',
+    '/api/',
+    'javascript:',
+    '#',
+    'mailto:',
+    'tel:',
+    # 排除非apartment类型
+    '/office/',
+    '/shop/',
+    '/parking/',
+    '/car-park/',
+    '/车位/',
+    '/商铺/',
+    '/写字楼/',
+    '/commercial/',
+    '/industrial/',
+]
+
+# apartment类型的property详情页路径（不区分大小写，无需先把href转为小写）
+_APT_PROPERTY_RE = re.compile(r'/apartment/property-', re.IGNORECASE)
+
+# 房产详情页链接的接受条件（单个正则一次判断）：
+# 不包含任何无效URL模式，且是apartment类型的property详情页
+_ACCEPT_HREF_RE = re.compile(
+    r'^(?!.*(?:' + '|'.join(re.escape(p) for p in _INVALID_HREF_PATTERNS) + r'))'
+    r'(?=.*/apartment/property-)',
+    re.IGNORECASE,
+)
+
+# 面包屑导航中的首页链接文字（不作为字段）
+_HOME_TOKENS = frozenset({'主頁', 'Home', '首页'})
+# 描述中匹配到但不是地址的文字
+_INVALID_DESC_ADDRESSES = frozenset({'致電Whatsapp', '聯絡我們'})
+# 地区筛选中表示"不限地区"的取值
+_ALL_REGION_TOKENS = frozenset({'all', '全部', '不限'})
+# 地区筛选支持的多种region名称格式：规范名称 -> 所有变体
+_REGION_VARIANTS = {
+    '港島': ('港島', '香港島', '香港岛'),
+    '九龍': ('九龍', '九龙'),
+    '新界': ('新界', '新界東', '新界东', '新界西'),
+    '離島': ('離島', '离岛'),
+}
+_REGION_INDEX = {key: frozenset(variants) for key, variants in _REGION_VARIANTS.items()}
+# 变体 -> 规范名称（精确匹配只需一次字典查找）
+_REGION_CANONICAL = {variant: key for key, variants in _REGION_VARIANTS.items() for variant in variants}
+
+# 列表页地址中不应出现的关键词（价格、面积、户型等），合并为单个正则一次扫描
+_ADDRESS_INVALID_KEYWORDS = ['售', '租', '萬元', '呎', '房', '浴室', '座', '層', '室',
+                             '建築', '實用', '面積', '元', '售盤', '租盤', '樓盤']
+_INVALID_KW_RE = re.compile('|'.join(re.escape(kw) for kw in _ADDRESS_INVALID_KEYWORDS))
+
+if HAS_LXML:
+    # 从链接向上找到最近的房产列表项容器
+    _ADDR_CONTAINER_XPATH = etree.XPath(
+        'ancestor::*[contains(@class, "property") or contains(@class, "listing") '
+        'or contains(@class, "house")][1]'
+    )
+    # 房产列表项（对应 crawl_list_page 中的 property_item_selectors：
+    # .property-item 等都被 [class*="property"] 等包含，按文档顺序返回）
+    _LIST_ITEM_XPATH = etree.XPath(
+        '//*[contains(@class, "property") or contains(@class, "listing") or contains(@class, "house")]'
+    )
+    # 列表项内第一个带 href 的链接（同 item.find('a', href=True)）
+    _ITEM_LINK_XPATH = etree.XPath('(.//a[@href])[1]')
+
+
+def _parse_list_tree(html: str) -> tuple:
+    """
+    流式解析列表页HTML，在解析过程中顺带收集apartment详情页链接
+    
+    使用 iterparse 只对 <a> 元素产生事件，链接在构建DOM的同一遍扫描中收集，
+    不需要解析完成后再遍历一次整棵树。树本身会保留下来，供后续按链接定位
+    列表项容器提取地址使用（因此不能边解析边丢弃子树）。
+    
+    Args:
+        html: 列表页HTML
+        
+    Returns:
+        tuple: (根元素, 详情页链接元素列表)，链接按文档顺序排列
+    """
+    context = etree.iterparse(
+        io.BytesIO(html.encode('utf-8')),
+        events=('end',),
+        tag='a',
+        html=True,
+        encoding='utf-8',
+    )
+    link_elements = []
+    for _, element in context:
+        href = element.get('href')
+        if href and _APT_PROPERTY_RE.search(href):
+            link_elements.append(element)
+    return context.root, link_elements
+
+
+# ============================================================================
+# 详情页字段的CSS选择器（按优先级排列）
+# ============================================================================
+_BREADCRUMB_SELECTORS = [
+    '.breadcrumb',
+    '.breadcrumbs',
+    '.nav-breadcrumb',
+    '[class*="breadcrumb"]',
+    'nav[aria-label*="breadcrumb"]',
+]
+_TITLE_SELECTORS = [
+    'h1.property-title',
+    'h1.title',
+    'h1',
+    '.property-title',
+    '.title',
+    'title',
+]
+_PRICE_SELECTORS = [
+    '.price',
+    '.property-price',
+    '.house-price',
+    '[class*="price"]',
+]
+_AREA_SELECTORS = [
+    '.area',
+    '.property-area',
+    '.house-area',
+    '[class*="area"]',
+]
+_LOCATION_SELECTORS = [
+    '.location',
+    '.address',
+    '.property-location',
+    '[class*="location"]',
+    '[class*="address"]',
+]
+_DESC_SELECTORS = [
+    '.description',
+    '.property-description',
+    '[class*="description"]',
+]
+# 图片容器选择器（提取容器内的 img）
+_IMG_CONTAINER_SELECTORS = [
+    '.property-images',
+    '.gallery',
+    '[class*="image"]',
+]
+
+# ============================================================================
+# 详情页文本提取的正则表达式
+# 同一字段的多个模式合并为一个带命名分组的交替表达式，只需扫描一遍页面文本：
+# 取页面中最靠前的匹配，同一位置按交替顺序（即原先的优先级）选择
+# ============================================================================
+_PRICE_TEXT_RE = re.compile(
+    r'(?P<num>[\$HK\$]?\s*[\d,]+萬?)'
+    r'|(?P<wan>[\d,]+[万萬])'
+    r'|(?P<hkd>HK\$\s*[\d,]+萬?)'
+)
+_MONTHLY_RE = re.compile(
+    r'月供[：:]\s*[\$HK\$]?(?P<monthly>[\d,]+)'
+    r'|每月[：:]\s*[\$HK\$]?(?P<per_month>[\d,]+)'
+    r'|\$(?P<before_monthly>[\d,]+)\s*月供'
+)
+_AREA_TEXT_RE = re.compile(
+    r'(?P<chi>[\d.]+?\s*呎)'
+    r'|(?P<sqft_zh>[\d.]+?\s*平方呎)'
+    r'|(?P<sqft>[\d.]+?\s*sqft)',
+    re.IGNORECASE,
+)
+_PROPERTY_TYPE_RE = re.compile(r'(?P<rooms_zh>\d+)\s*房|(?P<rooms_en>\d+)\s*bedroom', re.IGNORECASE)
+_FLOOR_RE = re.compile(
+    r'(?P<lau>\d+)\s*樓'
+    r'|(?P<tsang>\d+)\s*層'
+    r'|floor\s*(?P<floor_en>\d+)',
+    re.IGNORECASE,
+)
+# _FLOOR_RE 英文分支的预检查（不区分大小写，避免为判断关键词而复制整页文本的小写版本）
+_FLOOR_WORD_RE = re.compile('floor', re.IGNORECASE)
+# 街道名称：XXX徑、XXX路、XXX街、XXX道、XXX里
+_STREET_RE = re.compile(
+    r'(?P<zh>[^\s]{2,15}(?:徑|路|街|道|里))'
+    r'|(?P<en>[^\s]{2,15}(?:Road|Street|Avenue|Lane))'
+)
+# 不是街道名称的匹配（"地址"、"致電"等标签文字）
+_INVALID_STREET_RE = re.compile('地址|位置|地點|Location|Address|致電|Whatsapp|聯絡|電話|Tel')
+# 描述中的地址
+_DESC_ADDRESS_RE = re.compile(
+    r'(?P<zh>[^\s]{2,20}(?:徑|路|街|道|里|花園|苑|邨|中心|居|軒|灣|城|山|臺|台))'
+    r'|(?P<en>[^\s]{2,20}(?:Road|Street|Avenue|Lane|Garden|Estate))'
+)
+_PRICE_NUMBER_RE = re.compile(r'[\d,]+')
+_AREA_NUMBER_RE = re.compile(r'[\d.]+')
+# 标题清理：移除 "#编号" 及 "售盤樓盤詳細資料" 等后缀
+_TITLE_ID_SUFFIX_RE = re.compile(r'\s*#\d+.*')
+_TITLE_LISTING_SUFFIX_RE = re.compile(r'\s*(售盤|租盤|樓盤|詳細資料).*')
+
+# 房产详情区域（价格、面积、房型、楼层等优先在此区域内匹配）
+_DETAIL_SECTION_SELECTOR = '[class*="detail"], [class*="info"]'
+
+# 取第一个匹配元素的字段（与 select_one 相同）
+_DETAIL_SELECTORS = {
+    'breadcrumb': _BREADCRUMB_SELECTORS,
+    'title': _TITLE_SELECTORS,
+    'price': _PRICE_SELECTORS,
+    'area': _AREA_SELECTORS,
+    'location': _LOCATION_SELECTORS,
+    'description': _DESC_SELECTORS,
+}
+# 所有字段和图片容器的选择器合并为一个逗号分隔的选择器，一次遍历取出全部候选元素（按文档顺序）
+_DETAIL_CANDIDATES_SELECTOR = ', '.join(dict.fromkeys(
+    selector
+    for selectors in (*_DETAIL_SELECTORS.values(), _IMG_CONTAINER_SELECTORS)
+    for selector in selectors
+))
+# BeautifulSoup 路径的 (字段, 选择器序号, 匹配函数)
+_SOUP_DETAIL_MATCHERS = [
+    (field, index, soupsieve.compile(selector).match)
+    for field, selectors in {**_DETAIL_SELECTORS, 'images': _IMG_CONTAINER_SELECTORS}.items()
+    for index, selector in enumerate(selectors)
+]
+
+# 简单CSS选择器：tag、.class、[attr*="value"] 及其组合
+_SIMPLE_SELECTOR_RE = re.compile(
+    r'^(?P<tag>\w+)?(?:\.(?P<cls>[\w-]+))?(?:\[(?P<attr>[\w-]+)\*="(?P<val>[^"]+)"\])?$'
+)
+
+
+def _compile_simple_selector(selector: str):
+    """
+    把简单CSS选择器转换为lxml元素的匹配函数
+    
+    只支持本文件用到的形式：tag、.class、[attr*="value"] 及其组合（如 h1.title、nav[aria-label*="x"]）
+    """
+    tag, cls, attr, val = _SIMPLE_SELECTOR_RE.match(selector).group('tag', 'cls', 'attr', 'val')
+    
+    def matches(element) -> bool:
+        if tag and element.tag != tag:
+            return False
+        if cls and cls not in (element.get('class') or '').split():
+            return False
+        if attr and val not in (element.get(attr) or ''):
+            return False
+        return True
+    
+    return matches
+
+
+def _select_detail_elements(candidates, matchers) -> Dict[str, list]:
+    """
+    一次遍历候选元素，按选择器优先级收集详情页各字段匹配到的元素
+    
+    Args:
+        candidates: 按文档顺序排列的候选元素（lxml 或 BeautifulSoup 元素）
+        matchers: (字段, 选择器序号, 匹配函数) 列表
+        
+    Returns:
+        dict: {字段: [每个选择器的匹配结果]}。'images' 保存每个容器选择器匹配到的全部元素，
+              其他字段只保存第一个匹配元素（没有匹配时为 None）
+    """
+    selected = {field: [None] * len(selectors) for field, selectors in _DETAIL_SELECTORS.items()}
+    selected['images'] = [[] for _ in _IMG_CONTAINER_SELECTORS]
+    pending = matchers
+    
+    for element in candidates:
+        filled = False
+        for field, index, matches in pending:
+            if matches(element):
+                if field == 'images':
+                    selected['images'][index].append(element)
+                else:
+                    selected[field][index] = element
+                    filled = True
+        if filled:
+            # 已找到第一个匹配的选择器不再参与后续匹配
+            pending = [m for m in pending if m[0] == 'images' or selected[m[0]][m[1]] is None]
+    
+    return selected
+
+
+def _first_text(elements, get_text, min_len: int = 0) -> Optional[str]:
+    """
+    按选择器优先级取第一个文本长度大于 min_len 的元素文本
+    
+    都不满足时返回最后一个匹配元素的文本（与逐个 select_one 的循环行为一致），
+    没有任何匹配元素时返回 None
+    """
+    text = None
+    for element in elements:
+        if element is not None:
+            text = get_text(element)
+            if text and len(text) > min_len:
+                break
+    return text
+
+
+if HAS_LXML:
+    # 详情页候选元素：带class的元素，以及按标签匹配的 h1、title、nav（一次遍历取出）
+    _DETAIL_CANDIDATES_XPATH = etree.XPath('//*[@class] | //h1 | //title | //nav[@aria-label]')
+    # 页面文本和元素文本（排除 script、style，与 BeautifulSoup 的 get_text 一致）
+    _PAGE_TEXT_XPATH = etree.XPath('//text()[not(ancestor::script or ancestor::style)]')
+    _ELEMENT_TEXT_XPATH = etree.XPath('.//text()[not(ancestor::script or ancestor::style)]')
+    # 元素内带 href 的链接（面包屑导航）
+    _LINKS_XPATH = etree.XPath('.//a[@href]')
+    _DETAIL_SECTION_XPATH = etree.XPath('(//*[contains(@class, "detail") or contains(@class, "info")])[1]')
+    # (字段, 选择器序号, 匹配函数)
+    _DETAIL_MATCHERS = [
+        (field, index, _compile_simple_selector(selector))
+        for field, selectors in {**_DETAIL_SELECTORS, 'images': _IMG_CONTAINER_SELECTORS}.items()
+        for index, selector in enumerate(selectors)
+    ]
+    
+    def _lxml_text(element) -> str:
+        """元素文本，等价于 BeautifulSoup 的 get_text(strip=True)"""
+        if len(element) == 0:
+            # 没有子元素（如大多数链接）时直接取 .text，不必运行XPath
+            return (element.text or '').strip()
+        return ''.join(t.strip() for t in _ELEMENT_TEXT_XPATH(element))
+
+
+# 触发退避重试的HTTP状态码：429（请求过多）和服务器错误
+_RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def _is_overloaded(result) -> bool:
+    """抓取结果是否表明网站过载：429/5xx，或没有状态码的失败（超时等），用于AIMD并发控制"""
+    status_code = getattr(result, 'status_code', None)
+    return status_code in _RETRY_STATUS_CODES or (
+        status_code is None and not getattr(result, 'success', False)
+    )
+
+
+class _DomainLimiter:
+    """
+    按域名限速：同一域名相邻两次请求的开始时间至少间隔 delay 秒
+    
+    并发抓取时各协程共享同一个限速器，先到先得地领取下一个可用的时间点，
+    避免同时向网站发出大量请求而被封禁。
+    """
+    
+    def __init__(self, delay: float = 1.5):
+        self.delay = delay
+        self.next: Dict[str, float] = {}  # 域名 -> 下一次允许请求的时间（事件循环时钟）
+        self.lock = asyncio.Lock()
+    
+    async def wait(self, host: str):
+        """等待直到可以向 host 发出下一次请求"""
+        loop = asyncio.get_running_loop()
+        async with self.lock:
+            now = loop.time()
+            start = max(now, self.next.get(host, now))
+            self.next[host] = start + self.delay
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+class _AIMDController:
+    """
+    AIMD自适应并发（与TCP拥塞控制相同的思路）
+    
+    每次请求成功，允许的并发数加1（不超过 max_cap）；遇到429/5xx或超时，并发数减半（至少为1）。
+    这样无需手动调参即可收敛到网站实际能承受的并发数。用法：
+    
+        async with controller:   # 正在进行的请求数达到 target 时等待
+            ...
+        await controller.record(ok)
+    """
+    
+    def __init__(self, initial: int = 4, max_cap: int = 8):
+        self.max_cap = max(max_cap, 1)
+        self.target = min(max(initial, 1), self.max_cap)
+        self.in_flight = 0
+        self.cond = asyncio.Condition()
+    
+    async def __aenter__(self):
+        async with self.cond:
+            await self.cond.wait_for(lambda: self.in_flight < self.target)
+            self.in_flight += 1
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        async with self.cond:
+            self.in_flight -= 1
+            self.cond.notify_all()
+    
+    async def record(self, ok: bool):
+        """根据一次请求的结果调整并发数：成功加性增加，失败乘性减少"""
+        async with self.cond:
+            if ok:
+                self.target = min(self.target + 1, self.max_cap)
+                self.cond.notify_all()
+            else:
+                self.target = max(self.target // 2, 1)
+
 
 class Hse28Crawler:
     """
@@ -76,87 +569,308 @@ class Hse28Crawler:
     - crawled_urls: 已爬取的URL集合（用于去重）
     - properties: 提取的房产数据列表
     - failed_urls: 失败的URL列表（用于错误追踪）
+    - incremental: 是否增量爬取（跳过之前运行中已成功爬取的详情页）
+    
+    用法：
+        async with Hse28Crawler() as crawler:
+            await crawler.crawl_all(max_pages=5)
+    
+    所有请求共用 async with 打开的同一个浏览器实例；未使用 async with 时，
+    每次调用公开方法会临时打开并关闭一个浏览器。
     """
     
-    def __init__(self, output_dir: str = "data/28hse"):
+    # 增量爬取历史（Bloom过滤器）的容量和误判率
+    HISTORY_CAPACITY = 1_000_000
+    HISTORY_ERROR_RATE = 0.001
+    # 每成功爬取多少个详情页保存一次历史
+    HISTORY_SAVE_INTERVAL = 100
+    # 断点续爬检查点文件（JSON Lines，每成功解析一个详情页追加一行）
+    CHECKPOINT_FILENAME = "_checkpoint.jsonl"
+    # 批量爬取详情页时每批提交的URL数为AIMD当前并发数的多少倍（每批结束后按新的并发数提交下一批）
+    AIMD_BATCH_ROUNDS = 4
+    
+    def __init__(self, output_dir: str = "data/28hse", incremental: bool = False,
+                 parse_workers: Optional[int] = None, enable_parquet: bool = True,
+                 max_concurrent: Optional[int] = None):
         """
         初始化爬虫
         
         Args:
             output_dir: 数据输出目录，默认为 "data/28hse"
+            incremental: 是否增量爬取。开启后会从输出目录加载已爬取URL的历史，
+                        跳过之前已成功爬取的详情页，并在保存数据时更新历史
+            parse_workers: 解析详情页的子进程数，默认为CPU核数；0 表示在事件循环线程中直接解析
+            enable_parquet: 保存数据时是否额外输出Parquet文件（需要安装 pyarrow），便于后续分析快速加载
+            max_concurrent: 同时爬取的详情页/列表页数，默认使用站点配置的 max_concurrent
         """
+        _setup_logging()
         self.config = HSE28_CONFIG
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.crawled_urls = set()
+        self.crawled_urls: Set[str] = set()  # 集合：每个详情页的去重检查为O(1)
+        self.incremental = incremental
+        self.enable_parquet = enable_parquet
+        self.max_concurrent = max_concurrent or self.config.max_concurrent
+        # 安装了 pybloom-live 时用Bloom过滤器（每个URL约1字节），否则用文本文件保存的集合
+        self._history_file = self.output_dir / ("crawled.bloom" if HAS_PYBLOOM else "crawled_urls.txt")
+        self._crawl_history = self._load_crawl_history() if incremental else None
+        self._history_unsaved = 0
+        self._checkpoint_file = self.output_dir / self.CHECKPOINT_FILENAME
+        self._checkpoint_f = None  # crawl_all 期间打开的检查点文件
         self.properties: List[PropertyData] = []
-        self.failed_urls = []
+        self.failed_urls: List[str] = []  # 按失败顺序记录，不重复
+        self._failed_set: Set[str] = set()
+        self._failed_file: Optional[Path] = None  # 失败URL文件（第一次失败时创建，之后逐行追加）
+        self._failed_f = None
         self._first_page_urls = set()
         self._list_page_addresses: Dict[str, str] = {}  # 存储从列表页提取的地址信息
+        self._session_id_cache: Dict[str, str] = {}  # 列表页URL -> session_id（同一列表的各页复用）
+        self._domain_re = re.compile(re.escape(self.config.domain), re.IGNORECASE)  # 判断链接是否属于本站
+        self._browser_config = BrowserConfig(
+            headless=True,
+            user_agent=self.config.user_agent,
+        )
+        self._crawler: Optional[AsyncWebCrawler] = None  # 共享浏览器实例（通过 async with 打开）
+        # async with 的嵌套层数：并发调用可能同时进入，只有最外层退出时才关闭浏览器
+        self._enter_depth = 0
+        self._crawler_lock = asyncio.Lock()
+        self._limiter = _DomainLimiter(self.config.rate_limit)  # 按域名限速，所有页面请求共用
+        self.max_retries = 5  # 遇到429/5xx时的最大尝试次数
+        # 逐个爬取详情页时的自适应并发：从 max_concurrent 开始，最多增加到其4倍
+        self._aimd = _AIMDController(initial=self.max_concurrent, max_cap=self.max_concurrent * 4)
+        self._parse_workers = (os.cpu_count() or 1) if parse_workers is None else parse_workers
+        self._parse_pool: Optional[ProcessPoolExecutor] = None  # 解析详情页的进程池（通过 async with 打开）
+    
+    def _load_crawl_history(self):
+        """
+        加载增量爬取历史（之前运行中已成功爬取的详情页URL）
+        
+        Returns:
+            BloomFilter 或 set，支持 `url in history` 和 `history.add(url)`
+        """
+        if HAS_PYBLOOM:
+            if self._history_file.exists():
+                with open(self._history_file, 'rb') as f:
+                    history = BloomFilter.fromfile(f)
+                logger.info(f"✓ 已加载增量爬取历史: {self._history_file}（约 {len(history)} 个URL）")
+                return history
+            return BloomFilter(capacity=self.HISTORY_CAPACITY, error_rate=self.HISTORY_ERROR_RATE)
+        
+        history = set()
+        if self._history_file.exists():
+            with open(self._history_file, 'r', encoding='utf-8') as f:
+                history.update(line.strip() for line in f if line.strip())
+            logger.info(f"✓ 已加载增量爬取历史: {self._history_file}（{len(history)} 个URL）")
+        return history
+    
+    def _save_crawl_history(self):
+        """保存增量爬取历史到输出目录"""
+        if self._crawl_history is None:
+            return
+        if HAS_PYBLOOM:
+            with open(self._history_file, 'wb') as f:
+                self._crawl_history.tofile(f)
+        else:
+            with open(self._history_file, 'w', encoding='utf-8') as f:
+                f.writelines(url + "\n" for url in self._crawl_history)
+        self._history_unsaved = 0
+    
+    def _in_crawl_history(self, url: str) -> bool:
+        """URL是否在之前的运行中已成功爬取（仅增量模式）"""
+        return self._crawl_history is not None and url in self._crawl_history
+    
+    def _record_crawled(self, url: str):
+        """记录成功爬取的详情页URL，并定期保存历史"""
+        if self._crawl_history is None:
+            return
+        self._crawl_history.add(url)
+        self._history_unsaved += 1
+        if self._history_unsaved >= self.HISTORY_SAVE_INTERVAL:
+            self._save_crawl_history()
+    
+    def _open_checkpoint(self):
+        """
+        加载上次中断时留下的检查点，并以追加模式打开检查点文件
+        
+        检查点中的房产直接放入 self.properties，其URL加入 crawled_urls，本次运行不再重复爬取。
+        进程崩溃时最后一行可能不完整，解析失败的行会被跳过。
+        """
+        if self._checkpoint_f is not None:
+            return
+        partial_tail = False
+        if self._checkpoint_file.exists():
+            loaded = 0
+            with open(self._checkpoint_file, 'rb') as f:
+                for line in f:
+                    try:
+                        record = orjson.loads(line) if HAS_ORJSON else json.loads(line)
+                    except ValueError:
+                        continue
+                    for key in ('post_date', 'update_date', 'crawl_date'):
+                        if record.get(key):
+                            record[key] = datetime.fromisoformat(record[key])
+                    prop = PropertyData(**record)
+                    if prop.url in self.crawled_urls:
+                        continue
+                    self._intern_fields(prop)
+                    self.properties.append(prop)
+                    self.crawled_urls.add(prop.url)
+                    loaded += 1
+                # 最后一行不完整时先补上换行，避免新记录接在残缺行后面
+                if f.seek(0, os.SEEK_END):
+                    f.seek(-1, os.SEEK_END)
+                    partial_tail = f.read(1) != b'\n'
+            logger.info(f"✓ 已从检查点恢复 {loaded} 条记录: {self._checkpoint_file}")
+        self._checkpoint_f = open(self._checkpoint_file, 'ab')
+        if partial_tail:
+            self._checkpoint_f.write(b'\n')
     
     @staticmethod
-    def _parse_breadcrumb_fields(breadcrumb: str) -> tuple:
+    def _intern_fields(property_data: PropertyData):
         """
-        从breadcrumb字符串中解析各个字段（28hse专用）
+        驻留取值重复率高的字段（地区、二级区域、类别），所有记录共用同一个字符串对象
         
-        设计说明：
-        ----------
-        根据28hse的实际breadcrumb格式提取字段：
-        breadcrumb格式: "主頁 > 地產主頁 > 住宅售盤 > 新界 > 大埔,太和,白石角 > 逸瓏灣8 > property 3688274"
+        在主进程中调用：子进程解析结果经pickle传回后是新的字符串对象
+        """
+        for field_name in ('region', 'district_level2', 'category'):
+            value = getattr(property_data, field_name)
+            if value:
+                setattr(property_data, field_name, sys.intern(value))
+    
+    def _write_checkpoint(self, property_data: PropertyData):
+        """把一条成功解析的记录追加到检查点文件（立即 flush，崩溃时不丢失）"""
+        if self._checkpoint_f is None:
+            return
+        record = property_data.to_dict()
+        if HAS_ORJSON:
+            self._checkpoint_f.write(orjson.dumps(record) + b'\n')
+        else:
+            self._checkpoint_f.write(json.dumps(record, ensure_ascii=False).encode('utf-8') + b'\n')
+        self._checkpoint_f.flush()
+    
+    def _record_failed(self, url: str):
+        """
+        记录失败的URL，并立即写入失败URL文件（行缓冲，程序中途崩溃也不会丢失）
         
-        字段映射：
-        - category: "住宅售盤" (移除"主頁"和"地產主頁"后的第一个，即parts[0])
-        - region: "新界" (parts[1])
-        - district_level2: "大埔,太和,白石角" (parts[2])
-        - sub_district: None (28hse不使用此字段)
-        - estate_name: "逸瓏灣8" (parts[3]，倒数第二个，排除最后一个property ID)
+        文件在第一次失败时创建，名称带创建时的时间戳
+        """
+        if url in self._failed_set:
+            return
+        self._failed_set.add(url)
+        self.failed_urls.append(url)
+        if self._failed_f is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            self._failed_file = self.output_dir / f"failed_urls_{timestamp}.txt"
+            self._failed_f = open(self._failed_file, 'w', encoding='utf-8', buffering=1)
+        self._failed_f.write(url + "\n")
+    
+    def _close_failed_file(self):
+        """关闭失败URL文件（之后再有失败时会新建一个文件）"""
+        if self._failed_f is not None:
+            f, self._failed_f = self._failed_f, None
+            f.close()
+    
+    def _close_checkpoint(self, remove: bool = False):
+        """关闭检查点文件；remove=True 时（数据已完整保存）删除检查点"""
+        if self._checkpoint_f is not None:
+            f, self._checkpoint_f = self._checkpoint_f, None
+            f.close()
+        if remove and self._checkpoint_file.exists():
+            self._checkpoint_file.unlink()
+    
+    async def __aenter__(self):
+        """
+        打开共享的浏览器实例
+        
+        列表页和详情页的爬取都复用这个实例，避免每次请求都冷启动一个新的浏览器。
+        用法: async with Hse28Crawler() as crawler: ...
+        可以重入：并发调用各自进入时共用同一个浏览器，浏览器启动完成后才对其他调用可见。
+        """
+        self._enter_depth += 1
+        try:
+            async with self._crawler_lock:
+                if self._crawler is None:
+                    crawler = AsyncWebCrawler(config=self._browser_config)
+                    await crawler.__aenter__()
+                    self._crawler = crawler
+        except BaseException:
+            self._enter_depth -= 1
+            raise
+        # 详情页解析是CPU密集型操作，放到子进程中执行，避免阻塞事件循环上的网络请求
+        if self._parse_pool is None and self._parse_workers > 0:
+            try:
+                # 本模块未以可导入的名称加载时（例如通过文件路径动态加载），子进程无法找到解析函数
+                pickle.dumps(_parse_detail_page_worker)
+                self._parse_pool = ProcessPoolExecutor(max_workers=self._parse_workers)
+            except (pickle.PicklingError, AttributeError, OSError, ValueError, NotImplementedError) as e:
+                logger.warning(f"  ⚠ 无法创建解析进程池，改为在主进程中解析: {str(e)[:100]}")
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        """退出最外层的 async with 时关闭共享的浏览器实例、解析进程池、检查点文件和失败URL文件"""
+        self._enter_depth -= 1
+        if self._enter_depth > 0:
+            return
+        self._close_checkpoint()
+        self._close_failed_file()
+        if self._parse_pool is not None:
+            pool, self._parse_pool = self._parse_pool, None
+            pool.shutdown(wait=True)
+        if self._crawler is not None:
+            crawler, self._crawler = self._crawler, None
+            await crawler.__aexit__(exc_type, exc, tb)
+    
+    async def _arun(self, url: str, crawler: Optional[AsyncWebCrawler] = None, **kwargs):
+        """
+        使用传入的或共享的浏览器抓取页面（调用方需保证已通过 async with 打开共享浏览器）
+        
+        每次请求前按域名限速；返回429或5xx时按带随机抖动的指数退避重试，
+        最多尝试 max_retries 次，最后一次的结果原样返回。
+        每次请求的结果都反馈给AIMD并发控制器
+        """
+        crawler = crawler or self._crawler
+        host = urlparse(url).netloc
+        for attempt in range(self.max_retries):
+            await self._limiter.wait(host)
+            try:
+                result = await crawler.arun(url=url, **kwargs)
+            except Exception:
+                await self._aimd.record(False)
+                raise
+            status_code = getattr(result, 'status_code', None)
+            await self._aimd.record(not _is_overloaded(result))
+            if status_code not in _RETRY_STATUS_CODES or attempt == self.max_retries - 1:
+                return result
+            delay = min(1.0 * 2 ** attempt + random.random() * 0.5, 32)
+            logger.warning(f"  ⚠ HTTP {status_code}，{delay:.1f}秒后重试 ({attempt + 1}/{self.max_retries - 1}): {url[:80]}")
+            await asyncio.sleep(delay)
+    
+    @staticmethod
+    def _extract_list_address(text: str) -> Optional[str]:
+        """
+        从列表项文本中提取地址
+        
+        格式通常是 "地区 屋苑名称 | ..."，例如: "荔枝角 宇晴軒 | 7座 中層 E室"
         
         Args:
-            breadcrumb: 格式化的breadcrumb字符串，如 "主頁 > 地產主頁 > 住宅售盤 > 新界 > 大埔,太和,白石角 > 逸瓏灣8 > property 3688274"
+            text: 列表项（或链接附近元素）的文本
             
         Returns:
-            tuple: (category, region, district_level2, sub_district, estate_name)
+            str: "地区 屋苑名称"，无法提取或内容不合理时返回 None
         """
-        if not breadcrumb:
-            return None, None, None, None, None
-        
-        # 处理 ">" 分隔符或空格分隔符
-        if ' > ' in breadcrumb:
-            parts = [p.strip() for p in breadcrumb.split(' > ')]
-        else:
-            parts = breadcrumb.split()
-        
-        # 移除 "主頁" 如果存在
-        if parts and parts[0] == '主頁':
-            parts = parts[1:]
-        
-        # 移除 "地產主頁" 如果存在（28hse特有）
-        if parts and parts[0] == '地產主頁':
-            parts = parts[1:]
-        
-        # 根据28hse的格式映射字段
-        # parts结构: ["住宅售盤", "新界", "大埔,太和,白石角", "逸瓏灣8", "property 3688274"]
-        category = parts[0] if len(parts) > 0 and parts[0] else None
-        region = parts[1] if len(parts) > 1 and parts[1] else None
-        district_level2 = parts[2] if len(parts) > 2 and parts[2] else None
-        sub_district = None  # 28hse不使用sub_district字段
-        
-        # estate_name: 取倒数第二个部分（排除最后一个property ID）
-        # 如果最后一个部分看起来像property ID（包含"property"或全是数字），则取倒数第二个
-        if len(parts) >= 4:
-            last_part = parts[-1].lower()
-            # 检查最后一个部分是否是property ID
-            if 'property' in last_part or last_part.replace('-', '').replace('_', '').isdigit():
-                estate_name = parts[-2] if len(parts) > 2 else None
-            else:
-                estate_name = parts[-1] if parts[-1] else None
-        elif len(parts) == 3:
-            # 如果只有3个部分，最后一个就是estate_name
-            estate_name = parts[2] if parts[2] else None
-        else:
-            estate_name = None
-        
-        return category, region, district_level2, sub_district, estate_name
+        for pattern in _ADDRESS_PATTERNS:
+            match = pattern.search(text)
+            if match:
+                district_part = match.group(1).strip()
+                estate_part = match.group(2).strip()
+                
+                # 验证提取的内容是否合理
+                if (district_part and estate_part and
+                    len(district_part) > 1 and len(estate_part) > 1 and
+                    not _INVALID_KW_RE.search(district_part) and
+                    not _INVALID_KW_RE.search(estate_part)):
+                    return f"{district_part} {estate_part}"
+        return None
     
     @staticmethod
     def _generate_breadcrumb(category: str, region: str, district: str, 
@@ -176,19 +890,8 @@ class Hse28Crawler:
         Returns:
             str: 格式化的breadcrumb字符串，如 "主頁 > 買樓 > 新界西 > 屯門 > 屯門市中心 > 瓏門"
         """
-        breadcrumb_parts = ['主頁']
-        if category:
-            breadcrumb_parts.append(category)
-        if region:
-            breadcrumb_parts.append(region)
-        if district:
-            breadcrumb_parts.append(district)
-        if district_level2:
-            breadcrumb_parts.append(district_level2)
-        if sub_district:
-            breadcrumb_parts.append(sub_district)
-        if estate_name:
-            breadcrumb_parts.append(estate_name)
+        breadcrumb_parts = [p for p in ('主頁', category, region, district,
+                                         district_level2, sub_district, estate_name) if p]
         
         return ' > '.join(breadcrumb_parts) if len(breadcrumb_parts) > 1 else None
         
@@ -204,24 +907,78 @@ class Hse28Crawler:
         Args:
             url: 列表页URL
             page_num: 页码（1, 2, 3...）
-            crawler: 可选的AsyncWebCrawler实例（用于AJAX分页）
+            crawler: 可选的AsyncWebCrawler实例（用于AJAX分页），默认使用共享浏览器
             
         Returns:
             房产详情页URL列表
         """
-        browser_config = BrowserConfig(
-            headless=True,
-            user_agent=self.config.user_agent,
-        )
+        # 未传入crawler时，调用期间持有一层共享浏览器（未打开时临时打开），并发的其他调用退出时不会关闭它
+        if crawler is None:
+            async with self:
+                return await self._crawl_list_page_with_crawler(self._crawler, url, page_num)
         
-        # 如果传入了crawler，直接使用；否则创建新的
-        if crawler is not None:
-            return await self._crawl_list_page_with_crawler(crawler, url, page_num)
+        return await self._crawl_list_page_with_crawler(crawler, url, page_num)
+    
+    async def crawl_list_pages_parallel(self, url: str, pages: range, max_concurrency: Optional[int] = None) -> List[str]:
+        """
+        并发爬取多个列表页（仅适用于URL参数分页）
         
-        async with AsyncWebCrawler(config=browser_config) as new_crawler:
-            return await self._crawl_list_page_with_crawler(new_crawler, url, page_num)
+        设计说明：
+        ----------
+        URL参数分页的各页互相独立，可以共用一个浏览器实例并发抓取，
+        用信号量限制同时打开的页面数。每页使用独立的session_id，避免并发请求
+        共用同一个浏览器标签页。AJAX分页依赖上一页的页面状态，仍按顺序逐页爬取。
+        
+        Args:
+            url: 列表页URL
+            pages: 页码范围，如 range(1, 6)
+            max_concurrency: 最大并发数，默认使用 self.max_concurrent
+            
+        Returns:
+            去重后的房产详情页URL列表（按页码顺序）
+        """
+        # 未打开共享浏览器时，临时打开一个供本次调用使用
+        if self._crawler is None:
+            async with self:
+                return await self.crawl_list_pages_parallel(url, pages, max_concurrency)
+        
+        crawler = self._crawler
+        if self.config.pagination_type != "url_param":
+            # AJAX分页：必须在同一会话中按顺序翻页
+            page_results = []
+            for page_num in pages:
+                page_results.append(await self._crawl_list_page_with_crawler(crawler, url, page_num))
+        else:
+            semaphore = asyncio.Semaphore(max_concurrency or self.max_concurrent)
+            base_session_id = self._get_list_session_id(url)
+            
+            async def crawl_with_limit(page_num: int) -> List[str]:
+                async with semaphore:
+                    try:
+                        return await self._crawl_list_page_with_crawler(
+                            crawler, url, page_num,
+                            session_id=f"{base_session_id}_p{page_num}",
+                        )
+                    except Exception as e:
+                        logger.error(f"  ✗ 爬取列表页 {page_num} 时出错: {str(e)}")
+                        return []
+            
+            page_results = await asyncio.gather(*(crawl_with_limit(page_num) for page_num in pages))
+        
+        # 按页码顺序合并并去重
+        return list(dict.fromkeys(u for page_urls in page_results for u in page_urls))
     
-    async def _crawl_list_page_with_crawler(self, crawler: AsyncWebCrawler, url: str, page_num: int) -> List[str]:
+    def _get_list_session_id(self, url: str) -> str:
+        """获取列表页URL对应的session_id（按URL缓存，同一列表的各页复用）"""
+        session_id = self._session_id_cache.get(url)
+        if session_id is None:
+            # 仅用作会话标识，不需要密码学强度，blake2b 比 md5 更快
+            session_id = f"28hse_list_{hashlib.blake2b(url.encode('utf-8'), digest_size=5).hexdigest()}"
+            self._session_id_cache[url] = session_id
+        return session_id
+    
+    async def _crawl_list_page_with_crawler(self, crawler: AsyncWebCrawler, url: str, page_num: int,
+                                            session_id: Optional[str] = None) -> List[str]:
         """
         使用指定的crawler实例爬取列表页（内部方法）
         
@@ -229,20 +986,27 @@ class Hse28Crawler:
             crawler: AsyncWebCrawler实例（必须在同一浏览器会话中）
             url: 列表页URL
             page_num: 页码
+            session_id: 可选的会话ID，默认按列表页URL生成（并发爬取时每页单独指定）
             
         Returns:
             房产详情页URL列表
         """
-        print(f"  正在爬取列表页 {page_num}...")
+        logger.info(f"  正在爬取列表页 {page_num}...")
         
         from crawl4ai.async_configs import CrawlerRunConfig
-        session_id = f"28hse_list_{hashlib.md5(url.encode('utf-8')).hexdigest()[:10]}"
+        if session_id is None:
+            session_id = self._get_list_session_id(url)
+        
+        # 预先计算本次调用中复用的超时和URL分隔符
+        timeout_s = max(self.config.timeout, 60)
+        long_timeout_s = max(self.config.timeout, 90)
+        url_has_query = "?" in url
+        separator = "&" if url_has_query else "?"
         
         # 尝试URL参数分页
         if self.config.pagination_type == "url_param" and self.config.pagination_param:
             if page_num > 1:
                 # 构建带页码的URL
-                separator = "&" if "?" in url else "?"
                 list_url = f"{url}{separator}{self.config.pagination_param}={page_num}"
             else:
                 list_url = url
@@ -314,42 +1078,46 @@ class Hse28Crawler:
             )
             
             try:
-                result = await crawler.arun(
-                    url=list_url,
+                result = await self._arun(
+                    list_url,
+                    crawler=crawler,
                     config=config,
-                    timeout=max(self.config.timeout, 60),
+                    timeout=timeout_s,
                     wait_for="networkidle",
                 )
             except Exception as e:
                 # 如果因为导航错误，尝试不使用js_code直接访问
-                print(f"  ⚠ 首次访问时出现错误（可能不影响功能）: {str(e)[:100]}")
+                logger.warning(f"  ⚠ 首次访问时出现错误（可能不影响功能）: {str(e)[:100]}")
                 # 重试不使用JavaScript
-                result = await crawler.arun(
-                    url=list_url,
+                result = await self._arun(
+                    list_url,
+                    crawler=crawler,
                     config=CrawlerRunConfig(
                         session_id=session_id,
                         delay_before_return_html=3,
                     ),
-                    timeout=max(self.config.timeout, 60),
+                    timeout=timeout_s,
                     wait_for="networkidle",
                 )
         else:
             # 对于后续页面，根据分页类型处理
             if self.config.pagination_type == "url_param":
                 # URL参数分页：直接访问新URL
-                result = await crawler.arun(
-                    url=list_url,
+                # 第1页已通过 simulate_user/magic 完成反爬检测并建立会话cookie，
+                # 后续页面不再模拟用户操作，节省每页的额外等待
+                result = await self._arun(
+                    list_url,
+                    crawler=crawler,
                     config=CrawlerRunConfig(
                         session_id=session_id,
                         delay_before_return_html=3,
-                        simulate_user=True,
                     ),
-                    timeout=max(self.config.timeout, 60),
+                    timeout=timeout_s,
                     wait_for="networkidle",
                 )
             else:
                 # AJAX分页：执行JavaScript点击分页按钮
-                print(f"    执行JavaScript点击第{page_num}页按钮...")
+                logger.info(f"    执行JavaScript点击第{page_num}页按钮...")
                 js_code = f"""
                 (async () => {{
                     try {{
@@ -460,147 +1228,90 @@ class Hse28Crawler:
                 }})();
                 """
                 
+                # delay_before_return_html 已等待点击后的内容加载完成，返回的HTML即为新一页，
+                # 不需要再额外调用一次 arun 重新获取
                 try:
-                    result = await crawler.arun(
-                        url=url,
+                    # 与其他请求一样经过 _arun：按域名限速，结果反馈给AIMD并发控制器
+                    result = await self._arun(
+                        url,
+                        crawler=crawler,
                         config=CrawlerRunConfig(
                             session_id=session_id,
                             js_code=js_code,
                             js_only=True,
                             delay_before_return_html=8,
-                            simulate_user=True,
                         ),
-                        timeout=max(self.config.timeout, 90),
+                        timeout=long_timeout_s,
                     )
                 except Exception as e:
-                    print(f"  ⚠ JavaScript分页执行时出现错误（可能不影响功能）: {str(e)[:100]}")
+                    logger.warning(f"  ⚠ JavaScript分页执行时出现错误（可能不影响功能）: {str(e)[:100]}")
                     # 如果JavaScript执行失败，尝试直接访问URL参数分页
                     if self.config.pagination_param:
-                        separator = "&" if "?" in url else "?"
                         fallback_url = f"{url}{separator}{self.config.pagination_param}={page_num}"
-                        result = await crawler.arun(
-                            url=fallback_url,
+                        result = await self._arun(
+                            fallback_url,
+                            crawler=crawler,
                             config=CrawlerRunConfig(
                                 session_id=session_id,
                                 delay_before_return_html=3,
                             ),
-                            timeout=max(self.config.timeout, 60),
+                            timeout=timeout_s,
                             wait_for="networkidle",
                         )
-                
-                # 重新获取HTML
-                if result and result.success:
-                    try:
-                        result = await crawler.arun(
-                            url=url,
-                            config=CrawlerRunConfig(
-                                session_id=session_id,
-                                js_only=True,
-                                delay_before_return_html=2,
-                            ),
-                            timeout=max(self.config.timeout, 60),
-                        )
-                    except Exception as e:
-                        # 如果重新获取失败，使用之前的结果
-                        print(f"  ⚠ 重新获取HTML时出现错误（使用之前的结果）: {str(e)[:100]}")
         
         if not result or not result.success:
-            print(f"  ✗ 无法访问列表页 {page_num}")
+            logger.error(f"  ✗ 无法访问列表页 {page_num}")
             return []
         
         # 提取房产详情页URL
         property_urls = []
+        # 本页已见过的URL（O(1)去重）。已爬取的详情页（包括从检查点恢复的）也要返回：
+        # crawl_all 以空列表判断是否到了最后一页，跳过已爬取URL的工作由 crawl_detail_page(s) 负责
+        seen_urls: set[str] = set()
+        list_page_addresses = {}
         
         try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(result.html, 'html.parser')
-            
-            # 无效URL模式（需要过滤的路径）
-            invalid_patterns = [
-                '/member/',
-                '/login',
-                '/register',
-                '/search',
-                '/about',
-                '/contact',
-                '/help',
-                '/terms',
-                '/privacy',
-                '/admin/',
-                '/api/',
-                'javascript:',
-                '#',
-                'mailto:',
-                'tel:',
-                # 排除非apartment类型
-                '/office/',
-                '/shop/',
-                '/parking/',
-                '/car-park/',
-                '/车位/',
-                '/商铺/',
-                '/写字楼/',
-                '/commercial/',
-                '/industrial/',
-            ]
-            
-            # 有效的房产详情页URL模式（只包含apartment相关）
-            valid_patterns = [
-                '/buy/apartment/',
-                '/rent/apartment/',
-                '/buy/apartment/property-',
-                '/rent/apartment/property-',
-                # 也接受简化的格式（如果URL是 /buy/apartment/property-xxx）
-                '/apartment/property-',
-            ]
+            # 有lxml时只用 iterparse 解析一次（后面的地址提取也在同一棵lxml树上进行），
+            # 无lxml时才构建 BeautifulSoup
+            if HAS_LXML:
+                root, link_elements = _parse_list_tree(result.html)
+                soup = None
+            else:
+                soup = BeautifulSoup(result.html, HTML_PARSER)
             
-            # 方法1: 使用CSS选择器查找链接（只查找apartment类型）
-            link_selectors = [
-                'a[href*="/buy/apartment/property-"]',
-                'a[href*="/rent/apartment/property-"]',
-                'a[href*="/apartment/property-"]',
-                'a[href*="/buy/apartment/"]',
-                'a[href*="/rent/apartment/"]',
-                'a.property-link',
-                'a.listing-link',
-            ]
+            # 方法1: 查找apartment类型的详情页链接
+            if HAS_LXML:
+                # lxml: 解析的同时收集全部候选链接
+                href_groups = [[link.get('href', '') for link in link_elements]]
+            else:
+                # 无lxml时逐个CSS选择器查找，找到即停止
+                link_selectors = [
+                    'a[href*="/buy/apartment/property-"]',
+                    'a[href*="/rent/apartment/property-"]',
+                    'a[href*="/apartment/property-"]',
+                    'a[href*="/buy/apartment/"]',
+                    'a[href*="/rent/apartment/"]',
+                    'a.property-link',
+                    'a.listing-link',
+                ]
+                href_groups = (
+                    [link.get('href', '') for link in soup.select(selector)]
+                    for selector in link_selectors
+                )
             
-            for selector in link_selectors:
-                links = soup.select(selector)
-                for link in links:
-                    href = link.get('href', '')
-                    if href:
-                        # 跳过无效URL
-                        if any(pattern in href.lower() for pattern in invalid_patterns):
+            for hrefs in href_groups:
+                for href in hrefs:
+                    # 已见过的URL在正则过滤前直接跳过
+                    if href and href not in seen_urls:
+                        # 一次正则判断：排除无效URL，只接受apartment类型的property详情页
+                        if not _ACCEPT_HREF_RE.search(href):
                             continue
                         
-                        # 确保URL包含apartment且是property详情页
-                        href_lower = href.lower()
-                        if '/apartment/' not in href_lower:
-                            continue
-                        
-                        # 确保是property详情页（包含property-）
-                        if 'property-' not in href_lower:
-                            continue
-                        
-                        # 确保是有效的房产详情页URL
-                        if not any(pattern in href_lower for pattern in valid_patterns):
-                            # 如果不在有效模式中，检查是否是相对路径且看起来像房产URL
-                            if href.startswith('/') and '/apartment/property-' in href_lower:
-                                # 这是apartment property URL，接受
-                                pass
-                            else:
-                                continue
-                        
                         if not href.startswith('http'):
                             href = urljoin(self.config.base_url, href)
                         
-                        # 最终验证：确保URL包含apartment和property-，且不包含无效模式
-                        href_lower = href.lower()
-                        if ('/apartment/' in href_lower and 
-                            'property-' in href_lower and
-                            not any(pattern in href_lower for pattern in invalid_patterns) and
-                            href not in property_urls):
+                        if href not in seen_urls:
+                            seen_urls.add(href)
                             property_urls.append(href)
                 
                 if property_urls:
@@ -609,190 +1320,144 @@ class Hse28Crawler:
             # 从列表页提取地址信息（用于补充详情页的address字段）
             # 列表页格式通常为: "地区 屋苑名称 | 座数 楼层 室号"
             # 例如: "荔枝角 宇晴軒 | 7座 中層 E室"
-            list_page_addresses = {}
-            if soup:
+            if HAS_LXML or soup:
                 # 查找包含房产信息的文本块
                 # 尝试多种选择器来定位房产列表项
-                property_item_selectors = [
-                    '.property-item',
-                    '.listing-item',
-                    '.house-item',
-                    '[class*="property"]',
-                    '[class*="listing"]',
-                    '[class*="house"]',
-                ]
-                
-                for item_selector in property_item_selectors:
-                    items = soup.select(item_selector)
-                    for item in items:
-                        # 查找链接
+                if HAS_LXML:
+                    items = _LIST_ITEM_XPATH(root)
+                else:
+                    property_item_selectors = [
+                        '.property-item',
+                        '.listing-item',
+                        '.house-item',
+                        '[class*="property"]',
+                        '[class*="listing"]',
+                        '[class*="house"]',
+                    ]
+                    
+                    # 合并为一个选择器，只遍历一次DOM（结果按文档顺序）
+                    items = soup.select(', '.join(property_item_selectors))
+                for item in items:
+                    # 查找链接
+                    if HAS_LXML:
+                        links = _ITEM_LINK_XPATH(item)
+                        link_elem = links[0] if links else None
+                    else:
                         link_elem = item.find('a', href=True)
-                        if link_elem:
-                            href = link_elem.get('href', '')
-                            if href and '/apartment/property-' in href.lower():
-                                if not href.startswith('http'):
-                                    href = urljoin(self.config.base_url, href)
-                                
-                                # 提取文本内容，可能包含地址信息
+                    if link_elem is not None:
+                        href = link_elem.get('href', '')
+                        if href and _APT_PROPERTY_RE.search(href):
+                            if not href.startswith('http'):
+                                href = urljoin(self.config.base_url, href)
+                            
+                            # 提取文本内容，可能包含地址信息
+                            if HAS_LXML:
+                                item_text = ' '.join(t.strip() for t in _ELEMENT_TEXT_XPATH(item) if t.strip())
+                            else:
                                 item_text = item.get_text(separator=' ', strip=True)
-                                
-                                # 尝试从文本中提取地址模式
-                                # 格式: "地区 屋苑名称 | ..." 或 "地区 屋苑名称"
-                                address_patterns = [
-                                    r'([^\s|]+)\s+([^\s|]+(?:\s+[^\s|]+)?)\s*\|',  # "地区 屋苑名称 |"
-                                    r'([^\s|]+)\s+([^\s|]+(?:\s+[^\s|]+)?)(?:\s*\|)?',  # "地区 屋苑名称"
-                                ]
-                                
-                                for pattern in address_patterns:
-                                    try:
-                                        match = re.search(pattern, item_text)
-                                        if match:
-                                            district_part = match.group(1).strip()
-                                            estate_part = match.group(2).strip()
-                                            
-                                            # 构建地址字符串
-                                            if district_part and estate_part:
-                                                address_text = f"{district_part} {estate_part}"
-                                                list_page_addresses[href] = address_text
-                                                break
-                                    except re.error:
-                                        continue
-                        
-                        if list_page_addresses:
-                            break
+                            
+                            # 尝试从文本中提取地址模式
+                            # 格式: "地区 屋苑名称 | ..." 或 "地区 屋苑名称"
+                            for pattern in _ITEM_ADDRESS_PATTERNS:
+                                match = pattern.search(item_text)
+                                if match:
+                                    district_part = match.group(1).strip()
+                                    estate_part = match.group(2).strip()
+                                    
+                                    # 构建地址字符串
+                                    if district_part and estate_part:
+                                        address_text = f"{district_part} {estate_part}"
+                                        list_page_addresses[href] = address_text
+                                        break
                     
                     if list_page_addresses:
                         break
                 
-                # 如果上面的方法没找到，尝试从所有链接的父元素中提取
+                # 如果上面的方法没找到，尝试从链接附近的文本中提取
                 if not list_page_addresses:
-                    for link in soup.find_all('a', href=True):
-                        href = link.get('href', '')
-                        if href and '/apartment/property-' in href.lower():
+                    if HAS_LXML:
+                        # lxml: 直接定位链接所在的列表项容器，只取一次文本
+                        for link in link_elements:
+                            href = link.get('href', '')
                             if not href.startswith('http'):
                                 href = urljoin(self.config.base_url, href)
+                            if href in list_page_addresses:
+                                continue
                             
-                            # 查找链接附近的文本（向上查找父元素）
-                            current = link
-                            for _ in range(3):  # 最多向上查找3层
-                                if current and current.parent:
-                                    current = current.parent
-                                    parent_text = current.get_text(separator=' ', strip=True)
-                                    
-                                    # 提取地址模式：格式通常是 "地区 屋苑名称 | ..."
-                                    # 例如: "荔枝角 宇晴軒 | 7座 中層 E室"
-                                    address_patterns = [
-                                        r'([^\s|]{2,15})\s+([^\s|]{2,20})\s*\|',  # "地区 屋苑名称 |"
-                                        r'([^\s|]{2,15})\s+([^\s|]{2,20})(?:\s*\|)?',  # "地区 屋苑名称"
-                                    ]
-                                    
-                                    for pattern in address_patterns:
-                                        try:
-                                            match = re.search(pattern, parent_text)
-                                            if match:
-                                                district_part = match.group(1).strip()
-                                                estate_part = match.group(2).strip()
-                                                
-                                                # 验证提取的内容是否合理
-                                                invalid_keywords = ['售', '租', '萬元', '呎', '房', '浴室', '座', '層', '室', 
-                                                                  '建築', '實用', '面積', '元', '售盤', '租盤', '樓盤']
-                                                if (district_part and estate_part and 
-                                                    len(district_part) > 1 and len(estate_part) > 1 and
-                                                    not any(kw in district_part for kw in invalid_keywords) and
-                                                    not any(kw in estate_part for kw in invalid_keywords)):
-                                                    address_text = f"{district_part} {estate_part}"
-                                                    if href not in list_page_addresses:
-                                                        list_page_addresses[href] = address_text
-                                                    break
-                                        except re.error:
-                                            continue
-                                    
-                                    if href in list_page_addresses:
-                                        break
+                            # 没有可识别的容器时，退回到最多向上3层父元素
+                            containers = (_ADDR_CONTAINER_XPATH(link)
+                                          or list(islice(link.iterancestors(), 3)))
+                            for container in containers:
+                                container_text = ' '.join(
+                                    t.strip() for t in container.itertext() if t.strip()
+                                )
+                                address_text = self._extract_list_address(container_text)
+                                if address_text:
+                                    list_page_addresses[href] = address_text
+                                    break
+                    else:
+                        for link in soup.find_all('a', href=True):
+                            href = link.get('href', '')
+                            if href and _APT_PROPERTY_RE.search(href):
+                                if not href.startswith('http'):
+                                    href = urljoin(self.config.base_url, href)
+                                
+                                # 查找链接附近的文本（向上查找父元素）
+                                current = link
+                                for _ in range(3):  # 最多向上查找3层
+                                    if current and current.parent:
+                                        current = current.parent
+                                        parent_text = current.get_text(separator=' ', strip=True)
+                                        address_text = self._extract_list_address(parent_text)
+                                        if address_text:
+                                            if href not in list_page_addresses:
+                                                list_page_addresses[href] = address_text
+                                            break
             
             # 方法2: 从所有链接中查找（如果方法1没找到，只查找apartment类型）
             if not property_urls:
-                all_links = soup.find_all('a', href=True)
-                for link in all_links:
-                    href = link.get('href', '')
+                if HAS_LXML:
+                    all_hrefs = (a.get('href') for a in root.iter('a') if a.get('href') is not None)
+                else:
+                    all_hrefs = (link.get('href', '') for link in soup.find_all('a', href=True))
+                for href in all_hrefs:
                     if href:
                         if not href.startswith('http'):
                             href = urljoin(self.config.base_url, href)
                         
-                        href_lower = href.lower()
-                        # 检查是否是28hse.com的URL
-                        if self.config.domain in href_lower:
-                            # 确保是apartment类型的property详情页
-                            if ('/apartment/' in href_lower and 
-                                'property-' in href_lower and
-                                not any(pattern in href_lower for pattern in invalid_patterns)):
-                                if href not in property_urls:
-                                    property_urls.append(href)
-            
-            # 方法2: 从JavaScript数据中提取（如果网站使用SPA）
-            if not property_urls:
-                # 尝试从window对象中提取URL
-                js_extract_code = """
-                (() => {
-                    const urls = [];
-                    const seen = new Set();
-                    
-                    function extractUrls(obj, depth) {
-                        if (depth > 10 || !obj) return;
-                        if (typeof obj === 'string') {
-                            const patterns = ['/property/', '/listing/', '/house/', '/unit/'];
-                            for (const pattern of patterns) {
-                                if (obj.includes(pattern)) {
-                                    if (!seen.has(obj)) {
-                                        seen.add(obj);
-                                        urls.push(obj);
-                                    }
-                                }
-                            }
-                        } else if (typeof obj === 'object') {
-                            for (const key in obj) {
-                                extractUrls(obj[key], depth + 1);
-                            }
-                        }
-                    }
-                    
-                    try {
-                        extractUrls(window, 0);
-                    } catch(e) {}
-                    
-                    return JSON.stringify(urls.slice(0, 500));
-                })();
-                """
-                
-                # 这里可以添加JavaScript提取逻辑
-                # 由于需要执行JavaScript，暂时跳过
+                        if href in seen_urls:
+                            continue
+                        
+                        # 检查是否是28hse.com的URL，且是apartment类型的property详情页
+                        if self._domain_re.search(href) and _ACCEPT_HREF_RE.search(href):
+                            seen_urls.add(href)
+                            property_urls.append(href)
                 
         except Exception as e:
-            print(f"  ⚠ 提取URL时出错: {str(e)}")
+            logger.warning(f"  ⚠ 提取URL时出错: {str(e)}")
         
-        # 去重
-        property_urls = list(set(property_urls))
-        
-        # 将列表页提取的地址信息存储到实例变量中
+        # 将列表页提取的地址信息存储到实例变量中（property_urls 已通过 seen_urls 去重）
+        accepted_urls = set(property_urls)
         for url, address in list_page_addresses.items():
-            if url in property_urls:
+            if url in accepted_urls:
                 self._list_page_addresses[url] = address
         
         if property_urls:
-            print(f"  ✓ 列表页 {page_num}: 找到 {len(property_urls)} 个唯一房产URL")
+            logger.info(f"  ✓ 列表页 {page_num}: 找到 {len(property_urls)} 个唯一房产URL")
             if list_page_addresses:
-                print(f"  ✓ 列表页 {page_num}: 提取了 {len(list_page_addresses)} 个地址信息")
+                logger.info(f"  ✓ 列表页 {page_num}: 提取了 {len(list_page_addresses)} 个地址信息")
         else:
-            print(f"  ⚠ 列表页 {page_num}: 没有找到房产URL")
+            logger.warning(f"  ⚠ 列表页 {page_num}: 没有找到房产URL")
         
         return property_urls
     
-    async def crawl_detail_page(self, url: str) -> Optional[PropertyData]:
+    async def crawl_detail_page(self, url: str, crawler: Optional[AsyncWebCrawler] = None) -> Optional[PropertyData]:
         """
         爬取房产详情页
         
         Args:
             url: 详情页URL
+            crawler: 可选的AsyncWebCrawler实例，默认使用共享浏览器（批量爬取时所有详情页共用一个浏览器）
             
         Returns:
             PropertyData 对象或 None
@@ -801,45 +1466,181 @@ class Hse28Crawler:
         if not url or not url.startswith('http'):
             return None
         
-        # 检查是否已爬取
-        if url in self.crawled_urls:
+        # 检查是否已爬取（包括增量模式下之前运行中已爬取的）
+        if url in self.crawled_urls or self._in_crawl_history(url):
             return None
         
-        self.crawled_urls.add(url)
+        # 未传入crawler时，调用期间持有一层共享浏览器（未打开时临时打开），并发的其他调用退出时不会关闭它
+        if crawler is None:
+            async with self:
+                return await self.crawl_detail_page(url, crawler=self._crawler)
         
-        browser_config = BrowserConfig(
-            headless=True,
-            user_agent=self.config.user_agent,
-        )
+        self.crawled_urls.add(url)
         
         try:
-            async with AsyncWebCrawler(config=browser_config) as crawler:
-                result = await crawler.arun(
-                    url=url,
-                    timeout=self.config.timeout,
-                    wait_for="networkidle",
-                )
-                
-                if not result or not result.success:
-                    print(f"  ✗ 无法访问: {url[:80]}...")
-                    self.failed_urls.append(url)
-                    return None
-                
-                # 解析详情页
-                property_data = self._parse_detail_page(result.html, url)
+            # 优先使用传入的或共享的浏览器实例，避免每个URL都启动一次浏览器
+            result = await self._arun(
+                url,
+                crawler=crawler,
+                timeout=self.config.timeout,
+                wait_for="networkidle",
+            )
+            
+            return await self._handle_detail_result(url, result)
                 
-                if property_data:
-                    self.properties.append(property_data)
-                    return property_data
-                else:
-                    self.failed_urls.append(url)
-                    return None
-                    
         except Exception as e:
-            print(f"  ✗ 爬取失败: {url[:80]}... 错误: {str(e)}")
-            self.failed_urls.append(url)
+            logger.error(f"  ✗ 爬取失败: {url[:80]}... 错误: {str(e)}")
+            self._record_failed(url)
+            return None
+    
+    async def _handle_detail_result(self, url: str, result) -> Optional[PropertyData]:
+        """解析一个详情页抓取结果，并记录成功/失败的URL"""
+        if not result or not result.success:
+            logger.error(f"  ✗ 无法访问: {url[:80]}...")
+            self._record_failed(url)
+            return None
+        
+        # 解析详情页（有进程池时在子进程中解析）
+        if self._parse_pool is not None:
+            property_data = await asyncio.get_running_loop().run_in_executor(
+                self._parse_pool,
+                _parse_detail_page_worker,
+                result.html,
+                url,
+                self._list_page_addresses.get(url),
+            )
+        else:
+            property_data = self._parse_detail_page(result.html, url)
+        
+        if property_data:
+            self._intern_fields(property_data)
+            self.properties.append(property_data)
+            self._write_checkpoint(property_data)
+            self._record_crawled(url)
+            return property_data
+        else:
+            self._record_failed(url)
             return None
     
+    async def crawl_detail_pages(self, urls: List[str], crawler: Optional[AsyncWebCrawler] = None) -> list:
+        """
+        批量爬取详情页
+        
+        设计说明：
+        ----------
+        使用 crawl4ai 的 arun_many 分批提交URL，由同一个浏览器调度并发导航。
+        并发数由AIMD控制器根据请求结果自适应调整：每批的 SemaphoreDispatcher 并发数取控制器当前允许的值，
+        批大小为其 AIMD_BATCH_ROUNDS 倍，批内每个结果都反馈给控制器，下一批按调整后的并发数提交。
+        结果以流的方式（stream=True）逐个返回，每个详情页抓取完成即解析并写入检查点。
+        旧版 crawl4ai 没有 arun_many / dispatcher 时，回退为 asyncio.gather
+        逐个调用 crawl_detail_page，同样由AIMD控制器限制并发。
+        
+        Args:
+            urls: 详情页URL列表
+            crawler: 可选的AsyncWebCrawler实例，默认使用共享浏览器
+            
+        Returns:
+            与 urls 对应的结果列表（PropertyData、None 或异常）
+        """
+        # 未传入crawler时，整批爬取期间持有一层共享浏览器（未打开时临时打开）
+        if crawler is None:
+            async with self:
+                return await self.crawl_detail_pages(urls, crawler=self._crawler)
+        total_count = len(urls)
+        
+        try:
+            from crawl4ai.async_configs import CrawlerRunConfig
+            from crawl4ai.async_dispatcher import SemaphoreDispatcher, RateLimiter
+            use_arun_many = crawler is not None and hasattr(crawler, 'arun_many')
+        except ImportError:
+            use_arun_many = False
+        
+        if not use_arun_many:
+            completed_count = 0
+            # 进度最多输出约10行，URL很多时不会刷屏
+            progress_step = max(10, total_count // 10)
+            
+            async def crawl_with_limit(url):
+                nonlocal completed_count
+                async with self._aimd:
+                    result = await self.crawl_detail_page(url, crawler=crawler)
+                    completed_count += 1
+                    if completed_count % progress_step == 0 or completed_count == total_count:
+                        logger.info(f"  进度: {completed_count}/{total_count} ({completed_count*100//total_count}%)")
+                    return result
+            
+            return await asyncio.gather(*(crawl_with_limit(url) for url in urls), return_exceptions=True)
+        
+        # 与 crawl_detail_page 相同：跳过无效、已爬取和增量历史中的URL
+        pending_urls = []
+        for url in urls:
+            if not url or not url.startswith('http'):
+                continue
+            if url in self.crawled_urls or self._in_crawl_history(url):
+                continue
+            self.crawled_urls.add(url)
+            pending_urls.append(url)
+        
+        pending_set = set(pending_urls)
+        
+        async def handle_result(url, result):
+            try:
+                return await self._handle_detail_result(url, result)
+            except Exception as e:
+                logger.error(f"  ✗ 解析失败: {url[:80]}... 错误: {str(e)}")
+                self._record_failed(url)
+                return e
+        
+        # 每个详情页抓取完成就立即解析并写入检查点（各详情页的解析可在进程池中并行执行），
+        # 不必等整批抓取结束：中途崩溃时已完成的详情页可以从检查点恢复
+        handled = {}
+        run_config = CrawlerRunConfig(
+            page_timeout=self.config.timeout * 1000,
+            wait_until="networkidle",
+            stream=True,
+        )
+        # crawl4ai 的 RateLimiter：按域名限速，遇到429/5xx时指数退避重试（各批共用，保留退避状态）
+        rate_limiter = RateLimiter(
+            base_delay=(self.config.rate_limit, self.config.rate_limit + 0.5),
+            max_delay=32,
+            max_retries=self.max_retries - 1,
+            rate_limit_codes=sorted(_RETRY_STATUS_CODES),
+        )
+        pos = 0
+        while pos < len(pending_urls):
+            concurrency = self._aimd.target
+            batch = pending_urls[pos:pos + concurrency * self.AIMD_BATCH_ROUNDS]
+            pos += len(batch)
+            try:
+                crawl_results = await crawler.arun_many(
+                    urls=batch,
+                    config=run_config,
+                    dispatcher=SemaphoreDispatcher(semaphore_count=concurrency, rate_limiter=rate_limiter),
+                )
+                async for result in crawl_results:
+                    if result is None or result.url not in pending_set or result.url in handled:
+                        continue
+                    await self._aimd.record(not _is_overloaded(result))
+                    handled[result.url] = asyncio.ensure_future(handle_result(result.url, result))
+            except Exception as e:
+                logger.error(f"  ✗ 批量爬取失败: {str(e)[:100]}")
+                await self._aimd.record(False)
+        
+        if handled:
+            await asyncio.gather(*handled.values())
+        results = []
+        for url in urls:
+            task = handled.get(url)
+            if task is not None:
+                results.append(task.result())
+            else:
+                if url in pending_set:
+                    self._record_failed(url)
+                results.append(None)
+        
+        logger.info(f"  进度: {total_count}/{total_count} (100%)")
+        return results
+    
     def _parse_detail_page(self, html: str, url: str) -> Optional[PropertyData]:
         """
         解析详情页HTML，提取房产数据
@@ -860,26 +1661,28 @@ class Hse28Crawler:
         Returns:
             PropertyData对象，如果解析失败则返回None
         """
-        try:
-            from bs4 import BeautifulSoup
-        except ImportError:
-            print("  ⚠ BeautifulSoup 未安装，无法解析详情页")
-            return None
-        
-        # 使用更宽松的解析器，避免HTML格式错误导致解析失败
-        try:
-            soup = BeautifulSoup(html, 'html.parser')
-        except Exception as e:
-            # 如果html.parser失败，尝试lxml（如果可用）
+        # 安装了lxml时直接构建lxml树，一次遍历收集所有字段选择器的匹配元素，
+        # 不再对每个选择器分别调用 soup.select_one 扫描整棵树
+        tree = None
+        soup = None
+        if HAS_LXML:
             try:
-                soup = BeautifulSoup(html, 'lxml')
-            except:
-                # 如果都失败，尝试html5lib（如果可用）
+                tree = lxml_html.document_fromstring(html)
+            except Exception as e:
+                logger.warning(f"  ⚠ lxml解析失败，改用BeautifulSoup: {str(e)[:100]}")
+        
+        if tree is None:
+            # 优先使用lxml（C实现，速度快得多），失败时依次回退到 html.parser、html5lib
+            # html 已是解码后的str，BeautifulSoup 不会再做编码探测，因此无需传 from_encoding
+            for parser in dict.fromkeys((HTML_PARSER, 'html.parser', 'html5lib')):
                 try:
-                    soup = BeautifulSoup(html, 'html5lib')
-                except Exception as e2:
-                    print(f"  ✗ 无法解析HTML: {str(e2)}")
-                    return None
+                    soup = BeautifulSoup(html, parser)
+                    break
+                except Exception as e:
+                    parse_error = e
+            if soup is None:
+                logger.error(f"  ✗ 无法解析HTML: {str(parse_error)}")
+                return None
         
         # 初始化所有变量
         title = None
@@ -907,7 +1710,8 @@ class Hse28Crawler:
         street = None
         
         # 从URL提取property_id
-        property_id = hashlib.md5(url.encode('utf-8')).hexdigest()[:16]
+        # 仅用作去重键，blake2b 直接输出8字节摘要（16位十六进制），比 md5 再截断更快
+        property_id = hashlib.blake2b(url.encode('utf-8'), digest_size=8).hexdigest()
         
         # 从URL提取category和estate_name（备用方法）
         url_path = urlparse(url).path
@@ -926,46 +1730,45 @@ class Hse28Crawler:
             # 所以这里不设置estate_name，让它从breadcrumb中提取
         
         # ========================================================================
-        # 方法1: 从页面文本中提取面包屑模式（通过正则表达式）
+        # 页面文本和各字段的候选元素（价格、面积、楼层等在后面从中提取）
         # ========================================================================
-        page_text = soup.get_text(separator=' ') if soup else ""
-        breadcrumb_patterns = [
-            r'主頁\s+買樓\s+([^\s]+)\s+([^\s]+)\s+([^\s]+)',
-            r'主頁\s+租樓\s+([^\s]+)\s+([^\s]+)\s+([^\s]+)',
-            r'主頁\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)',
-        ]
-        
-        breadcrumb_match = None
-        for pattern in breadcrumb_patterns:
-            try:
-                match = re.search(pattern, page_text)
-                if match:
-                    breadcrumb_match = match
-                    break
-            except re.error as e:
-                print(f"  ⚠ 面包屑正则表达式错误: {pattern} - {str(e)}")
-                continue
+        if tree is not None:
+            page_text = ' '.join(_PAGE_TEXT_XPATH(tree))
+            # 各字段按选择器优先级排列的匹配元素（一次遍历得到）
+            selected = _select_detail_elements(_DETAIL_CANDIDATES_XPATH(tree), _DETAIL_MATCHERS)
+            get_text = _lxml_text
+        else:
+            page_text = soup.get_text(separator=' ')
+            # 合并的选择器一次取出所有候选元素，再按各字段的选择器优先级分配
+            selected = _select_detail_elements(soup.select(_DETAIL_CANDIDATES_SELECTOR), _SOUP_DETAIL_MATCHERS)
+            get_text = lambda elem: elem.get_text(strip=True)
+        
+        # 房产详情区域的文本：价格、月供、面积、房型、楼层先在这段较短的文本中匹配，
+        # 也避免匹配到导航栏、页脚等处的数字；没有详情区域或区域内无匹配时再扫描整页文本
+        if tree is not None:
+            detail_sections = _DETAIL_SECTION_XPATH(tree)
+            detail_text = ' '.join(_ELEMENT_TEXT_XPATH(detail_sections[0])) if detail_sections else None
+        else:
+            detail_section = soup.select_one(_DETAIL_SECTION_SELECTOR)
+            detail_text = detail_section.get_text(separator=' ') if detail_section else None
+        
+        def search_detail_text(rx):
+            return (detail_text and rx.search(detail_text)) or rx.search(page_text)
         
         # ========================================================================
-        # 方法2: 从HTML面包屑导航元素中提取
+        # 面包屑导航：从HTML面包屑导航元素中提取字段
         # ========================================================================
         breadcrumb_items = []
-        breadcrumb_selectors = [
-            '.breadcrumb',
-            '.breadcrumbs',
-            '.nav-breadcrumb',
-            '[class*="breadcrumb"]',
-            'nav[aria-label*="breadcrumb"]',
-        ]
-        
-        for selector in breadcrumb_selectors:
-            breadcrumb_elem = soup.select_one(selector)
-            if breadcrumb_elem:
-                links = breadcrumb_elem.find_all('a', href=True)
-                for link in links:
-                    text = link.get_text(strip=True)
-                    if text and text not in ['主頁', 'Home', '首页']:
-                        breadcrumb_items.append(text)
+        for breadcrumb_elem in selected['breadcrumb']:
+            if breadcrumb_elem is not None:
+                if tree is not None:
+                    links = _LINKS_XPATH(breadcrumb_elem)
+                else:
+                    links = breadcrumb_elem.find_all('a', href=True)
+                breadcrumb_items = [
+                    text for text in map(get_text, links)
+                    if text and text not in _HOME_TOKENS
+                ]
                 if breadcrumb_items:
                     break
         
@@ -998,35 +1801,21 @@ class Hse28Crawler:
         # ========================================================================
         # 提取标题
         # ========================================================================
-        title_selectors = [
-            'h1.property-title',
-            'h1.title',
-            'h1',
-            '.property-title',
-            '.title',
-            'title',
-        ]
-        
-        for selector in title_selectors:
-            elem = soup.select_one(selector)
-            if elem:
-                title = elem.get_text(strip=True)
-                if title and len(title) > 3:
-                    break
+        title = _first_text(selected['title'], get_text, min_len=3)
         
         # 如果还没有标题，从页面title标签提取
         if not title or len(title) < 3:
-            title_tag = soup.find('title')
-            if title_tag:
-                title = title_tag.get_text(strip=True)
+            title_tag = tree.find('.//title') if tree is not None else soup.find('title')
+            if title_tag is not None:
+                title = get_text(title_tag)
         
         # 从标题中提取 estate_name（如果还没有）
         # 标题格式通常是: "青華苑 #3688300 售盤樓盤詳細資料"
         if title and not estate_name:
             # 移除 # 后面的内容
-            title_clean = re.sub(r'\s*#\d+.*', '', title)
+            title_clean = _TITLE_ID_SUFFIX_RE.sub('', title)
             # 移除 "售盤樓盤詳細資料"、"租盤樓盤詳細資料" 等后缀
-            title_clean = re.sub(r'\s*(售盤|租盤|樓盤|詳細資料).*', '', title_clean)
+            title_clean = _TITLE_LISTING_SUFFIX_RE.sub('', title_clean)
             title_clean = title_clean.strip()
             if title_clean and len(title_clean) > 1:
                 estate_name = title_clean
@@ -1037,239 +1826,133 @@ class Hse28Crawler:
         # ========================================================================
         # 提取价格
         # ========================================================================
-        price_selectors = [
-            '.price',
-            '.property-price',
-            '.house-price',
-            '[class*="price"]',
-        ]
-        
-        for selector in price_selectors:
-            elem = soup.select_one(selector)
-            if elem:
-                price_text = elem.get_text(strip=True)
-                if price_text:
-                    # 提取数字
-                    price_match = re.search(r'[\d,]+', price_text.replace(',', ''))
-                    if price_match:
-                        try:
-                            price_value = float(price_match.group().replace(',', ''))
-                            # 如果包含"萬"或"万"，转换为港币
-                            if '萬' in price_text or '万' in price_text:
-                                price_value = price_value * 10000
-                        except ValueError:
-                            pass
-                    break
+        price_text = _first_text(selected['price'], get_text)
+        if price_text:
+            # 提取数字
+            price_match = _PRICE_NUMBER_RE.search(price_text.replace(',', ''))
+            if price_match:
+                try:
+                    price_value = float(price_match.group().replace(',', ''))
+                    # 如果包含"萬"或"万"，转换为港币
+                    if '萬' in price_text or '万' in price_text:
+                        price_value = price_value * 10000
+                except ValueError:
+                    pass
         
         # 从页面文本中提取价格（备用方法）
         if not price_text:
-            price_patterns = [
-                r'[\$HK\$]?\s*[\d,]+萬?',
-                r'[\d,]+万',
-                r'[\d,]+萬',
-                r'HK\$\s*[\d,]+',
-            ]
-            for pattern in price_patterns:
-                try:
-                    matches = re.findall(pattern, page_text)
-                    if matches:
-                        price_text = matches[0]
-                        price_match = re.search(r'[\d,]+', price_text.replace(',', ''))
-                        if price_match:
-                            try:
-                                price_value = float(price_match.group().replace(',', ''))
-                                if '萬' in price_text or '万' in price_text:
-                                    price_value = price_value * 10000
-                            except ValueError:
-                                pass
-                        break
-                except re.error as e:
-                    # 如果正则表达式有错误，跳过这个模式
-                    print(f"  ⚠ 价格正则表达式错误: {pattern} - {str(e)}")
-                    continue
+            match = search_detail_text(_PRICE_TEXT_RE)
+            if match:
+                price_text = match.group()
+                price_match = _PRICE_NUMBER_RE.search(price_text.replace(',', ''))
+                if price_match:
+                    try:
+                        price_value = float(price_match.group().replace(',', ''))
+                        if '萬' in price_text or '万' in price_text:
+                            price_value = price_value * 10000
+                    except ValueError:
+                        pass
         
         # ========================================================================
         # 提取月供
         # ========================================================================
-        monthly_patterns = [
-            r'月供[：:]\s*[\$HK\$]?([\d,]+)',
-            r'每月[：:]\s*[\$HK\$]?([\d,]+)',
-            r'\$([\d,]+)\s*月供',
-        ]
-        for pattern in monthly_patterns:
-            try:
-                match = re.search(pattern, page_text)
-                if match:
-                    monthly_mortgage_payment = f"${match.group(1)}"
-                    break
-            except re.error as e:
-                print(f"  ⚠ 月供正则表达式错误: {pattern} - {str(e)}")
-                continue
+        match = None
+        if '月供' in page_text or '每月' in page_text:
+            match = search_detail_text(_MONTHLY_RE)
+        if match:
+            monthly_mortgage_payment = f"${match.group(match.lastgroup)}"
         
         # ========================================================================
         # 提取面积
         # ========================================================================
-        area_selectors = [
-            '.area',
-            '.property-area',
-            '.house-area',
-            '[class*="area"]',
-        ]
-        
-        for selector in area_selectors:
-            elem = soup.select_one(selector)
-            if elem:
-                area_text = elem.get_text(strip=True)
-                if area_text:
-                    # 提取数字
-                    area_match = re.search(r'[\d.]+', area_text)
-                    if area_match:
-                        try:
-                            area_value = float(area_match.group())
-                        except ValueError:
-                            pass
-                    break
+        area_text = _first_text(selected['area'], get_text)
+        if area_text:
+            # 提取数字
+            area_match = _AREA_NUMBER_RE.search(area_text)
+            if area_match:
+                try:
+                    area_value = float(area_match.group())
+                except ValueError:
+                    pass
         
         # 从页面文本中提取面积（备用方法）
         if not area_text:
-            area_patterns = [
-                r'[\d.]+?\s*呎',
-                r'[\d.]+?\s*平方呎',
-                r'[\d.]+?\s*sqft',
-            ]
-            for pattern in area_patterns:
-                try:
-                    matches = re.findall(pattern, page_text, re.IGNORECASE)
-                    if matches:
-                        area_text = matches[0]
-                        area_match = re.search(r'[\d.]+', area_text)
-                        if area_match:
-                            try:
-                                area_value = float(area_match.group())
-                            except ValueError:
-                                pass
-                        break
-                except re.error as e:
-                    # 如果正则表达式有错误，跳过这个模式
-                    print(f"  ⚠ 面积正则表达式错误: {pattern} - {str(e)}")
-                    continue
+            match = search_detail_text(_AREA_TEXT_RE)
+            if match:
+                area_text = match.group()
+                area_match = _AREA_NUMBER_RE.search(area_text)
+                if area_match:
+                    try:
+                        area_value = float(area_match.group())
+                    except ValueError:
+                        pass
         
         # ========================================================================
         # 提取位置信息
         # ========================================================================
-        location_selectors = [
-            '.location',
-            '.address',
-            '.property-location',
-            '[class*="location"]',
-            '[class*="address"]',
-        ]
-        
-        for selector in location_selectors:
-            elem = soup.select_one(selector)
-            if elem:
-                location = elem.get_text(strip=True)
-                if location:
-                    break
+        location = _first_text(selected['location'], get_text)
         
         # ========================================================================
         # 提取房产属性
         # ========================================================================
         # 房型
-        property_type_patterns = [
-            r'(\d+)\s*房',
-            r'(\d+)\s*bedroom',
-        ]
-        for pattern in property_type_patterns:
+        match = search_detail_text(_PROPERTY_TYPE_RE)
+        if match:
+            rooms = match.group(match.lastgroup)
+            property_type = f"{rooms}房"
             try:
-                match = re.search(pattern, page_text, re.IGNORECASE)
-                if match:
-                    property_type = f"{match.group(1)}房"
-                    try:
-                        bedrooms = int(match.group(1))
-                    except ValueError:
-                        pass
-                    break
-            except re.error as e:
-                print(f"  ⚠ 房型正则表达式错误: {pattern} - {str(e)}")
-                continue
+                bedrooms = int(rooms)
+            except ValueError:
+                pass
         
         # 楼层
-        floor_patterns = [
-            r'(\d+)\s*樓',
-            r'(\d+)\s*層',
-            r'floor\s*(\d+)',
-        ]
-        for pattern in floor_patterns:
-            try:
-                match = re.search(pattern, page_text, re.IGNORECASE)
-                if match:
-                    floor = match.group(1)
-                    break
-            except re.error as e:
-                print(f"  ⚠ 楼层正则表达式错误: {pattern} - {str(e)}")
-                continue
+        match = None
+        if '樓' in page_text or '層' in page_text or _FLOOR_WORD_RE.search(page_text):
+            match = search_detail_text(_FLOOR_RE)
+        if match:
+            floor = match.group(match.lastgroup)
         
         # ========================================================================
         # 提取描述
         # ========================================================================
-        desc_selectors = [
-            '.description',
-            '.property-description',
-            '[class*="description"]',
-        ]
-        
-        for selector in desc_selectors:
-            elem = soup.select_one(selector)
-            if elem:
-                description = elem.get_text(strip=True)
-                if description and len(description) > 10:
-                    break
+        description = _first_text(selected['description'], get_text, min_len=10)
         
         # ========================================================================
         # 提取图片
         # ========================================================================
-        img_selectors = [
-            '.property-images img',
-            '.gallery img',
-            '[class*="image"] img',
-        ]
-        
-        for selector in img_selectors:
-            imgs = soup.select(selector)
+        if tree is not None:
+            # 容器按文档顺序排列，dict.fromkeys 去重后与 soup.select 的结果顺序一致
+            img_groups = (
+                dict.fromkeys(img for container in containers for img in container.iterdescendants('img'))
+                for containers in selected['images']
+            )
+        else:
+            # BeautifulSoup 元素按内容判等，用 id 去重
+            img_groups = (
+                {id(img): img for container in containers for img in container.find_all('img')}.values()
+                for containers in selected['images']
+            )
+        
+        seen_images = set()  # 集合去重，列表保持顺序
+        for imgs in img_groups:
             for img in imgs:
                 src = img.get('src') or img.get('data-src')
                 if src:
                     if not src.startswith('http'):
                         src = urljoin(self.config.base_url, src)
-                    if src not in images:
+                    if src not in seen_images:
+                        seen_images.add(src)
                         images.append(src)
             if images:
                 break
         
         # ========================================================================
-        # 生成breadcrumb并重新映射字段
+        # 生成breadcrumb（仅用于保存；各字段已直接从面包屑导航元素中提取）
         # ========================================================================
         breadcrumb = self._generate_breadcrumb(
             category, region, district, district_level2, sub_district, estate_name
         )
         
-        # 从breadcrumb字符串中重新解析各个字段
-        if breadcrumb:
-            parsed_category, parsed_region, parsed_district_level2, \
-            parsed_sub_district, parsed_estate_name = self._parse_breadcrumb_fields(breadcrumb)
-            
-            if parsed_category:
-                category = parsed_category
-            if parsed_region:
-                region = parsed_region
-            if parsed_district_level2:
-                district_level2 = parsed_district_level2
-            if parsed_sub_district:
-                sub_district = parsed_sub_district
-            if parsed_estate_name:
-                estate_name = parsed_estate_name
-        
         # ========================================================================
         # 从已提取的字段填充缺失的位置信息
         # ========================================================================
@@ -1295,61 +1978,35 @@ class Hse28Crawler:
         # 尝试从页面文本中提取 street（街道名称）
         # 模式：XXX徑、XXX路、XXX街、XXX道、XXX里
         if not street:
-            street_patterns = [
-                r'([^\s]{2,15}(?:徑|路|街|道|里))',
-                r'([^\s]{2,15}(?:Road|Street|Avenue|Lane))',
-            ]
-            for pattern in street_patterns:
-                try:
-                    match = re.search(pattern, page_text)
-                    if match:
-                        potential_street = match.group(1).strip()
-                        # 过滤掉无效的街道名称
-                        invalid_street_keywords = ['地址', '位置', '地點', 'Location', 'Address', 
-                                                  '致電', 'Whatsapp', '聯絡', '電話', 'Tel']
-                        if not any(kw in potential_street for kw in invalid_street_keywords):
-                            street = potential_street
-                            break
-                except re.error as e:
-                    print(f"  ⚠ 街道正则表达式错误: {pattern} - {str(e)}")
+            # 每种模式只检查其第一个匹配（与原先逐个模式 search 一致）
+            checked_groups = set()
+            for match in _STREET_RE.finditer(page_text):
+                if match.lastgroup in checked_groups:
                     continue
+                checked_groups.add(match.lastgroup)
+                potential_street = match.group().strip()
+                # 过滤掉无效的街道名称
+                if not _INVALID_STREET_RE.search(potential_street):
+                    street = potential_street
+                    break
+                if len(checked_groups) == 2:
+                    break
         
         # 尝试从页面文本中提取完整的 address
         # 组合已有信息构建地址（如果还没有从列表页获取到地址）
-        if not location or location == "":
-            address_parts = []
-            if region:
-                address_parts.append(region)
-            if district_level2:
-                address_parts.append(district_level2)
-            if estate_name:
-                address_parts.append(estate_name)
-            if street:
-                address_parts.append(street)
-            
-            if address_parts:
-                location = " ".join(address_parts)
+        if not location:
+            location = " ".join(filter(None, (region, district_level2, estate_name, street))) or location
         
         # 从描述文本中尝试提取更详细的地址信息
         if description and len(description) > 10:
             # 尝试从描述中提取地址模式
-            address_patterns = [
-                r'([^\s]{2,20}(?:徑|路|街|道|里|花園|苑|邨|中心|居|軒|灣|城|山|臺|台))',
-                r'([^\s]{2,20}(?:Road|Street|Avenue|Lane|Garden|Estate))',
-            ]
-            for pattern in address_patterns:
-                try:
-                    matches = re.findall(pattern, description)
-                    if matches:
-                        # 取第一个匹配的作为地址补充
-                        potential_address = matches[0]
-                        if potential_address and potential_address not in ['致電Whatsapp', '聯絡我們']:
-                            if not location or len(location) < len(potential_address):
-                                location = potential_address
-                            break
-                except re.error as e:
-                    print(f"  ⚠ 地址正则表达式错误: {pattern} - {str(e)}")
-                    continue
+            match = _DESC_ADDRESS_RE.search(description)
+            if match:
+                # 取第一个匹配的作为地址补充
+                potential_address = match.group()
+                if potential_address not in _INVALID_DESC_ADDRESSES:
+                    if not location or len(location) < len(potential_address):
+                        location = potential_address
         
         # 验证必需字段
         if not title:
@@ -1434,175 +2091,272 @@ class Hse28Crawler:
             category: 类别筛选
             region: 地区筛选
         """
-        print("="*70)
-        print("开始爬取28Hse.com数据")
-        print("="*70)
+        # 未通过 async with 打开共享浏览器时，自动打开并在结束后关闭
+        if self._crawler is None:
+            async with self:
+                return await self.crawl_all(max_pages, max_properties, category, region)
+        
+        logger.info("="*70)
+        logger.info("开始爬取28Hse.com数据")
+        logger.info("="*70)
         
         # 构建列表页URL
         list_url = self._build_list_url(category)
-        print(f"列表页URL: {list_url}")
+        logger.info(f"列表页URL: {list_url}")
         if category:
-            print(f"类别筛选: {category}")
+            logger.info(f"类别筛选: {category}")
         if region:
-            print(f"地区筛选: {region}")
-        print(f"最大页数: {max_pages}")
-        print(f"最大房产数: {max_properties or '无限制'}")
-        print("="*70)
-        
-        # 爬取列表页
-        browser_config = BrowserConfig(
-            headless=True,
-            user_agent=self.config.user_agent,
-        )
-        
-        all_property_urls = []
-        
-        async with AsyncWebCrawler(config=browser_config) as crawler:
-            for page in range(1, max_pages + 1):
-                print(f"\n[列表页 {page}/{max_pages}]")
-                property_urls = await self.crawl_list_page(list_url, page, crawler=crawler)
-                
-                if property_urls is None:
-                    property_urls = []
-                
-                print(f"  本页提取到 {len(property_urls)} 个房产URL")
-                
-                if not property_urls:
-                    print(f"  ⚠ 列表页 {page} 没有找到房产，可能已到最后一页")
-                    if page > 1:
-                        break
-                else:
-                    all_property_urls.extend(property_urls)
-                
-                if max_properties and len(all_property_urls) >= max_properties:
-                    all_property_urls = all_property_urls[:max_properties]
+            logger.info(f"地区筛选: {region}")
+        logger.info(f"最大页数: {max_pages}")
+        logger.info(f"最大房产数: {max_properties or '无限制'}")
+        logger.info("="*70)
+        
+        # 断点续爬：恢复上次中断前已解析的房产，并在本次运行中逐条记录检查点
+        self._open_checkpoint()
+        
+        # 爬取列表页（列表页和详情页共用同一个浏览器实例）
+        crawler = self._crawler
+        # dict 按插入顺序保存URL，同时O(1)去重（各列表页之间可能有重复）
+        all_property_urls: Dict[str, None] = {}
+        extracted_count = 0  # 去重前的URL数
+        
+        for page in range(1, max_pages + 1):
+            logger.info(f"\n[列表页 {page}/{max_pages}]")
+            property_urls = await self.crawl_list_page(list_url, page, crawler=crawler)
+            
+            if property_urls is None:
+                property_urls = []
+            
+            logger.info(f"  本页提取到 {len(property_urls)} 个房产URL")
+            
+            if not property_urls:
+                logger.warning(f"  ⚠ 列表页 {page} 没有找到房产，可能已到最后一页")
+                if page > 1:
                     break
-                
-                await asyncio.sleep(self.config.rate_limit)
+            else:
+                extracted_count += len(property_urls)
+                all_property_urls.update(dict.fromkeys(property_urls))
+            
+            if max_properties and len(all_property_urls) >= max_properties:
+                break
+            
+            await asyncio.sleep(self.config.rate_limit)
         
-        # 去重
-        all_property_urls = list(set(all_property_urls))
-        print(f"\n总共找到 {len(all_property_urls)} 个唯一房产URL")
+        all_property_urls = list(all_property_urls)
+        logger.info(f"\n总共找到 {len(all_property_urls)} 个唯一房产URL（去重前 {extracted_count} 个）")
         
         if not all_property_urls:
-            print("没有找到任何房产URL")
+            logger.info("没有找到任何房产URL")
             return
         
         if max_properties:
             all_property_urls = all_property_urls[:max_properties]
-            print(f"限制爬取数量为: {len(all_property_urls)}")
+            logger.info(f"限制爬取数量为: {len(all_property_urls)}")
         
         # 爬取详情页
-        print(f"\n开始爬取详情页...")
-        semaphore = asyncio.Semaphore(self.config.max_concurrent)
-        
-        completed_count = 0
-        total_count = len(all_property_urls)
-        
-        async def crawl_with_limit(url, index):
-            nonlocal completed_count
-            async with semaphore:
-                result = await self.crawl_detail_page(url)
-                completed_count += 1
-                if completed_count % 10 == 0 or completed_count == total_count:
-                    print(f"  进度: {completed_count}/{total_count} ({completed_count*100//total_count}%)")
-                return result
-        
-        tasks = [crawl_with_limit(url, i) for i, url in enumerate(all_property_urls)]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        logger.info(f"\n开始爬取详情页...")
+        results = await self.crawl_detail_pages(all_property_urls, crawler=crawler)
         
         # 统计
         success_count = sum(1 for r in results if r and not isinstance(r, Exception))
         error_count = sum(1 for r in results if isinstance(r, Exception))
         
-        # 如果指定了region，过滤结果
-        if region:
-            print(f"\n根据地区 '{region}' 过滤结果...")
+        # 如果指定了region，过滤结果（"全部"/"all"/"不限"表示不限地区，不需要过滤）
+        if region and region.lower() not in _ALL_REGION_TOKENS:
+            logger.info(f"\n根据地区 '{region}' 过滤结果...")
             original_count = len(self.properties)
-            # 支持多种region名称格式
-            region_variants = {
-                '港島': ['港島', '香港島', '香港岛'],
-                '九龍': ['九龍', '九龙'],
-                '新界': ['新界', '新界東', '新界东', '新界西'],
-                '離島': ['離島', '离岛'],
-            }
-            
-            # 获取region的所有变体
-            region_matches = [region]
-            for key, variants in region_variants.items():
-                if region in variants or any(v in region for v in variants):
-                    region_matches.extend(variants)
-                    break
+            # 获取region的所有变体：先按变体精确查找，找不到时再看region是否包含某个变体（如"九龍城"）
+            canonical = _REGION_CANONICAL.get(region)
+            if canonical is None:
+                canonical = next(
+                    (key for key, variants in _REGION_VARIANTS.items() if any(v in region for v in variants)),
+                    None,
+                )
             
-            # 去重
-            region_matches = list(set(region_matches))
+            # region 精确匹配用集合；district_level2 包含匹配一次扫描同时匹配所有变体
+            region_set = _REGION_INDEX.get(canonical, frozenset()) | {region}
+            if HAS_AHOCORASICK:
+                # Aho-Corasick自动机：扫描一遍即可判断是否包含任一变体
+                automaton = ahocorasick.Automaton()
+                for variant in region_set:
+                    automaton.add_word(variant, variant)
+                automaton.make_automaton()
+                contains_region = lambda text: next(automaton.iter(text), None) is not None
+            else:
+                contains_region = re.compile('|'.join(map(re.escape, region_set))).search
+            # 倒排索引：按 region 和 district_level2 分桶（记录下标），扫描一遍即可；
+            # 过滤时只需查找匹配的桶，每个不同的 district_level2 只做一次包含匹配
+            by_region: Dict[str, List[int]] = defaultdict(list)
+            by_district: Dict[str, List[int]] = defaultdict(list)
+            for i, p in enumerate(self.properties):
+                if p.region:
+                    by_region[p.region].append(i)
+                if p.district_level2:
+                    by_district[p.district_level2].append(i)
             
             # 过滤：匹配region或district_level2包含region
-            filtered_properties = []
-            for p in self.properties:
-                if p.region and p.region in region_matches:
-                    filtered_properties.append(p)
-                elif p.district_level2 and any(rm in p.district_level2 for rm in region_matches):
-                    filtered_properties.append(p)
-                elif not p.region and region.lower() in ['all', '全部', '不限']:
-                    # 如果没有region信息且用户选择"全部"，则保留
-                    filtered_properties.append(p)
+            matched: Set[int] = set()
+            for rm in region_set:
+                matched.update(by_region.get(rm, ()))
+            for district, indexes in by_district.items():
+                if contains_region(district):
+                    matched.update(indexes)
+            # 按下标排序，保持原有顺序
+            filtered_properties = [self.properties[i] for i in sorted(matched)]
             
             self.properties = filtered_properties
-            print(f"  原始记录数: {original_count}")
-            print(f"  过滤后保留: {len(self.properties)} 条记录")
+            logger.info(f"  原始记录数: {original_count}")
+            logger.info(f"  过滤后保留: {len(self.properties)} 条记录")
             if len(self.properties) < original_count:
-                print(f"  已过滤掉 {original_count - len(self.properties)} 条不匹配的记录")
+                logger.info(f"  已过滤掉 {original_count - len(self.properties)} 条不匹配的记录")
         
-        print(f"\n" + "="*70)
-        print(f"爬取完成!")
-        print(f"  总URL数: {len(all_property_urls)}")
-        print(f"  成功解析: {success_count}")
-        print(f"  异常: {error_count}")
-        print(f"  实际保存记录数: {len(self.properties)}")
-        print("="*70)
+        logger.info(f"\n" + "="*70)
+        logger.info(f"爬取完成!")
+        logger.info(f"  总URL数: {len(all_property_urls)}")
+        logger.info(f"  成功解析: {success_count}")
+        logger.info(f"  异常: {error_count}")
+        logger.info(f"  实际保存记录数: {len(self.properties)}")
+        logger.info("="*70)
         
         # 保存数据
         if self.properties:
             self.save_data()
         else:
-            print("\n⚠ 没有成功爬取到任何房产数据")
+            logger.warning("\n⚠ 没有成功爬取到任何房产数据")
+        # 本次运行已正常结束，下次运行不需要从检查点恢复
+        self._close_checkpoint(remove=True)
+    
+    @staticmethod
+    def _dump_json_record(record: dict) -> bytes:
+        """
+        把一条记录编码为JSON（UTF-8，不转义中文）
+        
+        缩进与 json.dump(列表, indent=2) 中数组元素的格式一致，便于逐条写入同一个数组
+        """
+        if HAS_ORJSON:
+            # orjson 为C实现，编码速度远快于标准库json
+            encoded = orjson.dumps(record, option=orjson.OPT_INDENT_2)
+        else:
+            encoded = json.dumps(record, ensure_ascii=False, indent=2).encode('utf-8')
+        return encoded.replace(b'\n', b'\n  ')
+    
+    @staticmethod
+    def _write_csv_arrow(table, records: List[dict], csv_file: Path):
+        """
+        用 PyArrow 把 Arrow 表写为CSV（逐行格式化和转义在C++中完成）
+        
+        CSV不支持列表类型：列表字段（images、facilities）转换为与 csv.DictWriter 相同的
+        字符串表示；全为空值的列转换为字符串列
+        """
+        for i, field in enumerate(table.schema):
+            if pa.types.is_list(field.type) or pa.types.is_large_list(field.type):
+                column = pa.array(
+                    [None if r.get(field.name) is None else str(r[field.name]) for r in records],
+                    type=pa.string(),
+                )
+                table = table.set_column(i, field.name, column)
+            elif pa.types.is_null(field.type):
+                table = table.set_column(i, field.name, table.column(i).cast(pa.string()))
+        pa_csv.write_csv(table, str(csv_file))
     
     def save_data(self):
         """
         保存爬取的数据到文件
         """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # 保存为JSON
         json_file = self.output_dir / f"properties_{timestamp}.json"
-        data = [prop.to_dict() for prop in self.properties]
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        print(f"\n✓ JSON数据已保存到: {json_file}")
-        print(f"  共 {len(data)} 条记录")
-        
-        # 保存为CSV
         csv_file = self.output_dir / f"properties_{timestamp}.csv"
-        if self.properties:
+        
+        # 每条记录只调用一次 to_dict()，同时流式写入JSON和CSV，不在内存中保留全部字典；
+        # 安装了 PyArrow 时先收集记录，循环结束后构建 Arrow 表，由C++实现的 write_csv 一次写出
+        count = 0
+        arrow_records = [] if HAS_PYARROW else None
+        csv_writer = None
+        csv_error = None
+        with ExitStack() as stack:
+            json_f = stack.enter_context(open(json_file, 'wb', buffering=1 << 20))
+            json_f.write(b'[')
+            for prop in self.properties:
+                record = prop.to_dict()
+                json_f.write(b',\n  ' if count else b'\n  ')
+                json_f.write(self._dump_json_record(record))
+                count += 1
+                
+                # CSV写入失败不影响JSON的保存
+                if arrow_records is not None:
+                    arrow_records.append(record)
+                elif csv_error is None:
+                    try:
+                        if csv_writer is None:
+                            csv_f = stack.enter_context(
+                                open(csv_file, 'w', encoding='utf-8', newline='', buffering=1 << 20)
+                            )
+                            # to_dict() 的键顺序固定，直接按值写入，省去 DictWriter 每个字段的字典查找
+                            csv_writer = csv.writer(csv_f)
+                            csv_writer.writerow(record)
+                        csv_writer.writerow(record.values())
+                    except Exception as e:
+                        csv_error = e
+            json_f.write(b'\n]' if count else b']')
+        
+        logger.info(f"\n✓ JSON数据已保存到: {json_file}")
+        logger.info(f"  共 {count} 条记录")
+        
+        csv_saved = csv_writer is not None
+        table = None
+        if arrow_records:
             try:
-                fieldnames = list(self.properties[0].to_dict().keys())
-                with open(csv_file, 'w', encoding='utf-8', newline='') as f:
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writeheader()
-                    for prop in self.properties:
-                        writer.writerow(prop.to_dict())
-                print(f"✓ CSV数据已保存到: {csv_file}")
+                table = pa.Table.from_pylist(arrow_records)
+                self._write_csv_arrow(table, arrow_records, csv_file)
+                csv_saved = True
             except Exception as e:
-                print(f"✗ 保存CSV失败: {str(e)}")
-        
-        # 保存失败URL列表
-        if self.failed_urls:
-            failed_file = self.output_dir / f"failed_urls_{timestamp}.txt"
-            with open(failed_file, 'w', encoding='utf-8') as f:
-                for url in self.failed_urls:
-                    f.write(url + "\n")
-            print(f"⚠ 失败URL列表已保存到: {failed_file}")
+                # PyArrow 无法处理时回退到 csv 模块
+                logger.warning(f"  ⚠ PyArrow写入CSV失败，改用csv模块: {str(e)[:100]}")
+                try:
+                    with open(csv_file, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
+                        writer = csv.writer(f)
+                        writer.writerow(arrow_records[0])
+                        writer.writerows(record.values() for record in arrow_records)
+                    csv_saved = True
+                except Exception as e:
+                    csv_error = e
+        
+        if csv_error is not None:
+            logger.error(f"✗ 保存CSV失败: {str(csv_error)}")
+        elif csv_saved:
+            logger.info(f"✓ CSV数据已保存到: {csv_file}")
+        
+        # 保存为Parquet（列式存储+压缩，pandas等工具加载比CSV/JSON快得多；列表字段保留为列表类型）
+        if self.enable_parquet and table is not None:
+            parquet_file = self.output_dir / f"properties_{timestamp}.parquet"
+            try:
+                pa_parquet.write_table(table, str(parquet_file), compression='zstd')
+                logger.info(f"✓ Parquet数据已保存到: {parquet_file}")
+            except Exception as e:
+                logger.error(f"✗ 保存Parquet失败: {str(e)}")
+        
+        # 保存增量爬取历史
+        if self._crawl_history is not None:
+            self._save_crawl_history()
+            logger.info(f"✓ 增量爬取历史已保存到: {self._history_file}")
+        
+        # 失败URL在失败时已逐行写入文件
+        if self._failed_file is not None:
+            logger.warning(f"⚠ 失败URL列表已保存到: {self._failed_file}（{len(self.failed_urls)} 个）")
+
+
+def _parse_detail_page_worker(html: str, url: str, list_page_address: Optional[str]) -> Optional[PropertyData]:
+    """
+    在解析进程池的子进程中解析详情页
+    
+    模块级函数（可被pickle）。只构造解析所需的状态（站点配置和该URL的列表页地址），
+    不初始化浏览器配置、输出目录或增量历史。
+    """
+    _setup_logging()
+    parser = Hse28Crawler.__new__(Hse28Crawler)
+    parser.config = HSE28_CONFIG
+    parser._list_page_addresses = {url: list_page_address} if list_page_address else {}
+    return parser._parse_detail_page(html, url)
 
 
 async def main():
@@ -1616,12 +2370,25 @@ async def main():
                        help='类别筛选: buy/買樓, rent/租樓')
     parser.add_argument('--region', type=str, default=None,
                        help='地区筛选: 港島, 九龍, 新界東, 新界西 等')
+    parser.add_argument('--incremental', action='store_true',
+                       help='增量爬取：跳过之前运行中已成功爬取的详情页')
+    parser.add_argument('--parse-workers', type=int, default=None,
+                       help='解析详情页的子进程数（默认：CPU核数，0 表示不使用子进程）')
+    parser.add_argument('--no-parquet', action='store_true',
+                       help='不输出Parquet文件（默认在安装了 pyarrow 时输出）')
+    parser.add_argument('--concurrency', type=int, default=None,
+                       help=f'同时爬取的详情页数（默认：{HSE28_CONFIG.max_concurrent}）')
     
     args = parser.parse_args()
     
-    crawler = Hse28Crawler()
+    crawler = Hse28Crawler(
+        incremental=args.incremental,
+        parse_workers=args.parse_workers,
+        enable_parquet=not args.no_parquet,
+        max_concurrent=args.concurrency,
+    )
     
-    print("开始测试爬取...")
+    logger.info("开始测试爬取...")
     await crawler.crawl_all(
         max_pages=args.max_pages,
         max_properties=args.max_properties,
@@ -1629,20 +2396,24 @@ async def main():
         region=args.region
     )
     
-    print("\n" + "="*70)
-    print("测试完成！")
-    print("="*70)
-    print("\n如果测试成功，可以:")
-    print("1. 增加 max_pages 参数爬取更多页面")
-    print("2. 移除 max_properties 限制爬取所有房产")
-    print("3. 使用 --category 和 --region 参数筛选特定类别和地区")
-    print("4. 检查保存的数据文件确认数据质量")
-    print("\n注意: 如果数据提取不准确，请:")
-    print("1. 运行探索脚本检查页面结构")
-    print("2. 根据实际HTML结构更新CSS选择器")
-    print("3. 调整数据提取逻辑")
+    logger.info("\n" + "="*70)
+    logger.info("测试完成！")
+    logger.info("="*70)
+    logger.info("\n如果测试成功，可以:")
+    logger.info("1. 增加 max_pages 参数爬取更多页面")
+    logger.info("2. 移除 max_properties 限制爬取所有房产")
+    logger.info("3. 使用 --category 和 --region 参数筛选特定类别和地区")
+    logger.info("4. 检查保存的数据文件确认数据质量")
+    logger.info("\n注意: 如果数据提取不准确，请:")
+    logger.info("1. 运行探索脚本检查页面结构")
+    logger.info("2. 根据实际HTML结构更新CSS选择器")
+    logger.info("3. 调整数据提取逻辑")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop（基于libuv的C实现事件循环）比默认事件循环快，未安装时使用 asyncio 默认实现
+    if HAS_UVLOOP:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
 
@@ -8,10 +8,198 @@ import asyncio
 import json
 import re
 from pathlib import Path
+
+try:
+    import lxml  # noqa: F401  仅用于判断 BeautifulSoup 能否使用 lxml 解析器
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+try:
+    import hyperscan
+    HAS_HYPERSCAN = True
+except ImportError:
+    HAS_HYPERSCAN = False
+
 from crawl4ai import AsyncWebCrawler
 from crawl4ai.async_configs import BrowserConfig
 from sites_config import HSE28_CONFIG
 
+# BeautifulSoup 解析器：优先使用 lxml（C 实现），未安装时回退到内置的 html.parser
+HTML_PARSER = 'lxml' if HAS_LXML else 'html.parser'
+
+# 价格模式：(正则, 说明)
+_PRICE_RES = [
+    (re.compile(r'[\$HK\$]?\s*[\d,]+萬?'), '港币价格（万）'),
+    (re.compile(r'[\d,]+万'), '中文万'),
+    (re.compile(r'[\d,]+萬'), '繁体万'),
+    (re.compile(r'HK\$\s*[\d,]+'), 'HK$格式'),
+    (re.compile(r'[\d,]+\.?\d*\s*萬'), '带小数点的万'),
+]
+
+# 面积模式（忽略大小写）
+_AREA_RES = [
+    (re.compile(r'[\d.]+?\s*呎', re.IGNORECASE), '平方呎'),
+    (re.compile(r'[\d.]+?\s*平方呎', re.IGNORECASE), '平方呎（完整）'),
+    (re.compile(r'[\d.]+?\s*sqft', re.IGNORECASE), 'sqft'),
+    (re.compile(r'[\d.]+?\s*平方', re.IGNORECASE), '平方'),
+    (re.compile(r'[\d.]+?\s*尺', re.IGNORECASE), '尺'),
+]
+
+_PATTERN_RES = [rx for rx, _ in _PRICE_RES + _AREA_RES]
+
+# 可能的房产列表容器
+_CONTAINER_SELECTORS = [
+    '.property-list',
+    '.listing-list',
+    '.result-list',
+    '.property-item',
+    '.listing-item',
+    '.house-item',
+    '[class*="property"]',
+    '[class*="listing"]',
+    '[class*="house"]',
+    '[class*="item"]',
+    '[class*="card"]',
+]
+
+# 可能的房产详情链接模式（与小写的href比较）
+_LINK_PATTERNS = [
+    '/property/',
+    '/listing/',
+    '/house/',
+    '/unit/',
+    '/buy/',
+    '/rent/',
+    'property',
+    'listing',
+]
+
+if HAS_AHOCORASICK:
+    # Aho-Corasick自动机：扫描一遍href即可判断是否包含任一模式
+    _LINK_AUTOMATON = ahocorasick.Automaton()
+    for _pattern in _LINK_PATTERNS:
+        _LINK_AUTOMATON.add_word(_pattern, _pattern)
+    _LINK_AUTOMATON.make_automaton()
+    
+    def _is_property_link(href_lower):
+        return next(_LINK_AUTOMATON.iter(href_lower), None) is not None
+else:
+    def _is_property_link(href_lower):
+        return any(pattern in href_lower for pattern in _LINK_PATTERNS)
+
+# 可能的分页元素
+_PAGINATION_SELECTORS = [
+    '.pagination',
+    '.pager',
+    '.page-nav',
+    '[class*="pagination"]',
+    '[class*="pager"]',
+    '[class*="page"]',
+]
+
+if HAS_HYPERSCAN:
+    # 所有价格和面积模式编译进同一个数据库，只扫描一遍HTML
+    _HS_DB = hyperscan.Database()
+    _HS_DB.compile(
+        expressions=[rx.pattern.encode('utf-8') for rx in _PATTERN_RES],
+        ids=list(range(len(_PATTERN_RES))),
+        elements=len(_PATTERN_RES),
+        flags=[
+            hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP | hyperscan.HS_FLAG_SOM_LEFTMOST
+            | (hyperscan.HS_FLAG_CASELESS if rx.flags & re.IGNORECASE else 0)
+            for rx in _PATTERN_RES
+        ],
+    )
+
+
+def select_by_class(soup, selectors):
+    """
+    遍历一次页面，按多个class选择器分桶收集元素，结果与逐个调用 soup.select 相同
+    
+    只支持 '.类名'（类名完全匹配）和 '[class*="子串"]'（class属性包含子串）两种选择器，
+    每个元素只需做几次字符串比较，避免每个选择器都遍历一遍整棵树。
+    
+    Args:
+        soup: BeautifulSoup 对象
+        selectors: 选择器列表
+        
+    Returns:
+        {选择器: 按文档顺序排列的元素列表}
+    """
+    token_selectors = []  # (选择器, 类名)
+    substring_selectors = []  # (选择器, 子串)
+    for selector in selectors:
+        if selector.startswith('.'):
+            token_selectors.append((selector, selector[1:]))
+        else:
+            substring_selectors.append((selector, selector[len('[class*="'):-len('"]')]))
+    
+    buckets = {selector: [] for selector in selectors}
+    for element in soup.find_all(class_=True):
+        classes = element.get('class', [])
+        class_attr = ' '.join(classes)
+        for selector, name in token_selectors:
+            if name in classes:
+                buckets[selector].append(element)
+        for selector, needle in substring_selectors:
+            if needle in class_attr:
+                buckets[selector].append(element)
+    return buckets
+
+
+def find_pattern_matches(html, max_examples=5):
+    """
+    统计HTML中每个价格/面积模式的匹配数（与 re.findall 的匹配相同），并保留前几个不同的示例
+    
+    安装了 hyperscan 时扫描一遍HTML即可得到所有模式的匹配；
+    否则逐个模式用 finditer 流式计数，不在内存中保留完整的匹配列表。
+    
+    Args:
+        html: 页面HTML
+        max_examples: 每个模式最多保留的示例数
+        
+    Returns:
+        与 _PRICE_RES + _AREA_RES 对应的 (匹配数, 示例列表)
+    """
+    def summarize(matches):
+        total = 0
+        examples = {}  # dict 按出现顺序去重
+        for text in matches:
+            total += 1
+            if len(examples) < max_examples:
+                examples[text] = None
+        return total, list(examples)
+    
+    if not HAS_HYPERSCAN:
+        return [summarize(m.group(0) for m in rx.finditer(html)) for rx in _PATTERN_RES]
+    
+    # hyperscan 报告每个匹配的 (起点, 终点)，按模式分桶
+    hits = [[] for _ in _PATTERN_RES]
+    
+    def on_match(pattern_id, start, end, flags, context):
+        hits[pattern_id].append((start, end))
+    
+    data = html.encode('utf-8')
+    _HS_DB.scan(data, match_event_handler=on_match)
+    
+    def leftmost_longest(pattern_hits):
+        # 与 re.findall 一致：从左到右取最左起点的最长匹配，匹配之间不重叠
+        pos = 0
+        for start, end in sorted(pattern_hits, key=lambda hit: (hit[0], -hit[1])):
+            if start >= pos:
+                yield data[start:end].decode('utf-8')
+                pos = end
+    
+    return [summarize(leftmost_longest(pattern_hits)) for pattern_hits in hits]
+
+
 async def explore_28hse_structure():
     """探索28Hse.com页面结构"""
     print("="*70)
@@ -44,45 +232,34 @@ async def explore_28hse_structure():
         output_dir = Path("exploration")
         output_dir.mkdir(exist_ok=True)
         
+        # 一次性编码后整块写入（不经过文本模式的逐块编码）
         html_file = output_dir / "28hse_list_page.html"
-        with open(html_file, 'w', encoding='utf-8') as f:
-            f.write(result.html)
+        html_file.write_bytes(result.html.encode('utf-8'))
         print(f"  HTML已保存到: {html_file}")
         
         # 保存Markdown用于分析
         md_file = output_dir / "28hse_list_page.md"
-        with open(md_file, 'w', encoding='utf-8') as f:
-            f.write(result.markdown)
+        md_file.write_bytes(result.markdown.encode('utf-8'))
         print(f"  Markdown已保存到: {md_file}")
         
         # 使用BeautifulSoup分析HTML结构
         try:
             from bs4 import BeautifulSoup
-            soup = BeautifulSoup(result.html, 'html.parser')
+            # 只解析一次，后续所有选择器都复用同一棵树
+            soup = BeautifulSoup(result.html, HTML_PARSER)
             
             print("\n" + "="*70)
             print("分析页面结构")
             print("="*70)
             
+            # 列表容器和分页元素的所有选择器，遍历一次页面即可全部匹配
+            selected = select_by_class(soup, _CONTAINER_SELECTORS + _PAGINATION_SELECTORS)
+            
             # 查找可能的房产列表容器
             print("\n1. 查找房产列表容器...")
-            possible_selectors = [
-                '.property-list',
-                '.listing-list',
-                '.result-list',
-                '.property-item',
-                '.listing-item',
-                '.house-item',
-                '[class*="property"]',
-                '[class*="listing"]',
-                '[class*="house"]',
-                '[class*="item"]',
-                '[class*="card"]',
-            ]
-            
             found_containers = []
-            for selector in possible_selectors:
-                elements = soup.select(selector)
+            for selector in _CONTAINER_SELECTORS:
+                elements = selected[selector]
                 if elements:
                     found_containers.append((selector, len(elements)))
                     print(f"  ✓ '{selector}': 找到 {len(elements)} 个元素")
@@ -98,69 +275,37 @@ async def explore_28hse_structure():
             
             # 查找价格模式
             print("\n2. 查找价格信息...")
-            price_patterns = [
-                (r'[\$HK\$]?\s*[\d,]+萬?', '港币价格（万）'),
-                (r'[\d,]+万', '中文万'),
-                (r'[\d,]+萬', '繁体万'),
-                (r'HK\$\s*[\d,]+', 'HK$格式'),
-                (r'[\d,]+\.?\d*\s*萬', '带小数点的万'),
-            ]
+            # 价格和面积的所有模式一次查找（安装了 hyperscan 时只扫描一遍HTML）
+            all_matches = find_pattern_matches(result.html)
+            price_matches = all_matches[:len(_PRICE_RES)]
+            area_matches = all_matches[len(_PRICE_RES):]
             
-            for pattern, desc in price_patterns:
-                matches = re.findall(pattern, result.html)
-                if matches:
-                    unique_matches = list(set(matches))[:5]
-                    print(f"  ✓ {desc} ('{pattern}'): 找到 {len(matches)} 个匹配")
-                    print(f"    示例: {unique_matches}")
+            for (rx, desc), (total, examples) in zip(_PRICE_RES, price_matches):
+                if total:
+                    print(f"  ✓ {desc} ('{rx.pattern}'): 找到 {total} 个匹配")
+                    print(f"    示例: {examples}")
             
             # 查找面积模式
             print("\n3. 查找面积信息...")
-            area_patterns = [
-                (r'[\d.]+?\s*呎', '平方呎'),
-                (r'[\d.]+?\s*平方呎', '平方呎（完整）'),
-                (r'[\d.]+?\s*sqft', 'sqft'),
-                (r'[\d.]+?\s*平方', '平方'),
-                (r'[\d.]+?\s*尺', '尺'),
-            ]
-            
-            for pattern, desc in area_patterns:
-                matches = re.findall(pattern, result.html, re.IGNORECASE)
-                if matches:
-                    unique_matches = list(set(matches))[:5]
-                    print(f"  ✓ {desc} ('{pattern}'): 找到 {len(matches)} 个匹配")
-                    print(f"    示例: {unique_matches}")
+            for (rx, desc), (total, examples) in zip(_AREA_RES, area_matches):
+                if total:
+                    print(f"  ✓ {desc} ('{rx.pattern}'): 找到 {total} 个匹配")
+                    print(f"    示例: {examples}")
             
             # 查找链接（房产详情页）
             print("\n4. 查找房产详情链接...")
             links = soup.find_all('a', href=True)
             
-            # 可能的链接模式
-            link_patterns = [
-                '/property/',
-                '/listing/',
-                '/house/',
-                '/unit/',
-                '/buy/',
-                '/rent/',
-                'property',
-                'listing',
-            ]
-            
-            property_links = []
+            # 一次遍历完成匹配和去重（同一链接保留第一次出现时的文本）
+            unique_links = {}
             for link in links:
                 href = link.get('href', '')
-                for pattern in link_patterns:
-                    if pattern in href.lower():
-                        if not href.startswith('http'):
-                            href = HSE28_CONFIG.base_url + href
-                        property_links.append((href, link.get_text(strip=True)[:50]))
-                        break
-            
-            # 去重
-            unique_links = {}
-            for href, text in property_links:
+                if not _is_property_link(href.lower()):
+                    continue
+                if not href.startswith('http'):
+                    href = HSE28_CONFIG.base_url + href
                 if href not in unique_links:
-                    unique_links[href] = text
+                    unique_links[href] = link.get_text(strip=True)[:50]
             
             print(f"  找到 {len(unique_links)} 个可能的房产详情链接")
             if unique_links:
@@ -171,17 +316,8 @@ async def explore_28hse_structure():
             
             # 查找分页元素
             print("\n5. 查找分页元素...")
-            pagination_selectors = [
-                '.pagination',
-                '.pager',
-                '.page-nav',
-                '[class*="pagination"]',
-                '[class*="pager"]',
-                '[class*="page"]',
-            ]
-            
-            for selector in pagination_selectors:
-                elements = soup.select(selector)
+            for selector in _PAGINATION_SELECTORS:
+                elements = selected[selector]
                 if elements:
                     print(f"  ✓ '{selector}': 找到 {len(elements)} 个元素")
                     page_links = elements[0].find_all('a', href=True)
@@ -43,22 +43,647 @@
 """
 
 import asyncio
+import functools
+import inspect
 import json
 import re
+import sys
 import csv
 from pathlib import Path
 from typing import List, Optional, Dict
 from datetime import datetime
 from urllib.parse import urljoin, urlparse
 import hashlib
-
+import io
+from types import SimpleNamespace
+
+try:
+    from lxml import etree
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
+try:
+    from pybloom_live import BloomFilter, ScalableBloomFilter
+    HAS_PYBLOOM = True
+except ImportError:
+    HAS_PYBLOOM = False
+
+from bs4 import BeautifulSoup, NavigableString  # crawl4ai 的依赖，随 crawl4ai 一起安装
 from crawl4ai import AsyncWebCrawler
-from crawl4ai.async_configs import BrowserConfig
-from crawl4ai.extraction_strategy import JsonCssExtractionStrategy
+from crawl4ai.async_configs import BrowserConfig, CrawlerRunConfig
 
 from sites_config import CENTANET_CONFIG
 from data_models import PropertyData
 
+# BeautifulSoup 解析器（列表页和详情页）：优先使用 lxml（C 实现，解析大页面快得多），
+# 未安装 lxml 时回退到内置的 html.parser
+HTML_PARSER = 'lxml' if HAS_LXML else 'html.parser'
+
+# Centanet的详情页URL模式: /findproperty/detail/（買樓/租樓），成交页面为 /findproperty/transaction/ 等。
+# 有效的详情页URL必须包含 /detail/ 或 /transaction/（不区分大小写），
+# 其他候选模式（/property/、/listing/、/house/、/unit/）不含这两段时也不会被采用，因此只需检查这两段
+_DETAIL_LINK_RE = re.compile(r'/(?:detail|transaction)/', re.IGNORECASE)
+
+# 排除的模式
+_EXCLUDE_LINK_PATTERNS = (
+    '/list/',
+    '/estate/',
+    '/agent-detail/',
+    '/agent/',
+    '/district/',
+    'pasttranindex.aspx',  # 成交索引页面，不是详情页
+    'index.aspx',  # 索引页面
+)
+# 所有排除模式合并为一个正则，一次扫描完成（不区分大小写，不需要先 lower()）
+_EXCLUDE_LINK_RE = re.compile('|'.join(map(re.escape, _EXCLUDE_LINK_PATTERNS)), re.IGNORECASE)
+
+
+def _iter_anchor_hrefs(html: str):
+    """
+    用 lxml 的 iterparse 流式解析HTML，逐个产出 <a> 标签的 href
+
+    不需要先构建完整的DOM树再查询：每个 <a> 处理完立即清空，峰值内存远低于 BeautifulSoup。
+    """
+    source = io.BytesIO(html.encode('utf-8'))
+    for _, elem in etree.iterparse(source, events=('end',), tag='a', html=True, recover=True, encoding='utf-8'):
+        href = elem.get('href')
+        if href:
+            yield href
+        elem.clear(keep_tail=True)
+
+
+# 翻页完成的判断条件（crawl4ai 的 wait_for）：目标页码已变为当前页，且列表内容已更新
+# （第一个详情页链接与翻页前不同；翻页前页面上没有详情页链接时只检查页码）
+_PAGINATION_WAIT_FOR = """js:() => {
+    const target = String(window.__target_page__);
+    const active = Array.from(document.querySelectorAll('.active, .is-active, .current, [aria-current="page"]'))
+        .some(el => (el.textContent || '').trim() === target);
+    if (!active) return false;
+    const prev = window.__prev_first_detail__;
+    const first = document.querySelector('a[href*="/detail/"]');
+    return !prev || (first !== null && first.getAttribute('href') !== prev);
+}"""
+
+# CrawlerRunConfig 支持的参数（导入时探测一次）；接受 **kwargs 时为 None，表示不过滤
+_runconfig_params = inspect.signature(CrawlerRunConfig).parameters
+_RUNCONFIG_PARAMS = None if any(
+    p.kind is inspect.Parameter.VAR_KEYWORD for p in _runconfig_params.values()
+) else frozenset(_runconfig_params)
+
+
+def _make_run_config(**kwargs) -> CrawlerRunConfig:
+    """
+    构造 CrawlerRunConfig，丢弃已安装的 crawl4ai 版本不支持的参数
+
+    参数是否支持在导入时通过签名确定，这里不需要 try/except 逐个尝试。
+    """
+    if _RUNCONFIG_PARAMS is not None:
+        kwargs = {k: v for k, v in kwargs.items() if k in _RUNCONFIG_PARAMS}
+    return CrawlerRunConfig(**kwargs)
+
+
+def _failed_result(error_message: str) -> SimpleNamespace:
+    """构造与 CrawlResult 字段一致的失败结果（arun 抛异常或返回 None 时使用）"""
+    return SimpleNamespace(success=False, html='', error_message=error_message)
+
+
+# 可以直接拼接在 base_url 后面的站内绝对路径（与 urljoin 结果相同）：
+# 不以 // 开头，没有 ./ 或 ../ 段，不含查询/片段/参数分隔符和空白控制字符
+_SIMPLE_PATH_RE = re.compile(r'(?:/(?![/.])[^/?#;\x00-\x20]*)+\Z')
+
+# 非详情页URL：成交索引页面、索引页面、列表页、屋苑页
+_INVALID_DETAIL_URL_RE = re.compile(r'pasttranindex\.aspx|index\.aspx|/list/|/estate/', re.IGNORECASE)
+
+# 列表页分页点击脚本（只负责点击目标页码按钮；AJAX内容是否加载完成由 _PAGINATION_WAIT_FOR 判断）
+# 脚本文本保持不变，页码通过前置的 window.__target_page__ = N; 传入，
+# 避免每页重新拼接大字符串，浏览器也可以复用同一脚本的编译缓存
+_PAGINATION_JS = """
+(async () => {
+    // 目标页码由调用方在脚本前设置：window.__target_page__ = N;
+    const targetPage = String(window.__target_page__);
+    // 记录翻页前的第一个详情页链接，供 _PAGINATION_WAIT_FOR 判断内容是否已更新
+    const firstDetail = document.querySelector('a[href*="/detail/"]');
+    window.__prev_first_detail__ = firstDetail ? firstDetail.getAttribute('href') : null;
+    try {
+        console.log('[PAGINATION] Starting pagination for page ' + targetPage + '...');
+
+        let clicked = false;
+
+        // 方法1: 查找所有包含目标页码的元素
+        // Centanet的分页按钮通常是简单的数字文本
+        const allClickable = Array.from(document.querySelectorAll('a, button, li, span, div'));
+
+        console.log('[PAGINATION] Searching', allClickable.length, 'elements for page', targetPage);
+
+        for (let el of allClickable) {
+            const text = (el.textContent || el.innerText || '').trim();
+
+            // 精确匹配页码（只匹配纯数字，不包含其他字符）
+            if (text === targetPage) {
+                // 检查是否是当前页（不应该点击当前页）
+                const isActive = el.classList.contains('active') || 
+                               el.classList.contains('current') ||
+                               el.classList.contains('selected') ||
+                               el.getAttribute('aria-current') === 'page';
+
+                if (!isActive) {
+                    console.log('[PAGINATION] Found page button:', text, 'tag:', el.tagName);
+
+                    // 滚动到元素（立即滚动，不需要等待动画）
+                    el.scrollIntoView({ behavior: 'auto', block: 'center' });
+
+                    // 尝试点击
+                    let success = false;
+
+                    // 如果是链接或按钮，直接点击
+                    if (el.tagName === 'A' || el.tagName === 'BUTTON') {
+                        el.click();
+                        success = true;
+                        console.log('[PAGINATION] ✓ Clicked', el.tagName);
+                    }
+                    // 如果是li，查找内部的a标签
+                    else if (el.tagName === 'LI') {
+                        const link = el.querySelector('a');
+                        if (link) {
+                            link.click();
+                            success = true;
+                            console.log('[PAGINATION] ✓ Clicked inner <a> in <li>');
+                        } else {
+                            // 如果没有a标签，直接点击li
+                            el.click();
+                            success = true;
+                            console.log('[PAGINATION] ✓ Clicked <li> directly');
+                        }
+                    }
+                    // 其他元素，尝试触发点击事件
+                    else {
+                        const clickEvent = new MouseEvent('click', {
+                            bubbles: true,
+                            cancelable: true,
+                            view: window
+                        });
+                        el.dispatchEvent(clickEvent);
+                        success = true;
+                        console.log('[PAGINATION] ✓ Dispatched click event');
+                    }
+
+                    if (success) {
+                        clicked = true;
+                        console.log('[PAGINATION] ✓ Successfully clicked page', targetPage);
+
+                        // 不在脚本内等待：由 wait_for（_PAGINATION_WAIT_FOR）判断新页内容是否已渲染
+                        break;
+                    }
+                } else {
+                    console.log('[PAGINATION] Page', targetPage, 'is already active, skipping');
+                }
+            }
+        }
+
+        // 方法2: 如果方法1失败，尝试在整个页面中查找（更宽松的匹配）
+        if (!clicked) {
+            console.log('[PAGINATION] Method 1 failed, trying broader search...');
+
+            // 查找所有包含数字的元素
+            const numberElements = Array.from(document.querySelectorAll('*')).filter(el => {
+                const text = (el.textContent || '').trim();
+                return text === targetPage && 
+                       el.offsetParent !== null && // 元素可见
+                       (el.tagName === 'A' || el.tagName === 'BUTTON' || el.tagName === 'LI' || el.tagName === 'SPAN');
+            });
+
+            console.log('[PAGINATION] Found', numberElements.length, 'potential page buttons');
+
+            for (let el of numberElements) {
+                const isActive = el.classList.contains('active') || 
+                               el.classList.contains('current');
+
+                if (!isActive) {
+                    el.scrollIntoView({ behavior: 'auto', block: 'center' });
+
+                    if (el.tagName === 'A' || el.tagName === 'BUTTON') {
+                        el.click();
+                    } else if (el.tagName === 'LI') {
+                        const link = el.querySelector('a');
+                        if (link) link.click();
+                        else el.click();
+                    } else {
+                        el.dispatchEvent(new MouseEvent('click', { bubbles: true }));
+                    }
+
+                    clicked = true;
+                    console.log('[PAGINATION] ✓ Clicked via method 2');
+                    break;
+                }
+            }
+        }
+
+        if (!clicked) {
+            console.error('[PAGINATION] ✗ Failed to click page', targetPage);
+            // 调试：显示页面上所有可能的页码
+            const allNumbers = Array.from(document.querySelectorAll('*'))
+                .map(el => (el.textContent || '').trim())
+                .filter(text => /^\\d+$/.test(text) && parseInt(text) > 0 && parseInt(text) < 1000)
+                .filter((v, i, a) => a.indexOf(v) === i) // 去重
+                .slice(0, 20);
+            console.log('[PAGINATION] Available page numbers on page:', allNumbers);
+            return false;
+        }
+
+        console.log('[PAGINATION] ✓ Page navigation completed');
+        return true;
+    } catch (error) {
+        console.error('[PAGINATION] Error:', error);
+        return false;
+    }
+})();
+"""
+
+
+# ============================================================================
+# 详情页解析用的正则表达式（模块加载时编译一次，_parse_detail_page 中直接复用）
+# ============================================================================
+# 面包屑模式：更灵活，支持6-7个层级，保留"|"分隔符用于district_level2
+_BREADCRUMB_PATTERNS = [re.compile(p) for p in (
+    r'主頁\s+買樓\s+新界西\s+([^\s]+(?:\s*\|\s*[^\s]+)?)\s+([^\s]+)\s+([^\s]+(?:\s*\([^\)]+\))?)?',  # 主頁 買樓 新界西 荃灣 | 麗城 荃景圍 荃灣中心瀋陽樓 (19座)
+    r'主頁\s+買樓\s+新界東\s+([^\s]+(?:\s*\|\s*[^\s]+)?)\s+([^\s]+)\s+([^\s]+)',  # 主頁 買樓 新界東 大埔 白石角 逸瓏灣
+    r'主頁\s+買樓\s+新界西\s+([^\s]+)\s+([^\s]+)\s+([^\s]+)\s+([^\s]+)',  # 主頁 買樓 新界西 屯門 屯門北 大興花園
+    r'主頁\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)',  # 6个层级（包含主頁）
+    r'主頁\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)',  # 7个层级（包含主頁）
+    r'買樓\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)',  # 从買樓开始，5个层级
+    r'買樓\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)',  # 从買樓开始，6个层级
+)]
+
+# 页面文本中的面包屑序列（方法5备用）
+_BREADCRUMB_SEQUENCE_PATTERNS = [re.compile(p) for p in (
+    r'主頁\s+買樓\s+新界西\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)',
+    r'主頁\s+買樓\s+新界東\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)',
+    r'買樓\s+新界西\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)',
+    r'買樓\s+新界東\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)',
+    # 更灵活的模式，允许中间有其他文本
+    r'新界西[^\s]*([^\s|]{2,10})[^\s]*([^\s|]{2,10})[^\s]*([^\s|]{2,10})',
+    r'新界東[^\s]*([^\s|]{2,10})[^\s]*([^\s|]{2,10})[^\s]*([^\s|]{2,10})',
+)]
+
+
+def _union_pattern(patterns):
+    """把多个模式合并为一个带命名分组（alt0、alt1...）的交替模式，扫描一遍即可找到最左边的匹配"""
+    return re.compile('|'.join(f'(?P<alt{i}>{p.pattern})' for i, p in enumerate(patterns)))
+
+
+_BREADCRUMB_UNION = _union_pattern(_BREADCRUMB_PATTERNS)
+_BREADCRUMB_SEQUENCE_UNION = _union_pattern(_BREADCRUMB_SEQUENCE_PATTERNS)
+
+
+def _iter_first_matches(text, patterns, union):
+    """
+    按 patterns 的顺序依次给出每个模式在 text 中的首个匹配（跳过不匹配的模式），
+    结果与逐个 pattern.search(text) 相同。
+
+    先用合并后的 union 扫描一遍：没有匹配时所有模式都不匹配，直接返回；
+    匹配到第 k 个模式（m.lastgroup == f'alt{k}'）于位置 pos 时，
+    排在它前面的模式在 pos 及之前都不可能匹配，其余模式也不会在 pos 之前匹配，
+    因此只需从 pos（或 pos+1）开始继续查找，pos 之前的文本不再重复扫描。
+    """
+    m = union.search(text)
+    if not m:
+        return
+    pos = m.start()
+    hit = int(m.lastgroup[3:])
+    for i, pattern in enumerate(patterns):
+        if i < hit:
+            match = pattern.search(text, pos + 1)
+        elif i == hit:
+            match = pattern.match(text, pos)
+        else:
+            match = pattern.search(text, pos)
+        if match:
+            yield match
+
+# __NUXT__ 中的 paths 数组及其 label / path 字段
+_PATHS_RE = re.compile(r'paths:\s*\[([^\]]+)\]')
+_LABEL_FIELD_RE = re.compile(r'label:"([^"]+)"')
+_PATH_FIELD_RE = re.compile(r'path:"([^"]+)"')
+
+_ZUO_RE = re.compile(r'^\d+座$')  # 座数（如"2座"）
+_QI_RE = re.compile(r'^\d+期$')  # 期数（如"1期"）
+_WS_RE = re.compile(r'\s+')
+_PIPE_ITEM_RE = re.compile(r'([^\s]+\s*\|\s*[^\s]+)')  # "荃灣 | 麗城"
+_PAREN_RE = re.compile(r'[()（）]')
+
+# 价格：以"萬"/"万"结尾的模式需要乘以10000（见 _parse_detail_page）
+_PRICE_PATTERNS = [re.compile(p) for p in (
+    r'\$(\d+(?:,\d+)*)\s*萬',  # $数字萬（优先匹配带$的，通常是实际价格）
+    r'(\d+(?:,\d+)*)\s*萬',    # 数字萬
+    r'(\d+(?:,\d+)*)\s*万',    # 数字万
+    r'HK\$\s*(\d+(?:,\d+)*)',  # HK$数字
+)]
+_PRICE_DISPLAY_RE = re.compile(r'\$(\d+(?:,\d+)*)\s*[萬万]')
+_WAN_PRICE_RE = re.compile(r'(\d+(?:,\d+)*)\s*[萬万]')
+_NUMBER_RE = re.compile(r'(\d+(?:,\d+)*)')
+_DECIMAL_RE = re.compile(r'[\d.]+')
+
+_MORTGAGE_PATTERNS = [re.compile(p) for p in (
+    r'月供[：:]\s*\$?\s*([\d,]+)',  # 月供：$30,885
+    r'月供\s*\$?\s*([\d,]+)',      # 月供 $30,885
+    r'月供[：:]\s*([\d,]+)',      # 月供：30,885
+)]
+
+# 从描述中提取标题：屋苑名称 + 期数 + 座数 + 楼层 + 室号
+_TITLE_PATTERNS = [re.compile(p) for p in (
+    r'([^\s]{2,15}(?:花園|苑|邨|中心|居|軒|灣|城|山|臺|台|半山|新|豪|庭|門))\s*(\d+期)?\s*(\d+座)?\s*([低中高]層)?\s*([A-Z]室)?',
+    r'([^\s]{2,15})\s*(\d+期)\s*(\d+座)\s*([低中高]層)\s*([A-Z]室)',
+    r'([A-Z]\.?[A-Z]?[^\s]{0,10})\s*(高層|中層|低層)',  # Y.I高層
+)]
+
+_ADDRESS_RE = re.compile(r'[^\s]{2,10}(?:里|路|街|道|邨|村|苑|花園|花園|中心)')
+# 屋苑名称 + 期数 + 座/居 + 街道
+_FULL_ADDRESS_RE = re.compile(r'([^\s]{2,15}(?:花園|苑|邨|中心|居|軒|灣|城|山|臺|台|半山|新|豪|庭))\s*(?:\d+期[A-Z]?)?\s*([^\s]{2,10}(?:居|座|軒|苑))?\s*([^\s]{2,10}(?:徑|路|街|道|里))')
+_STREET_PATTERNS = [re.compile(p) for p in (
+    r'([^\s]{2,15}(?:徑|路|街|道|里))',  # 街道名称
+    r'([^\s]{2,10}(?:徑|路|街|道))',     # 简化版
+)]
+_AREA_NAME_PATTERNS = [re.compile(p) for p in (
+    r'([^\s]{2,15}(?:花園|苑|邨|中心|居|軒|灣|城|山|臺|台|半山|新|豪|庭))',  # 屋苑名称
+    r'([^\s]{2,10}(?:花園|苑|邨))',  # 简化版
+)]
+
+_BEDROOM_RE = re.compile(r'(\d+)\s*房')
+_ROOM_RE = re.compile(r'間隔\s*(\d+)\s*房|(\d+)\s*房')  # "間隔X 房"或"X房"
+_BATHROOM_PATTERNS = [re.compile(p) for p in (
+    r'(\d+)\s*套房',  # "1 套房"
+    r'(\d+)\s*浴室',  # "2 浴室"
+    r'\((\d+)\s*套房\)',  # "(1 套房)"
+    r'(\d+)\s*廁',    # "2 廁"
+)]
+_FLOOR_PATTERNS = [re.compile(p) for p in (
+    r'(\d+)\s*樓',
+    r'(\d+)\s*层',
+    r'(\d+)\s*層',
+    r'(\d+)\s*F',
+    r'(\d+)\s*座',  # 有时用"座"表示
+)]
+_ORIENTATION_PATTERNS = [re.compile(p) for p in (
+    r'座向([東西南北東南東北西南西北]+)',
+    r'向([東西南北東南東北西南西北]+)',
+    r'([東西南北東南東北西南西北]+)向',
+)]
+_AGE_PATTERNS = [re.compile(p) for p in (
+    r'(\d+)\s*年',
+    r'(\d+)\s*歲',
+    r'樓齡[：:]\s*(\d+)',
+    r'屋齡[：:]\s*(\d+)',
+)]
+_UPDATE_DATE_RE = re.compile(r'更新日期[：:]\s*(\d{4}[-/]\d{1,2}[-/]\d{1,2})')
+
+
+def _substring_re(keywords) -> re.Pattern:
+    """把"包含其中任一子串"的判断编译成一个正则：_substring_re(kws).search(text) 等价于 any(kw in text for kw in kws)"""
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+
+# 面包屑解析用的常量（模块级只构建一次；精确匹配用 frozenset，子串匹配用预编译正则）
+_CATEGORIES = frozenset({'買樓', '租樓', '成交', '新盤', '新盘'})
+_REGIONS = frozenset({'新界西', '新界東', '新界东', '港島', '港岛', '九龍', '九龙', '新界'})
+_HK_DISTRICTS = frozenset({
+    # New Territories
+    '大埔', '荃灣', '屯門', '元朗', '沙田', '北區', '西貢', '葵青', '離島',
+    # Hong Kong Island
+    '中西區', '東區', '南區', '灣仔', '九龍城', '觀塘', '深水埗', '黃大仙', '油尖旺',
+})
+# 包含任一区域名称（繁简体）即视为district
+_HK_DISTRICT_RE = _substring_re((
+    '屯門', '元朗', '沙田', '大埔', '荃灣', '北區', '西貢', '葵青', '離島',
+    '屯门', '荃湾', '北区', '西贡', '离岛',
+    '中西區', '東區', '南區', '灣仔', '九龍城', '觀塘', '深水埗', '黃大仙', '油尖旺',
+))
+
+# 面包屑中混入的页面其它区域文字（二维码提示、分行网络等）
+_INVALID_KEYWORDS = ('QRcode', 'WeChat', '掃描', '網絡', '地產', '接收', '心水', '樓盤', '最新')
+_INVALID_KW_RE = _substring_re(_INVALID_KEYWORDS)
+# 导航链接还要排除用户菜单项（我的優惠、搜尋條件、樓盤比較等）
+_NAV_INVALID_KW_RE = _substring_re(_INVALID_KEYWORDS + ('優惠', '關注', '條件', '比較'))
+# 方法1旧格式中的非面包屑项
+_OLD_FORMAT_INVALID_RE = _substring_re((
+    '網上', '搵樓', '地圖', '更多', 'More', '主頁', '主页',
+    '分行網絡', '中原地產', '接收心水樓盤最新',
+    '使用WeChat掃描QRcode', '中原薈', '一手新盤',
+) + _INVALID_KEYWORDS)
+# 面包屑容器中的分隔符和无效项（方法4）
+_BREADCRUMB_INVALID_ITEMS = frozenset({
+    '>', '/', '»', '',
+    '分行網絡', '中原地產', '接收心水樓盤最新',
+    '使用WeChat掃描QRcode', '中原薈', '一手新盤',
+    'QRcode', 'WeChat', '掃描', '網絡', '地產', '接收',
+})
+# 不能作为estate_name的项
+_INVALID_FOR_ESTATE = frozenset({
+    '分行網絡', '中原地產', '接收心水樓盤最新', '中原薈', '一手新盤',
+    '立即登入', '登入/註冊', '立即註冊', '登入', '註冊', '我的優惠', '我的關注', '屋苑',
+})
+_ESTATE_INVALID_KW_RE = _substring_re(('登入', '註冊', '優惠', '關注', 'QRcode', 'WeChat', '掃描', '網絡', '地產', '接收'))
+_NAV_ESTATE_INVALID_KW_RE = _substring_re((
+    'QRcode', 'WeChat', '掃描', '網絡', '地產', '接收', '優惠', '關注', '條件', '比較', '登入', '註冊',
+))
+# 方法5中不是导航的链接文本
+_INVALID_NAV_ITEMS = frozenset({
+    '加入比較', '加入比较', '更多', 'More', '分享', '取消', '明白',
+    '屋苑', '分行網絡', '中原地產', '接收心水樓盤最新',
+})
+_OLD_NAV_INVALID_ITEMS = frozenset({
+    '屋苑', '我的優惠', '我的關注', '搜尋條件', '樓盤比較',
+    '按揭轉介', '按揭計算', '中原Apps', '更多', '聯絡我們',
+    '分行網絡', '中原地產', '接收心水樓盤最新', '中原薈', '一手新盤',
+})
+_NAV_HREF_RE = _substring_re(('/list/', '/district/', '/estate/', '/findproperty/'))
+_NAV_TEXT_RE = _substring_re(('買樓', '租樓', '新界', '港島', '九龍', '荃灣', '大埔', '屯門', '御凱', '逸瓏灣', '映日灣', '麗城'))
+
+
+
+def _iter_nuxt_breadcrumb_items(html: str):
+    """
+    在原始HTML中查找 __NUXT__ 的 paths 数组，按出现顺序逐个产出面包屑项列表（可能为空）
+
+    直接用正则扫描HTML字符串，不需要构建DOM或提取页面文本。
+    """
+    for paths_match in _PATHS_RE.finditer(html or ''):
+        paths_content = paths_match.group(1)
+
+        # 成交(transaction-detail) 特别点：
+        # - paths 里「主頁 / 成交」通常在 label:"主頁"/label:"成交" 中
+        # - 而后续层级在 path:"九龍_..."/path:"南昌站_..." 中
+        # 因此这里同时抽 label 字面量 + path 显示文本，按出现顺序拼成 breadcrumb_items
+        breadcrumb_items = []
+
+        # 1) 先抽取 label:"..."（只会抓到字面量，不会抓到 label:k 这种变量引用）
+        for lb in _LABEL_FIELD_RE.findall(paths_content):
+            if lb:
+                breadcrumb_items.append(lb.strip())
+
+        # 2) 再抽取 path:"..." 并取 '_' 前的显示文本
+        for path in _PATH_FIELD_RE.findall(paths_content):
+            if '_' in path:
+                display_text = path.split('_')[0].strip()
+                if display_text:
+                    breadcrumb_items.append(display_text)
+
+        yield breadcrumb_items
+
+
+# ============================================================================
+# 详情页面包屑提取的 lxml 快速路径（方法3-4）
+# ============================================================================
+# BeautifulSoup 为每个节点创建 Python 对象，find_all('div') 后逐个 get_text 时整棵子树会被反复遍历；
+# 安装了 lxml 时改用 C 实现的 lxml 树 + 预编译 XPath，BeautifulSoup 仅作为未安装 lxml 时的回退
+
+# 方法4中包含完整面包屑文本的div：同时包含"主頁"、"買樓"和其中一个地区
+_BREADCRUMB_HOME_RE = re.compile('主頁')
+_BREADCRUMB_REGION_RE = _substring_re(('新界西', '新界東', '港島', '九龍'))
+
+
+def _is_breadcrumb_text(text: str) -> bool:
+    """文本是否包含完整的面包屑模式（主頁 + 買樓 + 地区）"""
+    return '主頁' in text and '買樓' in text and bool(_BREADCRUMB_REGION_RE.search(text))
+
+if HAS_LXML:
+    _LXML_HTML_PARSER = etree.HTMLParser(encoding='utf-8')
+
+    # 与方法4中 breadcrumb_selectors 一一对应，每个选择器只取文档中的第一个匹配（同 select_one）
+    _BREADCRUMB_CONTAINER_XPATHS = [etree.XPath(p) for p in (
+        "(//*[contains(concat(' ', normalize-space(@class), ' '), ' breadcrumb ')])[1]",   # .breadcrumb
+        "(//*[contains(concat(' ', normalize-space(@class), ' '), ' breadcrumbs ')])[1]",  # .breadcrumbs
+        "(//*[contains(@class, 'breadcrumb')])[1]",                                        # [class*="breadcrumb"]
+        "(//*[contains(concat(' ', normalize-space(@class), ' '), ' nav-breadcrumb ')])[1]",  # .nav-breadcrumb
+        "(//nav[contains(@aria-label, 'breadcrumb')])[1]",                                 # nav[aria-label*="breadcrumb"]
+        "(//*[contains(concat(' ', normalize-space(@class), ' '), ' path ')])[1]",         # .path
+        "(//*[contains(@class, 'path')])[1]",                                              # [class*="path"]
+    )]
+    # 包含面包屑关键词的div候选（字符串值包含关键词是 get_text 包含关键词的必要条件，命中后再精确校验）
+    _BREADCRUMB_DIV_XPATH = etree.XPath(
+        "//div[contains(., '主頁') and contains(., '買樓') and "
+        "(contains(., '新界西') or contains(., '新界東') or contains(., '港島') or contains(., '九龍'))]"
+    )
+    # 面包屑容器内的项：a, span, li, [class*="item"], [class*="link"]
+    _BREADCRUMB_ITEM_XPATH = etree.XPath(
+        ".//*[self::a or self::span or self::li or contains(@class, 'item') or contains(@class, 'link')]"
+    )
+    # 元素内的文本节点（与 BeautifulSoup 的 get_text 一样不包含 script/style/template 内的文本和注释）
+    _ELEMENT_TEXT_XPATH = etree.XPath('.//text()[not(ancestor::script or ancestor::style or ancestor::template)]')
+
+
+def _lxml_text(elem, separator: str = '', strip: bool = False) -> str:
+    """lxml 元素的 get_text(separator, strip) 等价实现（XPath 在C层取出文本节点）"""
+    strings = _ELEMENT_TEXT_XPATH(elem)
+    if strip:
+        strings = (s for s in map(str.strip, strings) if s)
+    return separator.join(strings)
+
+
+def _parse_lxml_tree(html: str):
+    """用 lxml 解析HTML，未安装 lxml 或文档为空时返回 None"""
+    if not HAS_LXML or not html:
+        return None
+    return etree.fromstring(html.encode('utf-8'), _LXML_HTML_PARSER)
+
+
+def _soup_text(tag) -> str:
+    """
+    BeautifulSoup 元素的 get_text(strip=True)
+
+    元素只有一个普通文本子节点时（大部分链接、span）直接取 tag.string，不再递归遍历子树；
+    注释、script 等特殊字符串不计入 get_text，这些情况仍交给 get_text 处理。
+    """
+    string = tag.string
+    if type(string) is NavigableString:
+        return string.strip()
+    return tag.get_text(strip=True)
+
+
+def _anchor_links(tree, soup) -> List[tuple]:
+    """所有带 href 的 <a> 的 (href, 去空白文本)，按文档顺序"""
+    if tree is not None:
+        return [(a.get('href'), _lxml_text(a, strip=True)) for a in tree.iter('a') if a.get('href') is not None]
+    return [(a.get('href', ''), _soup_text(a)) for a in soup.find_all('a', href=True)]
+
+
+def _find_breadcrumb_div(soup):
+    """
+    按文档顺序返回第一个文本包含完整面包屑模式的div（同 find_all('div') 后逐个 get_text 检查）
+
+    符合条件的div一定包含某个含"主頁"的文本节点，因此只需检查这些文本节点的div祖先：
+    按文本节点的顺序、每个节点的祖先由外到内检查，第一个符合的就是文档顺序中的第一个。
+    """
+    checked = set()
+    for string in soup.find_all(string=_BREADCRUMB_HOME_RE):
+        for div in reversed(string.find_parents('div')):
+            if id(div) in checked:
+                continue
+            checked.add(id(div))
+            if _is_breadcrumb_text(div.get_text(separator=' ', strip=True)):
+                return div
+    return None
+
+
+def _find_breadcrumb_container(tree, soup, selectors, page_text: str = '') -> Optional[tuple]:
+    """
+    查找面包屑容器
+
+    先按 selectors 顺序找第一个有文本的标准面包屑元素，找不到时查找包含完整面包屑文本的div。
+    page_text 为整页文本（' '.join(soup.strings)），不包含完整面包屑模式时不会有符合的div，直接跳过查找。
+
+    Returns:
+        (容器文本（空格分隔）, 容器内各项的去空白文本列表)，未找到时返回 None
+    """
+    has_breadcrumb_text = _is_breadcrumb_text(page_text)
+    if tree is not None:
+        elem = None
+        for xpath in _BREADCRUMB_CONTAINER_XPATHS:
+            found = xpath(tree)
+            if found and _lxml_text(found[0], strip=True):
+                elem = found[0]
+                break
+        if elem is None and has_breadcrumb_text:
+            for div in _BREADCRUMB_DIV_XPATH(tree):
+                if _is_breadcrumb_text(_lxml_text(div, ' ', strip=True)):
+                    elem = div
+                    break
+        if elem is None:
+            return None
+        items = [_lxml_text(item, strip=True) for item in _BREADCRUMB_ITEM_XPATH(elem)]
+        return _lxml_text(elem, ' ', strip=True), items
+
+    elem = None
+    for selector in selectors:
+        elem = soup.select_one(selector)
+        if elem:
+            # 检查元素是否有实际内容（不是空容器）
+            if elem.get_text(strip=True):
+                break
+            else:
+                elem = None
+
+    # 如果标准面包屑元素为空，尝试查找包含面包屑文本的div
+    if not elem and has_breadcrumb_text:
+        elem = _find_breadcrumb_div(soup)
+
+    if not elem:
+        return None
+    items = [_soup_text(item) for item in elem.select('a, span, li, [class*="item"], [class*="link"]')]
+    return elem.get_text(separator=' ', strip=True), items
+
 
 class CentanetCrawler:
     """
@@ -73,32 +698,192 @@ class CentanetCrawler:
     属性：
     - config: 爬虫配置（从sites_config导入）
     - output_dir: 输出目录路径
-    - crawled_urls: 已爬取的URL集合（用于去重）
+    - crawled_urls: 已爬取的URL集合（用于去重；安装了 pybloom-live 时为可扩容的Bloom过滤器）
+    - incremental: 是否增量爬取（跳过之前运行中已成功爬取的详情页）
     - properties: 提取的房产数据列表
     - failed_urls: 失败的URL列表（用于错误追踪）
+    
+    用法：
+        async with CentanetCrawler() as crawler:
+            await crawler.crawl_all(max_pages=5)
+    
+    所有请求共用 async with 打开的同一个浏览器实例；未使用 async with 时，
+    每次调用公开方法会临时打开并关闭一个浏览器。
     """
     
-    def __init__(self, output_dir: str = "data/centanet"):
+    # 增量爬取历史（Bloom过滤器）的容量和误判率
+    HISTORY_CAPACITY = 1_000_000
+    HISTORY_ERROR_RATE = 0.001
+    # 每成功爬取多少个详情页保存一次历史
+    HISTORY_SAVE_INTERVAL = 100
+    # 本次运行去重用的可扩容Bloom过滤器的初始容量和误判率
+    CRAWLED_INITIAL_CAPACITY = 100_000
+    CRAWLED_ERROR_RATE = 1e-5
+    
+    def __init__(self, output_dir: str = "data/centanet", incremental: bool = False):
         """
         初始化爬虫
         
         Args:
             output_dir: 数据输出目录，默认为 "data/centanet"
+            incremental: 是否增量爬取。开启后会从输出目录加载已爬取URL的历史，
+                        跳过之前已成功爬取的详情页，并在爬取结束时更新历史
         """
         self.config = CENTANET_CONFIG
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.crawled_urls = set()
+        # 本次运行的去重：安装了 pybloom-live 时用可扩容的Bloom过滤器，内存占用与URL长度无关；
+        # 误判率为 CRAWLED_ERROR_RATE（极少数未爬取的URL会被当作已爬取而跳过），否则用精确的集合
+        self.crawled_urls = ScalableBloomFilter(
+            initial_capacity=self.CRAWLED_INITIAL_CAPACITY,
+            error_rate=self.CRAWLED_ERROR_RATE,
+        ) if HAS_PYBLOOM else set()
+        self.incremental = incremental
+        # 跨运行的历史：安装了 pybloom-live 时用Bloom过滤器（每个URL约1字节），否则用文本文件保存的集合
+        self._history_file = self.output_dir / ("crawled.bloom" if HAS_PYBLOOM else "crawled_urls.txt")
+        self._crawl_history = self._load_crawl_history() if incremental else None
+        self._history_unsaved = 0
         self.properties: List[PropertyData] = []
         self.failed_urls = []
+        self._browser_config = BrowserConfig(
+            headless=True,
+            user_agent=self.config.user_agent,
+        )
+        self._crawler: Optional[AsyncWebCrawler] = None  # 共享浏览器实例（通过 async with 打开）
+        # async with 的嵌套层数：并发调用可能同时进入，只有最外层退出时才关闭浏览器
+        self._enter_depth = 0
+        self._crawler_lock = asyncio.Lock()
+    
+    async def __aenter__(self):
+        """
+        打开共享的浏览器实例
+        
+        列表页和详情页的爬取都复用这个实例，避免每次请求都冷启动一个新的浏览器。
+        用法: async with CentanetCrawler() as crawler: ...
+        可以重入：并发调用各自进入时共用同一个浏览器，浏览器启动完成后才对其他调用可见。
+        """
+        self._enter_depth += 1
+        try:
+            async with self._crawler_lock:
+                if self._crawler is None:
+                    crawler = AsyncWebCrawler(config=self._browser_config)
+                    await crawler.__aenter__()
+                    self._crawler = crawler
+        except BaseException:
+            self._enter_depth -= 1
+            raise
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        """退出最外层的 async with 时关闭共享的浏览器实例"""
+        self._enter_depth -= 1
+        if self._enter_depth == 0 and self._crawler is not None:
+            crawler, self._crawler = self._crawler, None
+            await crawler.__aexit__(exc_type, exc, tb)
+    
+    def _load_crawl_history(self):
+        """
+        加载增量爬取历史（之前运行中已成功爬取的详情页URL）
+        
+        Returns:
+            BloomFilter 或 set，支持 `url in history` 和 `history.add(url)`
+        """
+        if HAS_PYBLOOM:
+            if self._history_file.exists():
+                with open(self._history_file, 'rb') as f:
+                    history = BloomFilter.fromfile(f)
+                print(f"✓ 已加载增量爬取历史: {self._history_file}（约 {len(history)} 个URL）")
+                return history
+            return BloomFilter(capacity=self.HISTORY_CAPACITY, error_rate=self.HISTORY_ERROR_RATE)
+        
+        history = set()
+        if self._history_file.exists():
+            with open(self._history_file, 'r', encoding='utf-8') as f:
+                history.update(line.strip() for line in f if line.strip())
+            print(f"✓ 已加载增量爬取历史: {self._history_file}（{len(history)} 个URL）")
+        return history
+    
+    def _save_crawl_history(self):
+        """保存增量爬取历史到输出目录"""
+        if self._crawl_history is None:
+            return
+        if HAS_PYBLOOM:
+            with open(self._history_file, 'wb') as f:
+                self._crawl_history.tofile(f)
+        else:
+            with open(self._history_file, 'w', encoding='utf-8') as f:
+                f.writelines(url + "\n" for url in self._crawl_history)
+        self._history_unsaved = 0
+    
+    def _in_crawl_history(self, url: str) -> bool:
+        """URL是否在之前的运行中已成功爬取（仅增量模式）"""
+        return self._crawl_history is not None and url in self._crawl_history
+    
+    def _record_crawled(self, url: str):
+        """记录成功爬取的详情页URL，并定期保存历史"""
+        if self._crawl_history is None:
+            return
+        self._crawl_history.add(url)
+        self._history_unsaved += 1
+        if self._history_unsaved >= self.HISTORY_SAVE_INTERVAL:
+            self._save_crawl_history()
+    
+    def _extract_detail_hrefs(self, html: str) -> List[str]:
+        """
+        从列表页HTML中提取详情页链接
+        
+        安装了 lxml 时用 iterparse 流式读取 <a> 标签（不构建DOM树，比 html.parser 快得多），
+        否则使用 BeautifulSoup。
+        
+        Args:
+            html: 列表页HTML
+            
+        Returns:
+            去重后的详情页绝对URL列表（按页面中出现的顺序）
+        """
+        hrefs = None
+        if HAS_LXML:
+            try:
+                hrefs = list(_iter_anchor_hrefs(html))
+            except Exception:
+                hrefs = None  # 例如空文档，改用下面的方式
+        if hrefs is None:
+            soup = BeautifulSoup(html, HTML_PARSER)
+            hrefs = [link.get('href', '') for link in soup.find_all("a", href=True)]
+        
+        base_url = self.config.base_url
+        base_prefix = base_url.rstrip('/')
+        seen = set()
+        property_urls = []
+        for href in hrefs:
+            # 是详情页链接（对于成交页面，URL可能包含 /transaction/ 而不是 /detail/），且不属于排除的模式
+            if not href or not _DETAIL_LINK_RE.search(href) or _EXCLUDE_LINK_RE.search(href):
+                continue
+            href = str(href)
+            # 处理相对URL：普通的站内绝对路径直接拼接，其他情况才交给 urljoin 解析
+            if href.startswith('http'):
+                pass
+            elif _SIMPLE_PATH_RE.match(href):
+                href = base_prefix + href
+            else:
+                href = urljoin(base_url, href)
+            # 集合O(1)去重。已爬取过的详情页（包括增量历史中的）也要返回：
+            # 翻页逻辑以空列表判断是否到了最后一页，跳过已爬取URL的工作由 crawl_detail_page(s) 负责
+            if href not in seen:
+                seen.add(href)
+                property_urls.append(href)
+        return property_urls
     
     @staticmethod
+    @functools.lru_cache(maxsize=8192)
     def _parse_breadcrumb_fields(breadcrumb: str) -> tuple:
         """
         从breadcrumb字符串中解析各个字段
         
         设计说明：
         ----------
+        同一屋苑的房源breadcrumb完全相同，结果用 lru_cache 缓存（输入为字符串、输出为元组，可安全复用）；
+        不同breadcrumb中重复出现的各段字符串通过 sys.intern 共用。
         根据用户要求，从格式化的breadcrumb字符串中提取字段：
         - category: breadcrumb的第2个字符串（移除"主頁"后索引0）
         - region: breadcrumb的第3个字符串（索引1）
@@ -123,23 +908,17 @@ class CentanetCrawler:
         
         # 移除 "主頁" 如果存在
         if parts and parts[0] == '主頁':
-            parts = parts[1:]
-        
-        # 根据用户要求映射字段
-        category = parts[0] if len(parts) > 0 and parts[0] else None
-        region = parts[1] if len(parts) > 1 and parts[1] else None
-        district_level2 = parts[2] if len(parts) > 2 and parts[2] else None
-        sub_district = parts[3] if len(parts) > 3 and parts[3] else None
-        
-        # estate_name 总是取最后一个部分（如果有的话）
-        if len(parts) > 4:
-            estate_name = parts[-1] if parts[-1] else None
-        elif len(parts) == 4:
-            estate_name = parts[3] if parts[3] else None
-        else:
-            estate_name = None
+            del parts[0]
+        
+        # 根据用户要求映射字段（不足4段时用 None 补齐）
+        category, region, district_level2, sub_district = (parts + [None] * 4)[:4]
+        
+        # estate_name 总是取最后一个部分（至少有4段时）
+        estate_name = parts[-1] if len(parts) >= 4 else None
         
-        return category, region, district_level2, sub_district, estate_name
+        # 驻留字符串：相同的类别/地区/屋苑名在所有记录间共用同一个对象（非ASCII字符串不会被自动驻留）
+        return tuple(sys.intern(value) if value else None
+                     for value in (category, region, district_level2, sub_district, estate_name))
     
     @staticmethod
     def _generate_breadcrumb(category: str, region: str, district: str, 
@@ -159,20 +938,10 @@ class CentanetCrawler:
         Returns:
             str: 格式化的breadcrumb字符串，如 "主頁 > 買樓 > 新界西 > 屯門 > 屯門市中心 > 瓏門"
         """
-        breadcrumb_parts = ['主頁']
-        if category:
-            breadcrumb_parts.append(category)
-        if region:
-            breadcrumb_parts.append(region)
-        if district:
-            breadcrumb_parts.append(district)
-        if district_level2:
-            breadcrumb_parts.append(district_level2)
-        if sub_district:
-            breadcrumb_parts.append(sub_district)
-        if estate_name:
-            breadcrumb_parts.append(estate_name)
-        
+        breadcrumb_parts = [
+            part for part in ('主頁', category, region, district, district_level2, sub_district, estate_name)
+            if part
+        ]
         return ' > '.join(breadcrumb_parts) if len(breadcrumb_parts) > 1 else None
         
     async def crawl_list_page(self, url: str, page_num: int = 1, crawler: Optional[AsyncWebCrawler] = None) -> List[str]:
@@ -188,24 +957,91 @@ class CentanetCrawler:
         Args:
             url: 列表页URL（对于所有页面都使用相同的URL）
             page_num: 页码（1, 2, 3...）
+            crawler: 可选的AsyncWebCrawler实例，默认使用共享浏览器（翻页必须在同一浏览器会话中）
             
         Returns:
             房产详情页URL列表
         """
-        # 如果没有传入crawler，创建新的
-        # 如果传入了crawler，使用现有的（确保在同一浏览器会话中）
-        browser_config = BrowserConfig(
-            headless=True,
-            user_agent=self.config.user_agent,
-        )
-        
-        # 如果传入了crawler，直接使用；否则创建新的
-        if crawler is not None:
-            # 使用现有的crawler（在同一浏览器会话中）
-            return await self._crawl_list_page_with_crawler(crawler, url, page_num)
+        # 未传入crawler时，调用期间持有一层共享浏览器（未打开时临时打开），并发的其他调用退出时不会关闭它
+        if crawler is None:
+            async with self:
+                return await self._crawl_list_page_with_crawler(self._crawler, url, page_num)
+        
+        return await self._crawl_list_page_with_crawler(crawler, url, page_num)
+
+    async def crawl_list_pages_parallel(
+        self,
+        urls: List[str],
+        concurrency: int = 5,
+        max_pages: int = 1
+    ) -> Dict[str, List[str]]:
+        """
+        并发爬取多个互不相关的列表页URL（不同类别/地区）
+
+        设计说明：
+        ----------
+        - 同一URL内的分页依赖同一会话中的点击，仍按页顺序执行
+        - 不同URL之间互相独立，使用 asyncio.gather 并发执行
+        - 通过 Semaphore 限制同时进行的列表页数量
+        - 共享单个 AsyncWebCrawler 实例（每个URL使用各自的 session_id）
+        - return_exceptions=True：单个URL失败不会取消其他任务
+
+        Args:
+            urls: 列表页URL列表
+            concurrency: 最大并发URL数，默认为5
+            max_pages: 每个URL最多爬取的页数，默认为1
+
+        Returns:
+            {列表页URL: 房产详情页URL列表}，失败的URL对应空列表
+        """
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return {}
+
+        # 未打开共享浏览器时，临时打开一个供本次调用使用
+        if self._crawler is None:
+            async with self:
+                return await self.crawl_list_pages_parallel(urls, concurrency, max_pages)
+
+        sem = asyncio.Semaphore(max(1, concurrency))
+        crawler = self._crawler
+        async def crawl_one(url: str) -> List[str]:
+            async with sem:
+                property_urls = []
+                for page in range(1, max_pages + 1):
+                    page_urls = await self._crawl_list_page_with_crawler(crawler, url, page) or []
+                    if not page_urls:
+                        break
+                    property_urls.extend(page_urls)
+                    if page < max_pages:
+                        await asyncio.sleep(self.config.rate_limit)
+                return property_urls
+
+        results = await asyncio.gather(*(crawl_one(url) for url in urls), return_exceptions=True)
+
+        url_map = {}
+        for url, result in zip(urls, results):
+            if isinstance(result, BaseException):
+                print(f"  ✗ 列表页爬取失败: {url} - {result}")
+                self.failed_urls.append(url)
+                url_map[url] = []
+            else:
+                url_map[url] = list(dict.fromkeys(result))
+        return url_map
+
+    async def _safe_arun(self, crawler: AsyncWebCrawler, url: str, **kwargs):
+        """
+        调用 crawler.arun，并把异常和 None 统一转换为 success=False 的结果
         
-        async with AsyncWebCrawler(config=browser_config) as new_crawler:
-            return await self._crawl_list_page_with_crawler(new_crawler, url, page_num)
+        调用方只需检查 result.success；失败时 result.html 为空字符串，result.error_message 为错误信息。
+        """
+        try:
+            result = await crawler.arun(url=url, **kwargs)
+        except Exception as e:
+            return _failed_result(str(e))
+        if result is None:
+            return _failed_result("result为None")
+        return result
     
     async def _crawl_list_page_with_crawler(self, crawler: AsyncWebCrawler, url: str, page_num: int) -> List[str]:
         """
@@ -224,8 +1060,8 @@ class CentanetCrawler:
 
         # 关键：为列表页建立稳定 session_id，确保分页点击/页面状态在同一 Page 内持续
         # 否则每次 arun 都可能新开 Page，导致翻页失效、或出现 HTML 过短（如 39 字符占位壳）
-        from crawl4ai.async_configs import CrawlerRunConfig
-        session_id = f"centanet_list_{hashlib.md5(url.encode('utf-8')).hexdigest()[:10]}"
+        # session_id 只需在同一列表 URL 内保持稳定，与持久化数据无关
+        session_id = f"centanet_list_{hashlib.blake2b(url.encode('utf-8'), digest_size=5).hexdigest()}"
 
         # 标记：成交列表页（transaction）与买/租页面的“可提取链接方式”不同
         is_transaction_list = "/findproperty/list/transaction" in url.lower() or url.lower().endswith("/list/transaction")
@@ -246,7 +1082,7 @@ class CentanetCrawler:
             })();
             """
 
-            config = CrawlerRunConfig(
+            config = _make_run_config(
                 session_id=session_id,
                 js_code=warmup_js,
                 delay_before_return_html=wait_time,
@@ -254,8 +1090,9 @@ class CentanetCrawler:
                 override_navigator=True,
                 magic=True,
             )
-            result = await crawler.arun(
-                url=url,
+            result = await self._safe_arun(
+                crawler,
+                url,
                 config=config,
                 timeout=max(self.config.timeout, 90 if is_transaction_list else 60),
                 wait_for="networkidle",
@@ -271,243 +1108,64 @@ class CentanetCrawler:
             # 构建JavaScript代码来点击分页按钮
             # 根据Centanet网站结构，分页按钮显示为简单的数字（如 "1", "2", "3", "4", "417"）
             # 这些通常是列表项（<li>）或链接（<a>），位于页面底部的分页区域
-            js_code = f"""
-                (async () => {{
-                    try {{
-                        console.log('[PAGINATION] Starting pagination for page {page_num}...');
-                        
-                        // 等待页面稳定
-                        await new Promise(resolve => setTimeout(resolve, 2000));
-                        
-                        const targetPage = String({page_num});
-                        let clicked = false;
-                        
-                        // 方法1: 查找所有包含目标页码的元素
-                        // Centanet的分页按钮通常是简单的数字文本
-                        const allClickable = Array.from(document.querySelectorAll('a, button, li, span, div'));
-                        
-                        console.log('[PAGINATION] Searching', allClickable.length, 'elements for page', targetPage);
-                        
-                        for (let el of allClickable) {{
-                            const text = (el.textContent || el.innerText || '').trim();
-                            
-                            // 精确匹配页码（只匹配纯数字，不包含其他字符）
-                            if (text === targetPage) {{
-                                // 检查是否是当前页（不应该点击当前页）
-                                const isActive = el.classList.contains('active') || 
-                                               el.classList.contains('current') ||
-                                               el.classList.contains('selected') ||
-                                               el.getAttribute('aria-current') === 'page';
-                                
-                                if (!isActive) {{
-                                    console.log('[PAGINATION] Found page button:', text, 'tag:', el.tagName);
-                                    
-                                    // 滚动到元素
-                                    el.scrollIntoView({{ behavior: 'smooth', block: 'center' }});
-                                    await new Promise(resolve => setTimeout(resolve, 1000));
-                                    
-                                    // 尝试点击
-                                    let success = false;
-                                    
-                                    // 如果是链接或按钮，直接点击
-                                    if (el.tagName === 'A' || el.tagName === 'BUTTON') {{
-                                        el.click();
-                                        success = true;
-                                        console.log('[PAGINATION] ✓ Clicked', el.tagName);
-                                    }}
-                                    // 如果是li，查找内部的a标签
-                                    else if (el.tagName === 'LI') {{
-                                        const link = el.querySelector('a');
-                                        if (link) {{
-                                            link.click();
-                                            success = true;
-                                            console.log('[PAGINATION] ✓ Clicked inner <a> in <li>');
-                                        }} else {{
-                                            // 如果没有a标签，直接点击li
-                                            el.click();
-                                            success = true;
-                                            console.log('[PAGINATION] ✓ Clicked <li> directly');
-                                        }}
-                                    }}
-                                    // 其他元素，尝试触发点击事件
-                                    else {{
-                                        const clickEvent = new MouseEvent('click', {{
-                                            bubbles: true,
-                                            cancelable: true,
-                                            view: window
-                                        }});
-                                        el.dispatchEvent(clickEvent);
-                                        success = true;
-                                        console.log('[PAGINATION] ✓ Dispatched click event');
-                                    }}
-                                    
-                                    if (success) {{
-                                        clicked = true;
-                                        console.log('[PAGINATION] ✓ Successfully clicked page', targetPage);
-                                        
-                                        // 等待AJAX内容加载，并验证页面是否真的更新了
-                                        console.log('[PAGINATION] Waiting for content to load...');
-                                        
-                                        // 方法1: 等待固定时间
-                                        await new Promise(resolve => setTimeout(resolve, 8000));
-                                        
-                                        // 方法2: 等待直到分页按钮变为active状态
-                                        let maxWait = 20; // 最多等待20秒
-                                        let waited = 0;
-                                        while (waited < maxWait) {{
-                                            // 检查目标页码按钮是否变为active
-                                            const activeButton = Array.from(document.querySelectorAll('*')).find(el => {{
-                                                const text = (el.textContent || '').trim();
-                                                return text === targetPage && 
-                                                       (el.classList.contains('active') || 
-                                                        el.classList.contains('current') ||
-                                                        el.getAttribute('aria-current') === 'page');
-                                            }});
-                                            
-                                            if (activeButton) {{
-                                                console.log('[PAGINATION] ✓ Page', targetPage, 'is now active');
-                                                break;
-                                            }}
-                                            
-                                            // 检查页面内容是否改变（通过检查房产链接数量）
-                                            const detailLinks = Array.from(document.querySelectorAll('a[href*="/detail/"]'));
-                                            if (detailLinks.length > 0) {{
-                                                console.log('[PAGINATION] Found', detailLinks.length, 'detail links, content may have loaded');
-                                                // 再等待2秒确保内容完全加载
-                                                await new Promise(resolve => setTimeout(resolve, 2000));
-                                                break;
-                                            }}
-                                            
-                                            await new Promise(resolve => setTimeout(resolve, 1000));
-                                            waited++;
-                                        }}
-                                        
-                                        console.log('[PAGINATION] Content loading wait completed');
-                                        break;
-                                    }}
-                                }} else {{
-                                    console.log('[PAGINATION] Page', targetPage, 'is already active, skipping');
-                                }}
-                            }}
-                        }}
-                        
-                        // 方法2: 如果方法1失败，尝试在整个页面中查找（更宽松的匹配）
-                        if (!clicked) {{
-                            console.log('[PAGINATION] Method 1 failed, trying broader search...');
-                            
-                            // 查找所有包含数字的元素
-                            const numberElements = Array.from(document.querySelectorAll('*')).filter(el => {{
-                                const text = (el.textContent || '').trim();
-                                return text === targetPage && 
-                                       el.offsetParent !== null && // 元素可见
-                                       (el.tagName === 'A' || el.tagName === 'BUTTON' || el.tagName === 'LI' || el.tagName === 'SPAN');
-                            }});
-                            
-                            console.log('[PAGINATION] Found', numberElements.length, 'potential page buttons');
-                            
-                            for (let el of numberElements) {{
-                                const isActive = el.classList.contains('active') || 
-                                               el.classList.contains('current');
-                                
-                                if (!isActive) {{
-                                    el.scrollIntoView({{ behavior: 'smooth', block: 'center' }});
-                                    await new Promise(resolve => setTimeout(resolve, 1000));
-                                    
-                                    if (el.tagName === 'A' || el.tagName === 'BUTTON') {{
-                                        el.click();
-                                    }} else if (el.tagName === 'LI') {{
-                                        const link = el.querySelector('a');
-                                        if (link) link.click();
-                                        else el.click();
-                                    }} else {{
-                                        el.dispatchEvent(new MouseEvent('click', {{ bubbles: true }}));
-                                    }}
-                                    
-                                    clicked = true;
-                                    console.log('[PAGINATION] ✓ Clicked via method 2');
-                                    await new Promise(resolve => setTimeout(resolve, 6000));
-                                    break;
-                                }}
-                            }}
-                        }}
-                        
-                        if (!clicked) {{
-                            console.error('[PAGINATION] ✗ Failed to click page', targetPage);
-                            // 调试：显示页面上所有可能的页码
-                            const allNumbers = Array.from(document.querySelectorAll('*'))
-                                .map(el => (el.textContent || '').trim())
-                                .filter(text => /^\\d+$/.test(text) && parseInt(text) > 0 && parseInt(text) < 1000)
-                                .filter((v, i, a) => a.indexOf(v) === i) // 去重
-                                .slice(0, 20);
-                            console.log('[PAGINATION] Available page numbers on page:', allNumbers);
-                            return false;
-                        }}
-                        
-                        // 最终等待
-                        await new Promise(resolve => setTimeout(resolve, 2000));
-                        console.log('[PAGINATION] ✓ Page navigation completed');
-                        return true;
-                    }} catch (error) {{
-                        console.error('[PAGINATION] Error:', error);
-                        return false;
-                    }}
-                }})();
-                """
+            # 分页脚本为模块级常量 _PAGINATION_JS，只在前面设置目标页码
+            js_code = f"window.__target_page__ = {page_num};\n" + _PAGINATION_JS
             
             # 使用 session_id + js_only=True 在同一页面内点击分页
-            # 成交列表页通常渲染更慢，适当加长等待
+            # 不再固定等待：wait_for 条件满足（新页内容已渲染）后立即返回，delay_s 只作为等待上限
+            # 成交列表页通常渲染更慢，适当加长等待上限和返回前的稳定时间
             delay_s = 30 if is_transaction_list else 20
+            settle_s = 5 if is_transaction_list else 2
 
-            config = CrawlerRunConfig(
+            config = _make_run_config(
                 session_id=session_id,
                 js_code=js_code,
                 js_only=True,
-                delay_before_return_html=delay_s,
+                wait_for=_PAGINATION_WAIT_FOR,
+                wait_for_timeout=delay_s * 1000,
+                delay_before_return_html=settle_s,
                 simulate_user=True,
                 override_navigator=True,
                 magic=True,
                 log_console=True,
             )
-            result = await crawler.arun(
-                url=url,
+            result = await self._safe_arun(
+                crawler,
+                url,
                 config=config,
                 timeout=max(self.config.timeout, 200),
             )
             
-            # 确保result不是None
-            if result is None:
-                print(f"  ✗ JavaScript执行失败: result为None")
-                return []
+            # wait_for 超时不视为失败：不再重复点击，直接读取当前会话页面的HTML
+            if not result.success:
+                print(f"    ⚠ 等待第{page_num}页内容更新超时，读取当前页面内容...")
+                result = await self._safe_arun(
+                    crawler,
+                    url,
+                    config=_make_run_config(
+                        session_id=session_id,
+                        js_only=True,
+                        delay_before_return_html=settle_s,
+                    ),
+                    timeout=max(self.config.timeout, 90),
+                )
             
             if not result.success:
-                print(f"  ✗ JavaScript执行失败: {result.error_message if hasattr(result, 'error_message') else 'Unknown error'}")
-                # 即使失败，也尝试提取HTML（可能部分内容已加载）
-                if result and result.html:
-                    print(f"    ⚠ 虽然执行失败，但已获取部分HTML内容，尝试提取...")
-                else:
-                    return []
+                print(f"  ✗ JavaScript执行失败: {result.error_message or 'Unknown error'}")
+                return []
             
             print(f"    ✓ JavaScript执行完成")
             
             # 检查获取的HTML是否有效（有 session_id 时通常不会再出现 39 字符壳）
-            if result and result.html:
+            if result.html:
                 print(f"    ✓ 已获取页面内容 (HTML长度: {len(result.html)} 字符)")
             else:
                 print(f"    ⚠ 警告: result.html为空或无效")
             
             # 验证：检查提取的URL是否与第1页不同（简单验证）
-            if page_num == 2 and hasattr(self, '_first_page_urls') and result and result.html:
-                current_urls = set()
+            if page_num == 2 and hasattr(self, '_first_page_urls') and result.html:
                 try:
-                    from bs4 import BeautifulSoup
-                    soup = BeautifulSoup(result.html, 'html.parser')
-                    links = soup.find_all('a', href=True)
-                    for link in links:
-                        href = link.get('href', '')
-                        if '/findproperty/detail/' in href.lower():
-                            if not href.startswith('http'):
-                                href = urljoin(self.config.base_url, href)
-                            current_urls.add(href)
+                    current_urls = set(self._extract_detail_hrefs(result.html))
                     
                     if current_urls == self._first_page_urls:
                         print(f"    ⚠ 警告: 第2页的URL与第1页完全相同，可能JavaScript未成功执行")
@@ -516,77 +1174,21 @@ class CentanetCrawler:
                 except:
                     pass
         
-        # 确保result不是None
-        if result is None:
-            print(f"  ✗ 无法访问列表页 {page_num}: result为None")
-            return []
-        
         if not result.success:
-            print(f"  ✗ 无法访问列表页 {page_num}: {result.error_message if hasattr(result, 'error_message') else 'Unknown error'}")
+            print(f"  ✗ 无法访问列表页 {page_num}: {result.error_message or 'Unknown error'}")
             return []
         
         # 重要：列表页解析必须基于当前 result.html，不能再触发第二次 arun([FETCH])
         # 否则会把分页状态/会话重置，出现“翻页后仍是第一页”或 HTML 过短的问题。
         property_urls: List[str] = []
 
-        # 方法：使用 BeautifulSoup 从当前 HTML 提取链接（買樓/租樓通常有 /findproperty/detail/）
+        # 方法：从当前 HTML 提取链接（買樓/租樓通常有 /findproperty/detail/）
         try:
-            if result is None or not hasattr(result, "html") or not result.html:
+            if not result.html:
                 print(f"  ⚠ 警告: 无法获取页面HTML内容")
                 return []
 
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(result.html, "html.parser")
-            links = soup.find_all("a", href=True)
-
-            # Centanet的详情页URL模式: /findproperty/detail/
-            # 注意：成交页面可能使用不同的URL模式，需要更广泛的匹配
-            link_patterns = [
-                '/findproperty/detail/',  # Centanet特定模式（買樓/租樓）
-                '/findproperty/transaction/',  # 成交页面可能使用此模式
-                '/property/',
-                '/listing/',
-                '/detail/',
-                '/house/',
-                '/unit/',
-                '/transaction/',  # 成交详情
-            ]
-
-            # 排除的模式
-            exclude_patterns = [
-                '/list/',
-                '/estate/',
-                '/agent-detail/',
-                '/agent/',
-                '/district/',
-                'pasttranindex.aspx',  # 成交索引页面，不是详情页
-                'index.aspx',  # 索引页面
-            ]
-
-            for link in links:
-                href = link.get('href', '')
-                if not href:
-                    continue
-
-                href_lower = href.lower()
-
-                # 检查是否应该排除
-                should_exclude = any(exclude in href_lower for exclude in exclude_patterns)
-                if should_exclude:
-                    continue
-
-                # 检查是否是详情页链接
-                for pattern in link_patterns:
-                    if pattern in href_lower:
-                        # 处理相对URL
-                        if not href.startswith('http'):
-                            href = urljoin(self.config.base_url, href)
-                        
-                        # 确保是有效的详情页URL
-                        # 对于成交页面，URL可能包含 /transaction/ 而不是 /detail/
-                        if ('/detail/' in href_lower or '/transaction/' in href_lower) and href not in property_urls:
-                            property_urls.append(href)
-                        break
+            property_urls = self._extract_detail_hrefs(result.html)
         except ImportError:
             print("  ⚠ BeautifulSoup 未安装，无法解析列表页HTML")
         except Exception as e:
@@ -657,9 +1259,10 @@ class CentanetCrawler:
                   return true;
                 })();
                 """
-                html_result = await crawler.arun(
-                    url=url,
-                    config=CrawlerRunConfig(
+                html_result = await self._safe_arun(
+                    crawler,
+                    url,
+                    config=_make_run_config(
                         session_id=session_id,
                         js_only=True,
                         js_code=extract_tx_js,
@@ -667,25 +1270,35 @@ class CentanetCrawler:
                     ),
                     timeout=max(self.config.timeout, 90),
                 )
-                if html_result and html_result.success and html_result.html:
-                    from bs4 import BeautifulSoup
-                    soup2 = BeautifulSoup(html_result.html, "html.parser")
+                if html_result.success and html_result.html:
+                    soup2 = BeautifulSoup(html_result.html, HTML_PARSER)
                     pre = soup2.select_one("#__C4AI_TX_URLS__")
                     if pre and pre.get_text(strip=True):
-                        import json as _json
                         raw = pre.get_text(strip=True)
-                        candidates = _json.loads(raw)
+                        # orjson 为C实现，解析速度远快于标准库json
+                        candidates = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+                        base_url = self.config.base_url
+                        base_prefix = base_url.rstrip('/')
+                        seen = set()
                         for u in candidates:
                             if not u:
                                 continue
-                            abs_u = u if u.startswith("http") else urljoin(self.config.base_url, u)
-                            if "/findproperty/transaction-detail/" in abs_u.lower() and abs_u not in property_urls:
+                            if u.startswith("http"):
+                                abs_u = u
+                            elif _SIMPLE_PATH_RE.match(u):
+                                abs_u = base_prefix + u
+                            else:
+                                abs_u = urljoin(base_url, u)
+                            # 与 _extract_detail_hrefs 一致：只做页内去重，已爬取URL由 crawl_detail_page(s) 跳过，
+                            # 否则整页都已爬取时返回空列表，会被翻页逻辑当作最后一页
+                            if "/findproperty/transaction-detail/" in abs_u.lower() and abs_u not in seen:
+                                seen.add(abs_u)
                                 property_urls.append(abs_u)
             except Exception as e:
                 print(f"  ⚠ 成交列表 Nuxt URL 提取失败: {str(e)}")
         
-        # 去重
-        property_urls = list(set(property_urls))
+        # 去重（保持页面中的顺序）
+        property_urls = list(dict.fromkeys(property_urls))
         
         # 如果是第1页，保存URL以便后续验证JavaScript是否成功执行
         if page_num == 1:
@@ -699,18 +1312,16 @@ class CentanetCrawler:
                 print(f"    最后一个链接: {property_urls[-1][:80]}...")
         else:
             print(f"    ⚠ 警告: 列表页 {page_num} 没有找到任何房产链接")
-            print(f"    页面HTML长度: {len(result.html) if result and result.html else 0} 字符")
+            print(f"    页面HTML长度: {len(result.html)} 字符")
             # 尝试查找页面中的链接数量
-            if result and result.html:
+            if result.html:
                 try:
-                    from bs4 import BeautifulSoup
-                    soup = BeautifulSoup(result.html, 'html.parser')
+                    soup = BeautifulSoup(result.html, HTML_PARSER)
                     all_links = soup.find_all('a', href=True)
                     # 检查多种可能的链接模式（包括成交页面）
                     detail_links = [
                         link for link in all_links 
-                        if any(pattern in link.get('href', '').lower() 
-                               for pattern in ['/detail/', '/transaction/', '/findproperty/detail/', '/findproperty/transaction/'])
+                        if _DETAIL_LINK_RE.search(link.get('href', ''))
                         and '/list/' not in link.get('href', '').lower()
                     ]
                     print(f"    页面总链接数: {len(all_links)}")
@@ -729,73 +1340,166 @@ class CentanetCrawler:
         
         return property_urls
     
-    async def crawl_detail_page(self, url: str) -> Optional[PropertyData]:
+    async def crawl_detail_page(self, url: str, crawler: Optional[AsyncWebCrawler] = None) -> Optional[PropertyData]:
         """
         爬取房产详情页
         
         Args:
             url: 详情页URL
+            crawler: 可选的AsyncWebCrawler实例，默认使用共享浏览器
             
         Returns:
             PropertyData 对象或 None
         """
         # 检查URL是否是有效的详情页URL
         # 成交页面可能使用不同的URL格式，需要特殊处理
-        url_lower = url.lower()
-        invalid_patterns = [
-            'pasttranindex.aspx',  # 成交索引页面
-            'index.aspx',  # 索引页面
-            '/list/',  # 列表页
-            '/estate/',  # 屋苑页
-        ]
-        
-        if any(pattern in url_lower for pattern in invalid_patterns):
+        if _INVALID_DETAIL_URL_RE.search(url):
             print(f"  ⊙ 跳过非详情页URL: {url[:80]}...")
             self.failed_urls.append(url)
             return None
         
         # 检查是否已爬取（使用线程安全的方式）
         # 注意：在并发环境下，这个检查可能不够精确，但可以避免重复爬取
-        if url in self.crawled_urls:
+        if url in self.crawled_urls or self._in_crawl_history(url):
             print(f"  ⊙ 跳过已爬取的URL: {url[:80]}...")
             return None
         
-        browser_config = BrowserConfig(
-            headless=True,
-            user_agent=self.config.user_agent,
-        )
+        # 未传入crawler时，调用期间持有一层共享浏览器（未打开时临时打开），并发的其他调用退出时不会关闭它
+        if crawler is None:
+            async with self:
+                return await self.crawl_detail_page(url, crawler=self._crawler)
+        
+        try:
+            # 增加超时时间，因为详情页可能需要更长时间加载
+            result = await crawler.arun(
+                url=url,
+                timeout=60,  # 增加到60秒
+            )
+            return self._handle_detail_result(url, result)
+                
+        except Exception as e:
+            print(f"  ✗ 爬取详情页出错: {url[:80]}... - {str(e)}")
+            self.failed_urls.append(url)
+            return None
+    
+    def _handle_detail_result(self, url: str, result) -> Optional[PropertyData]:
+        """
+        处理单个详情页的爬取结果（crawl_detail_page 与 crawl_detail_pages 共用）
+        
+        Args:
+            url: 详情页URL
+            result: crawl4ai 的 CrawlResult
+            
+        Returns:
+            PropertyData 对象或 None
+        """
+        if not result.success:
+            print(f"  ✗ 无法访问详情页: {url[:80]}...")
+            self.failed_urls.append(url)
+            return None
+        
+        # 解析详情页数据
+        property_data = self._parse_detail_page(result.html, url)
+        
+        if property_data:
+            self.crawled_urls.add(url)
+            self._record_crawled(url)
+            self.properties.append(property_data)
+            print(f"  ✓ [{len(self.properties)}] 成功: {property_data.title[:50] if property_data.title else 'N/A'}...")
+            return property_data
+        else:
+            print(f"  ✗ 详情页解析失败: {url[:80]}...")
+            print(f"    可能原因: title验证失败或数据提取错误")
+            self.failed_urls.append(url)
+            return None
+    
+    async def crawl_detail_pages(self, urls: List[str], crawler: Optional[AsyncWebCrawler] = None) -> list:
+        """
+        批量爬取详情页
+        
+        设计说明：
+        ----------
+        使用 crawl4ai 的 arun_many 一次提交所有URL，由同一个浏览器调度并发导航，
+        并发数由 SemaphoreDispatcher 限制为 config.max_concurrent。
+        未传入crawler或旧版 crawl4ai 没有 arun_many / dispatcher 时，
+        回退为 asyncio.gather 逐个调用 crawl_detail_page（Semaphore 限制并发）。
+        
+        Args:
+            urls: 详情页URL列表
+            crawler: 可选的AsyncWebCrawler实例，默认使用共享浏览器
+            
+        Returns:
+            结果列表（PropertyData、None 或异常）
+        """
+        # 未传入crawler时，整批爬取期间持有一层共享浏览器（未打开时临时打开）
+        if crawler is None:
+            async with self:
+                return await self.crawl_detail_pages(urls, crawler=self._crawler)
+        total_count = len(urls)
+        
+        try:
+            from crawl4ai.async_dispatcher import SemaphoreDispatcher
+            use_arun_many = crawler is not None and hasattr(crawler, 'arun_many')
+        except ImportError:
+            use_arun_many = False
+        
+        if not use_arun_many:
+            semaphore = asyncio.Semaphore(self.config.max_concurrent)
+            completed_count = 0
+            
+            async def crawl_with_limit(url):
+                nonlocal completed_count
+                async with semaphore:
+                    result = await self.crawl_detail_page(url, crawler=crawler)
+                    completed_count += 1
+                    if completed_count % 10 == 0 or completed_count == total_count:
+                        print(f"  进度: {completed_count}/{total_count} ({completed_count*100//total_count}%)")
+                    return result
+            
+            return await asyncio.gather(*(crawl_with_limit(url) for url in urls), return_exceptions=True)
+        
+        # 与 crawl_detail_page 相同：跳过无效、已爬取和增量历史中的URL
+        results = [None] * total_count
+        pending_urls = []
+        for url in urls:
+            if _INVALID_DETAIL_URL_RE.search(url):
+                print(f"  ⊙ 跳过非详情页URL: {url[:80]}...")
+                self.failed_urls.append(url)
+            elif url in self.crawled_urls or self._in_crawl_history(url):
+                print(f"  ⊙ 跳过已爬取的URL: {url[:80]}...")
+            else:
+                pending_urls.append(url)
         
-        async with AsyncWebCrawler(config=browser_config) as crawler:
+        results_by_url = {}
+        if pending_urls:
             try:
-                # 增加超时时间，因为详情页可能需要更长时间加载
-                result = await crawler.arun(
-                    url=url,
-                    timeout=60,  # 增加到60秒
+                crawl_results = await crawler.arun_many(
+                    urls=pending_urls,
+                    config=_make_run_config(page_timeout=60000),
+                    dispatcher=SemaphoreDispatcher(semaphore_count=self.config.max_concurrent),
                 )
-                
-                if not result.success:
-                    print(f"  ✗ 无法访问详情页: {url[:80]}...")
-                    self.failed_urls.append(url)
-                    return None
-                
-                # 解析详情页数据
-                property_data = self._parse_detail_page(result.html, url)
-                
-                if property_data:
-                    self.crawled_urls.add(url)
-                    self.properties.append(property_data)
-                    print(f"  ✓ [{len(self.properties)}] 成功: {property_data.title[:50] if property_data.title else 'N/A'}...")
-                    return property_data
-                else:
-                    print(f"  ✗ 详情页解析失败: {url[:80]}...")
-                    print(f"    可能原因: title验证失败或数据提取错误")
-                    self.failed_urls.append(url)
-                    return None
-                    
+                results_by_url = {r.url: r for r in crawl_results if r is not None}
+            except Exception as e:
+                print(f"  ✗ 批量爬取详情页出错: {str(e)[:100]}")
+        
+        pending_set = set(pending_urls)
+        for i, url in enumerate(urls):
+            if url not in pending_set:
+                continue
+            result = results_by_url.get(url)
+            if result is None:
+                print(f"  ✗ 无法访问详情页: {url[:80]}...")
+                self.failed_urls.append(url)
+                continue
+            try:
+                results[i] = self._handle_detail_result(url, result)
             except Exception as e:
                 print(f"  ✗ 爬取详情页出错: {url[:80]}... - {str(e)}")
                 self.failed_urls.append(url)
-                return None
+                results[i] = e
+            if (i + 1) % 10 == 0 or i + 1 == total_count:
+                print(f"  进度: {i + 1}/{total_count} ({(i + 1)*100//total_count}%)")
+        return results
     
     def _parse_detail_page(self, html: str, url: str) -> Optional[PropertyData]:
         """
@@ -831,13 +1535,10 @@ class CentanetCrawler:
         Returns:
             PropertyData对象，如果解析失败则返回None
         """
-        try:
-            from bs4 import BeautifulSoup
-        except ImportError:
-            print("  ⚠ BeautifulSoup 未安装，无法解析详情页")
-            return None
-        
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, HTML_PARSER)
+        # 面包屑提取（方法3-4）遍历DOM时使用的 lxml 树；未安装 lxml 时为 None，回退到 soup。
+        # 只在实际执行到方法3或4时才解析（__NUXT__ paths 提取成功时通常用不到），且最多解析一次
+        get_tree = functools.lru_cache(maxsize=None)(lambda: _parse_lxml_tree(html))
         
         # 初始化所有变量
         title = None  # 标题
@@ -850,6 +1551,135 @@ class CentanetCrawler:
         estate_name = None  # 逸瓏灣等（从面包屑中提取，最后一个）
         is_transaction_detail = '/findproperty/transaction-detail/' in (url or '').lower()
         
+        # ========================================================================
+        # 方法2: 从JavaScript paths数组中提取面包屑（最可靠的方法）
+        # ========================================================================
+        # 设计说明：
+        # - 这是最可靠的方法，因为JavaScript中的paths数组包含结构化的面包屑数据
+        # - paths数组通常在<script>标签中的__NUXT__对象中，直接在原始HTML上查找（不需要遍历DOM或提取页面文本）
+        # - 先于方法1执行：找到paths后跳过方法1/3对整页文本和所有链接的扫描
+        # - path格式如："新界西_4-NW", "荃灣 | 麗城_23-WS050"
+        # - 需要从path中提取显示文本（去掉编码部分）
+        #
+        # 优点：
+        # - 数据结构化，提取准确
+        # - 不受页面文本格式影响
+        # - 包含完整的层级信息
+        #
+        # 缺点：
+        # - 需要解析JavaScript代码
+        # - 如果页面结构改变，可能失效
+        paths_found = False
+
+        for breadcrumb_items in _iter_nuxt_breadcrumb_items(html):
+            if breadcrumb_items:
+
+                # 映射面包屑项
+                # - transaction-detail：严格按网页层级「主頁 > 成交 > (港島/九龍/新界東/新界西) > ...」映射
+                # - buy/rent：保留原先的智能映射逻辑
+                if is_transaction_detail:
+                    # 期望层级示例：主頁 成交 九龍 南昌站 南昌站 匯璽 (后面可能还有期数/座等，忽略)
+                    items = [i for i in breadcrumb_items if i and i not in ['>', '/', '地圖搵樓', '地图搵楼', '網上搵樓', '网上搵楼']]
+                    # 去掉开头主頁
+                    if items and items[0] in ['主頁', '主页']:
+                        items = items[1:]
+
+                    # category 固定优先取「成交」
+                    if items and items[0] == '成交':
+                        category = '成交'
+                        items = items[1:]
+                    else:
+                        category = '成交'
+
+                    # region：港島/九龍/新界東/新界西（或香港島）
+                    for cand in items:
+                        if cand in ['港島', '香港島', '九龍', '新界東', '新界西']:
+                            region = '港島' if cand == '香港島' else cand
+                            break
+                    if region and region in items:
+                        # 只移除第一个出现的 region
+                        ri = items.index(region)
+                        items = items[:ri] + items[ri+1:]
+
+                    # 后续层级：按网页显示顺序映射
+                    # district_level2 = 第1个, sub_district = 第2个, estate_name = 第3个
+                    if len(items) >= 1:
+                        district_level2 = items[0]
+                    if len(items) >= 2:
+                        sub_district = items[1]
+                    if len(items) >= 3:
+                        estate_name = items[2]
+
+                    paths_found = True
+                    break
+
+                # 买/租：原先逻辑
+                if len(breadcrumb_items) >= 4:
+                    # 找到区域信息（跳过主頁和買樓）
+                    for item in breadcrumb_items:
+                        if any(keyword in item for keyword in ['新界', '港島', '九龍', '香港島']):
+                            region = item
+                            break
+
+                    # 获取非区域和非导航的项目
+                    non_region_items = [item for item in breadcrumb_items if item != region and item not in ['主頁', '主页', '買樓']]
+
+                    # 智能映射基于项目数量和内容
+                    if len(non_region_items) >= 1:
+                        first_item = non_region_items[0]
+
+                        # 检查第一个项目是否是district
+                        is_first_item_district = first_item in _HK_DISTRICTS
+
+                        if is_first_item_district and len(non_region_items) >= 2:
+                            # 模式: district → district_level2 → sub_district → estate_name
+                            district = first_item
+                            district_level2 = non_region_items[1]
+
+                            if len(non_region_items) >= 3:
+                                sub_district_candidate = non_region_items[2]
+                                if sub_district_candidate and sub_district_candidate != district_level2:
+                                    sub_district = sub_district_candidate
+
+                            if len(non_region_items) >= 4:
+                                estate_name_candidate = non_region_items[3]
+                                if estate_name_candidate:
+                                    estate_name = estate_name_candidate.lstrip('-').split('_')[0]
+                            elif len(non_region_items) >= 3:
+                                # 如果只有3个项目，最后一个是estate_name
+                                estate_name_candidate = non_region_items[2]
+                                if estate_name_candidate and estate_name_candidate != sub_district:
+                                    estate_name = estate_name_candidate.lstrip('-').split('_')[0]
+                        else:
+                            # 传统模式: district_level2 → sub_district → estate_name
+                            district_level2_candidate = first_item
+                            if '|' in district_level2_candidate:
+                                district_level2 = district_level2_candidate
+                                # 从district_level2提取district
+                                district = district_level2_candidate.split('|')[0].strip()
+                            else:
+                                # 对于没有"|"的地区，直接设置为district_level2
+                                district_level2 = district_level2_candidate
+                                # 根据region设置district
+                                if region == '九龍' and '將軍澳' in district_level2_candidate:
+                                    district = '西貢'  # 將軍澳屬於西貢區
+
+                            if len(non_region_items) >= 2:
+                                # sub_district（荃景圍或將軍澳）
+                                sub_district_candidate = non_region_items[1]
+                                if sub_district_candidate and sub_district_candidate != district_level2:
+                                    sub_district = sub_district_candidate
+
+                            if len(non_region_items) >= 3:
+                                # estate_name（海之戀，去掉编码）
+                                estate_name_candidate = non_region_items[2]
+                                if estate_name_candidate:
+                                    # 处理可能带"-"前缀或编码的情况，但不强制要求"-"
+                                    estate_name = estate_name_candidate.lstrip('-').split('_')[0]
+
+                    paths_found = True
+                    break
+
         # ========================================================================
         # 方法1: 从页面文本中直接提取面包屑模式（通过正则表达式）
         # ========================================================================
@@ -864,24 +1694,16 @@ class CentanetCrawler:
         # - 格式3: 主頁 買樓 新界西 屯門 屯門北 大興花園
         #
         # 注意：此方法可能不够可靠，因为页面文本可能包含干扰内容
-        page_text = soup.get_text(separator=' ') if soup else ""  # 使用空格分隔，保持文本结构
-        # 更灵活的面包屑模式，支持6-7个层级，保留"|"分隔符用于district_level2
-        breadcrumb_patterns = [
-            r'主頁\s+買樓\s+新界西\s+([^\s]+(?:\s*\|\s*[^\s]+)?)\s+([^\s]+)\s+([^\s]+(?:\s*\([^\)]+\))?)?',  # 主頁 買樓 新界西 荃灣 | 麗城 荃景圍 荃灣中心瀋陽樓 (19座)
-            r'主頁\s+買樓\s+新界東\s+([^\s]+(?:\s*\|\s*[^\s]+)?)\s+([^\s]+)\s+([^\s]+)',  # 主頁 買樓 新界東 大埔 白石角 逸瓏灣
-            r'主頁\s+買樓\s+新界西\s+([^\s]+)\s+([^\s]+)\s+([^\s]+)\s+([^\s]+)',  # 主頁 買樓 新界西 屯門 屯門北 大興花園
-            r'主頁\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)',  # 6个层级（包含主頁）
-            r'主頁\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)',  # 7个层级（包含主頁）
-            r'買樓\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)',  # 从買樓开始，5个层级
-            r'買樓\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)',  # 从買樓开始，6个层级
-        ]
+        # 只遍历一次DOM取出所有文本片段：page_text（空格分隔）和后面价格等提取用的desc_text（直接拼接）都由它生成
+        page_strings = list(soup.strings) if soup else []
+        page_text = ' '.join(page_strings)  # 使用空格分隔，保持文本结构
 
         breadcrumb_match = None
         breadcrumb_items_count = 0
 
-        for pattern in breadcrumb_patterns:
-            match = re.search(pattern, page_text)
-            if match:
+        # 方法2已从paths数组提取到面包屑时跳过
+        if not paths_found:
+            for match in _iter_first_matches(page_text, _BREADCRUMB_PATTERNS, _BREADCRUMB_UNION):
                 breadcrumb_match = match
                 breadcrumb_items_count = len(match.groups())
                 # 检查是否匹配到了正确的面包屑（包含"新界西"或"新界東"）
@@ -892,171 +1714,6 @@ class CentanetCrawler:
                     breadcrumb_match = None
                     continue
         
-        # ========================================================================
-        # 方法2: 从JavaScript paths数组中提取面包屑（最可靠的方法）
-        # ========================================================================
-        # 设计说明：
-        # - 这是最可靠的方法，因为JavaScript中的paths数组包含结构化的面包屑数据
-        # - paths数组通常在<script>标签中的__NUXT__对象中
-        # - path格式如："新界西_4-NW", "荃灣 | 麗城_23-WS050"
-        # - 需要从path中提取显示文本（去掉编码部分）
-        #
-        # 优点：
-        # - 数据结构化，提取准确
-        # - 不受页面文本格式影响
-        # - 包含完整的层级信息
-        #
-        # 缺点：
-        # - 需要解析JavaScript代码
-        # - 如果页面结构改变，可能失效
-        if not breadcrumb_match:
-            # 查找包含paths数组的script标签
-            scripts = soup.find_all('script')
-            paths_found = False
-
-            for script in scripts:
-                if script.string:
-                    script_text = script.string
-                    # 查找paths数组
-                    paths_match = re.search(r'paths:\s*\[([^\]]+)\]', script_text)
-                    if paths_match:
-                        paths_content = paths_match.group(1)
-
-                        # 成交(transaction-detail) 特别点：
-                        # - paths 里「主頁 / 成交」通常在 label:"主頁"/label:"成交" 中
-                        # - 而后续层级在 path:"九龍_..."/path:"南昌站_..." 中
-                        # 因此这里同时抽 label 字面量 + path 显示文本，按出现顺序拼成 breadcrumb_items
-
-                        breadcrumb_items = []
-
-                        # 1) 先抽取 label:"..."（只会抓到字面量，不会抓到 label:k 这种变量引用）
-                        label_matches = re.findall(r'label:"([^"]+)"', paths_content)
-                        for lb in label_matches:
-                            if lb:
-                                breadcrumb_items.append(lb.strip())
-
-                        # 2) 再抽取 path:"..." 并取 '_' 前的显示文本
-                        path_matches = re.findall(r'path:"([^"]+)"', paths_content)
-                        for path in path_matches:
-                            if '_' in path:
-                                display_text = path.split('_')[0].strip()
-                                if display_text:
-                                    breadcrumb_items.append(display_text)
-
-                        if breadcrumb_items:
-
-                            # 映射面包屑项
-                            # - transaction-detail：严格按网页层级「主頁 > 成交 > (港島/九龍/新界東/新界西) > ...」映射
-                            # - buy/rent：保留原先的智能映射逻辑
-                            if is_transaction_detail:
-                                # 期望层级示例：主頁 成交 九龍 南昌站 南昌站 匯璽 (后面可能还有期数/座等，忽略)
-                                items = [i for i in breadcrumb_items if i and i not in ['>', '/', '地圖搵樓', '地图搵楼', '網上搵樓', '网上搵楼']]
-                                # 去掉开头主頁
-                                if items and items[0] in ['主頁', '主页']:
-                                    items = items[1:]
-
-                                # category 固定优先取「成交」
-                                if items and items[0] == '成交':
-                                    category = '成交'
-                                    items = items[1:]
-                                else:
-                                    category = '成交'
-
-                                # region：港島/九龍/新界東/新界西（或香港島）
-                                for cand in items:
-                                    if cand in ['港島', '香港島', '九龍', '新界東', '新界西']:
-                                        region = '港島' if cand == '香港島' else cand
-                                        break
-                                if region and region in items:
-                                    # 只移除第一个出现的 region
-                                    ri = items.index(region)
-                                    items = items[:ri] + items[ri+1:]
-
-                                # 后续层级：按网页显示顺序映射
-                                # district_level2 = 第1个, sub_district = 第2个, estate_name = 第3个
-                                if len(items) >= 1:
-                                    district_level2 = items[0]
-                                if len(items) >= 2:
-                                    sub_district = items[1]
-                                if len(items) >= 3:
-                                    estate_name = items[2]
-
-                                paths_found = True
-                                break
-
-                            # 买/租：原先逻辑
-                            if len(breadcrumb_items) >= 4:
-                                # 找到区域信息（跳过主頁和買樓）
-                                for item in breadcrumb_items:
-                                    if any(keyword in item for keyword in ['新界', '港島', '九龍', '香港島']):
-                                        region = item
-                                        break
-
-                                # 获取非区域和非导航的项目
-                                non_region_items = [item for item in breadcrumb_items if item != region and item not in ['主頁', '主页', '買樓']]
-
-                                # 智能映射基于项目数量和内容
-                                if len(non_region_items) >= 1:
-                                    first_item = non_region_items[0]
-
-                                    # 检查第一个项目是否是district
-                                    hk_districts = [
-                                        # New Territories
-                                        '大埔', '荃灣', '屯門', '元朗', '沙田', '北區', '西貢', '葵青', '離島',
-                                        # Hong Kong Island
-                                        '中西區', '東區', '南區', '灣仔', '九龍城', '觀塘', '深水埗', '黃大仙', '油尖旺'
-                                    ]
-                                    is_first_item_district = first_item in hk_districts
-
-                                    if is_first_item_district and len(non_region_items) >= 2:
-                                        # 模式: district → district_level2 → sub_district → estate_name
-                                        district = first_item
-                                        district_level2 = non_region_items[1]
-
-                                        if len(non_region_items) >= 3:
-                                            sub_district_candidate = non_region_items[2]
-                                            if sub_district_candidate and sub_district_candidate != district_level2:
-                                                sub_district = sub_district_candidate
-
-                                        if len(non_region_items) >= 4:
-                                            estate_name_candidate = non_region_items[3]
-                                            if estate_name_candidate:
-                                                estate_name = estate_name_candidate.lstrip('-').split('_')[0]
-                                        elif len(non_region_items) >= 3:
-                                            # 如果只有3个项目，最后一个是estate_name
-                                            estate_name_candidate = non_region_items[2]
-                                            if estate_name_candidate and estate_name_candidate != sub_district:
-                                                estate_name = estate_name_candidate.lstrip('-').split('_')[0]
-                                    else:
-                                        # 传统模式: district_level2 → sub_district → estate_name
-                                        district_level2_candidate = first_item
-                                        if '|' in district_level2_candidate:
-                                            district_level2 = district_level2_candidate
-                                            # 从district_level2提取district
-                                            district = district_level2_candidate.split('|')[0].strip()
-                                        else:
-                                            # 对于没有"|"的地区，直接设置为district_level2
-                                            district_level2 = district_level2_candidate
-                                            # 根据region设置district
-                                            if region == '九龍' and '將軍澳' in district_level2_candidate:
-                                                district = '西貢'  # 將軍澳屬於西貢區
-
-                                        if len(non_region_items) >= 2:
-                                            # sub_district（荃景圍或將軍澳）
-                                            sub_district_candidate = non_region_items[1]
-                                            if sub_district_candidate and sub_district_candidate != district_level2:
-                                                sub_district = sub_district_candidate
-
-                                        if len(non_region_items) >= 3:
-                                            # estate_name（海之戀，去掉编码）
-                                            estate_name_candidate = non_region_items[2]
-                                            if estate_name_candidate:
-                                                # 处理可能带"-"前缀或编码的情况，但不强制要求"-"
-                                                estate_name = estate_name_candidate.lstrip('-').split('_')[0]
-
-                                paths_found = True
-                                break
-
         # ========================================================================
         # 方法3: 从导航链接中提取面包屑（备用方法）
         # ========================================================================
@@ -1068,14 +1725,11 @@ class CentanetCrawler:
         # 注意：此方法可能不够准确，因为链接顺序可能不反映实际层级
         if not breadcrumb_match and not paths_found:
             # 查找包含导航路径的链接，按顺序提取
-            nav_links = soup.find_all('a', href=True)
             breadcrumb_sequence = []
             seen_hrefs = set()
 
             # 查找包含面包屑路径的链接
-            for link in nav_links:
-                href = link.get('href', '')
-                text = link.get_text(strip=True)
+            for href, text in _anchor_links(get_tree(), soup):
 
                 # 检查是否是面包屑导航链接
                 if any(path in href for path in ['/findproperty/list/', '/findproperty/detail/', '/findproperty/district/']):
@@ -1094,11 +1748,9 @@ class CentanetCrawler:
                 if len(link_texts) >= 3:
                     # 尝试匹配面包屑模式
                     breadcrumb_text = ' '.join(link_texts)
-                    for pattern in breadcrumb_patterns:
-                        match = re.search(pattern, breadcrumb_text)
-                        if match:
-                            breadcrumb_match = match
-                            break
+                    breadcrumb_match = next(
+                        _iter_first_matches(breadcrumb_text, _BREADCRUMB_PATTERNS, _BREADCRUMB_UNION), None
+                    )
         
         if breadcrumb_match:
             items = breadcrumb_match.groups()
@@ -1123,7 +1775,7 @@ class CentanetCrawler:
                 
                 # district_level2: 保留完整文本，包括"|"（如"荃灣 | 麗城"）
                 district_level2_item = items[0].strip()
-                if district_level2_item and not re.match(r'^\d+座$', district_level2_item):
+                if district_level2_item and not _ZUO_RE.match(district_level2_item):
                     district_level2 = district_level2_item
                 
                 # district: 从district_level2中提取第一部分（如"荃灣"）
@@ -1135,23 +1787,17 @@ class CentanetCrawler:
                 # sub_district: 第二个项（如"荃灣西"）
                 if len(items) >= 2:
                     sub_district_item = items[1].strip()
-                    if sub_district_item and not re.match(r'^\d+座$', sub_district_item):
+                    if sub_district_item and not _ZUO_RE.match(sub_district_item):
                         sub_district = sub_district_item
                 
                 # estate_name: 第三个项（如"映日灣"）
                 if len(items) >= 3:
                     estate_item = items[2].strip()
-                    if estate_item and not re.match(r'^\d+座$', estate_item):
+                    if estate_item and not _ZUO_RE.match(estate_item):
                         estate_name = estate_item
             else:
                 # 旧格式：过滤掉无效项和座数
                 valid_items = []
-                invalid_keywords = [
-                    '網上', '搵樓', '地圖', '更多', 'More', '主頁', '主页', 
-                    '分行網絡', '中原地產', '接收心水樓盤最新',
-                    '使用WeChat掃描QRcode', '中原薈', '一手新盤'
-                ]
-                invalid_keywords_list = ['QRcode', 'WeChat', '掃描', '網絡', '地產', '接收', '心水', '樓盤', '最新']
                 
                 for item in items:
                     if item:
@@ -1160,13 +1806,10 @@ class CentanetCrawler:
                         if '|' in item:
                             item = item.split('|')[0].strip()
                         # 排除座数（如"2座"、"3座"等）
-                        if re.match(r'^\d+座$', item):
+                        if _ZUO_RE.match(item):
                             continue
                         # 排除其他无效项
-                        if (item not in invalid_keywords and 
-                            len(item) > 1 and 
-                            not any(kw in item for kw in invalid_keywords) and
-                            not any(kw in item for kw in invalid_keywords_list)):
+                        if len(item) > 1 and not _OLD_FORMAT_INVALID_RE.search(item):
                             valid_items.append(item)
                 
                 # 解析层级
@@ -1176,7 +1819,7 @@ class CentanetCrawler:
                 
                 # 第一个应该是category
                 if idx < len(valid_items):
-                    if valid_items[idx] in ['買樓', '租樓', '成交', '新盤', '新盘']:
+                    if valid_items[idx] in _CATEGORIES:
                         category = valid_items[idx]
                         idx += 1
                     elif '買樓' in page_text:
@@ -1186,7 +1829,7 @@ class CentanetCrawler:
                 
                 # 第二个应该是region
                 if idx < len(valid_items):
-                    if valid_items[idx] in ['新界西', '新界東', '新界东', '港島', '港岛', '九龍', '九龙', '新界', '港岛']:
+                    if valid_items[idx] in _REGIONS:
                         region = valid_items[idx]
                         idx += 1
                 
@@ -1213,7 +1856,7 @@ class CentanetCrawler:
                 for i in range(len(valid_items) - 1, -1, -1):
                     item = valid_items[i]
                     # 如果不是座数且不是无效项，就作为estate_name
-                    if (not re.match(r'^\d+座$', item) and 
+                    if (not _ZUO_RE.match(item) and 
                         item not in invalid_for_estate and
                         not any(kw in item for kw in ['QRcode', 'WeChat', '掃描', '網絡', '地產', '接收'])):
                         estate_name = item
@@ -1238,58 +1881,29 @@ class CentanetCrawler:
                 '[class*="path"]',
             ]
             
-            breadcrumb_elem = None
-            for selector in breadcrumb_selectors:
-                breadcrumb_elem = soup.select_one(selector)
-                if breadcrumb_elem:
-                    # 检查元素是否有实际内容（不是空容器）
-                    if breadcrumb_elem.get_text(strip=True):
-                        break
-                    else:
-                        breadcrumb_elem = None
+            breadcrumb_container = _find_breadcrumb_container(get_tree(), soup, breadcrumb_selectors, page_text)
             
-            # 如果标准面包屑元素为空，尝试查找包含面包屑文本的div
-            if not breadcrumb_elem or not breadcrumb_elem.get_text(strip=True):
-                # 查找所有div，检查是否包含面包屑文本
-                all_divs = soup.find_all('div')
-                for div in all_divs:
-                    text = div.get_text(separator=' ', strip=True)
-                    # 检查是否包含完整的面包屑模式
-                    if '主頁' in text and '買樓' in text and any(region_kw in text for region_kw in ['新界西', '新界東', '港島', '九龍']):
-                        breadcrumb_elem = div
-                        break
-            
-            if breadcrumb_elem:
+            if breadcrumb_container:
                 # 提取所有链接文本和文本节点
-                breadcrumb_links = breadcrumb_elem.select('a, span, li, [class*="item"], [class*="link"]')
+                full_text, breadcrumb_links = breadcrumb_container
                 breadcrumb_texts = []
                 
                 # 如果链接为空，尝试从元素文本中提取
                 if not breadcrumb_links:
                     # 从元素文本中提取面包屑项
-                    full_text = breadcrumb_elem.get_text(separator=' ', strip=True)
                     # 尝试分割文本
                     if '主頁' in full_text:
                         # 查找包含"主頁"的文本片段
-                        parts = re.split(r'\s+', full_text)
+                        parts = _WS_RE.split(full_text)
                         breadcrumb_texts = parts
                 else:
-                    for item in breadcrumb_links:
-                        text = item.get_text(strip=True)
+                    for text in breadcrumb_links:
                         # 保留包含"|"分隔符的完整文本（用于district_level2）
                         # 不在这里分割，稍后在解析时处理
                         # 排除无效项（更严格的过滤）
-                        invalid_items = [
-                            '>', '/', '»', '', 
-                            '分行網絡', '中原地產', '接收心水樓盤最新',
-                            '使用WeChat掃描QRcode', '中原薈', '一手新盤',
-                            'QRcode', 'WeChat', '掃描', '網絡', '地產', '接收'
-                        ]
-                        # 检查是否包含无效关键词
-                        invalid_keywords = ['QRcode', 'WeChat', '掃描', '網絡', '地產', '接收', '心水', '樓盤', '最新']
-                        if text and text not in invalid_items:
+                        if text and text not in _BREADCRUMB_INVALID_ITEMS:
                             # 检查是否包含无效关键词
-                            if not any(kw in text for kw in invalid_keywords):
+                            if not _INVALID_KW_RE.search(text):
                                 breadcrumb_texts.append(text)
                 
                 # 解析层级（实际格式：主頁 買樓 新界西 荃灣 荃灣西 御凱 2座）
@@ -1304,28 +1918,27 @@ class CentanetCrawler:
                         '屋苑', '更多', 'More', '分行網絡', '中原地產',
                         '接收心水樓盤最新', '使用WeChat掃描QRcode', '中原薈', '一手新盤'
                     ]
-                    invalid_keywords = ['QRcode', 'WeChat', '掃描', '網絡', '地產', '接收', '心水', '樓盤', '最新']
                     
                     for item in items:
                         # 排除座数（如"2座"、"3座"等）
-                        if re.match(r'^\d+座$', item):
+                        if _ZUO_RE.match(item):
                             continue
                         # 排除其他无效项
                         if item not in invalid_patterns:
                             # 检查是否包含无效关键词
-                            if not any(kw in item for kw in invalid_keywords):
+                            if not _INVALID_KW_RE.search(item):
                                 filtered_items.append(item)
                     items = filtered_items
                     
                     if len(items) >= 1 and not category:
                         # 第一个通常是类别
-                        if items[0] in ['買樓', '租樓', '成交', '新盤', '新盘']:
+                        if items[0] in _CATEGORIES:
                             category = items[0]
                             items = items[1:]
                     
                     if len(items) >= 1 and not region:
                         # 第一个可能是大区
-                        if items[0] in ['新界西', '新界東', '新界东', '港島', '港岛', '九龍', '九龙', '新界', '港岛']:
+                        if items[0] in _REGIONS:
                             region = items[0]
                             items = items[1:]
                     
@@ -1354,20 +1967,16 @@ class CentanetCrawler:
                         
                         if pipe_idx >= 0 and pipe_idx + 1 < len(items):
                             sub_district_item = items[pipe_idx + 1]
-                            if sub_district_item and not re.match(r'^\d+座$', sub_district_item):
+                            if sub_district_item and not _ZUO_RE.match(sub_district_item):
                                 sub_district = sub_district_item.strip()
                         
                         # estate_name: 最后一个有效项（排除座数和无效项）
-                        invalid_for_estate = [
-                            '分行網絡', '中原地產', '接收心水樓盤最新', '中原薈', '一手新盤',
-                            '立即登入', '登入/註冊', '立即註冊', '登入', '註冊', '我的優惠', '我的關注', '屋苑'
-                        ]
                         for i in range(len(items) - 1, -1, -1):
                             item = items[i]
-                            if (not re.match(r'^\d+座$', item) and 
+                            if (not _ZUO_RE.match(item) and 
                                 '|' not in item and
-                                item not in invalid_for_estate and
-                                not any(kw in item for kw in ['登入', '註冊', '優惠', '關注', 'QRcode', 'WeChat', '掃描', '網絡', '地產', '接收'])):
+                                item not in _INVALID_FOR_ESTATE and
+                                not _ESTATE_INVALID_KW_RE.search(item)):
                                 estate_name = item.strip()
                                 break
                     else:
@@ -1402,16 +2011,12 @@ class CentanetCrawler:
                         # estate_name（最后一个，排除座数和无效项）
                         if len(items) > 0 and not estate_name:
                             # 从后往前找，跳过座数和无效项
-                            invalid_for_estate = [
-                                '分行網絡', '中原地產', '接收心水樓盤最新', '中原薈', '一手新盤',
-                                '立即登入', '登入/註冊', '立即註冊', '登入', '註冊', '我的優惠', '我的關注', '屋苑'
-                            ]
                             for i in range(len(items) - 1, -1, -1):
                                 item = items[i]
                                 # 如果不是座数且不是无效项，就作为estate_name
-                                if (not re.match(r'^\d+座$', item) and 
-                                    item not in invalid_for_estate and
-                                    not any(kw in item for kw in ['QRcode', 'WeChat', '掃描', '網絡', '地產', '接收', '登入', '註冊', '優惠', '關注'])):
+                                if (not _ZUO_RE.match(item) and 
+                                    item not in _INVALID_FOR_ESTATE and
+                                    not _ESTATE_INVALID_KW_RE.search(item)):
                                     estate_name = item
                                     break
         
@@ -1429,26 +2034,17 @@ class CentanetCrawler:
             seen_hrefs = set()
             
             for link in nav_links:
-                text = link.get_text(strip=True)
+                text = _soup_text(link)
                 href = link.get('href', '')
                 
                 # 检查是否是导航项
-                invalid_nav_items = [
-                    '加入比較', '加入比较', '更多', 'More', '分享', '取消', '明白', 
-                    '屋苑', '分行網絡', '中原地產', '接收心水樓盤最新'
-                ]
-                
-                if text and text not in invalid_nav_items:
+                if text and text not in _INVALID_NAV_ITEMS:
                     # 检查链接是否包含导航路径或文本包含导航关键词
-                    is_nav_link = (
-                        any(keyword in href for keyword in ['/list/', '/district/', '/estate/', '/findproperty/']) or
-                        any(keyword in text for keyword in ['買樓', '租樓', '新界', '港島', '九龍', '荃灣', '大埔', '屯門', '御凱', '逸瓏灣', '映日灣', '麗城'])
-                    )
+                    is_nav_link = bool(_NAV_HREF_RE.search(href) or _NAV_TEXT_RE.search(text))
                     
                     if is_nav_link and href not in seen_hrefs:
                         # 排除无效项
-                        invalid_keywords = ['QRcode', 'WeChat', '掃描', '網絡', '地產', '接收', '心水', '樓盤', '最新']
-                        if not any(kw in text for kw in invalid_keywords):
+                        if not _INVALID_KW_RE.search(text):
                             # 保留完整文本，包括"|"分隔符
                             breadcrumb_items.append((text, href))
                             seen_hrefs.add(href)
@@ -1480,30 +2076,24 @@ class CentanetCrawler:
                             region = text
                         elif '|' not in text and text not in [category, region, district]:
                             # sub_district: 在包含"|"的项之后（如"荃灣西"）
-                            if not sub_district and not re.match(r'^\d+座$', text):
+                            if not sub_district and not _ZUO_RE.match(text):
                                 # 检查是否是sub_district（通常在district_level2之后）
                                 if district_level2:
                                     sub_district = text.strip()
                             # estate_name: 最后一个有效项（排除座数）
-                            elif not estate_name and not re.match(r'^\d+座$', text):
+                            elif not estate_name and not _ZUO_RE.match(text):
                                 estate_name = text.strip()
                 else:
                     # 旧格式：按顺序提取
                     seen_texts = set()
-                    invalid_nav_items = [
-                        '屋苑', '我的優惠', '我的關注', '搜尋條件', '樓盤比較', 
-                        '按揭轉介', '按揭計算', '中原Apps', '更多', '聯絡我們',
-                        '分行網絡', '中原地產', '接收心水樓盤最新', '中原薈', '一手新盤'
-                    ]
                     
                     for text, href in breadcrumb_items:
-                        if text in seen_texts or text in invalid_nav_items:
+                        if text in seen_texts or text in _OLD_NAV_INVALID_ITEMS:
                             continue
                         seen_texts.add(text)
                         
                         # 排除包含无效关键词的项
-                        invalid_keywords = ['QRcode', 'WeChat', '掃描', '網絡', '地產', '接收', '心水', '樓盤', '最新', '優惠', '關注', '條件', '比較']
-                        if any(kw in text for kw in invalid_keywords):
+                        if _NAV_INVALID_KW_RE.search(text):
                             continue
                         
                         if text in ['買樓', '租樓', '成交'] and not category:
@@ -1512,30 +2102,23 @@ class CentanetCrawler:
                             region = text
                         elif not district and text not in [category, region] and len(text) > 1:
                             # 检查是否是有效的区域名称（district）
-                            hk_districts = ['屯門', '元朗', '沙田', '大埔', '荃灣', '北區', '西貢', '葵青', '離島', 
-                                          '屯门', '元朗', '沙田', '大埔', '荃湾', '北区', '西贡', '葵青', '离岛',
-                                          '中西區', '東區', '南區', '灣仔', '九龍城', '觀塘', '深水埗', '黃大仙', '油尖旺']
-                            if any(d in text for d in hk_districts) or text in hk_districts:
+                            if _HK_DISTRICT_RE.search(text):
                                 district = text
                         elif not district_level2 and text not in [category, region, district] and len(text) > 1:
                             # district_level2（如"白石角"、"荃灣西"）
                             # 排除无效项
-                            if text not in invalid_nav_items:
+                            if text not in _OLD_NAV_INVALID_ITEMS:
                                 district_level2 = text
                         elif not sub_district and text not in [category, region, district, district_level2] and len(text) > 1:
                             # sub_district（如"逸瓏灣"）
-                            if text not in invalid_nav_items:
+                            if text not in _OLD_NAV_INVALID_ITEMS:
                                 sub_district = text
                         elif not estate_name and text not in [category, region, district, district_level2, sub_district] and len(text) > 1:
                             # estate_name（最后一个，如"逸瓏灣"、"御凱"）
                             # 排除座数和无效项
-                            invalid_for_estate = [
-                                '分行網絡', '中原地產', '接收心水樓盤最新', '中原薈', '一手新盤', 
-                                '我的優惠', '我的關注', '屋苑', '立即登入', '登入/註冊', '立即註冊', '登入', '註冊'
-                            ]
-                            if (not re.match(r'^\d+座$', text) and 
-                                text not in invalid_for_estate and
-                                not any(kw in text for kw in ['QRcode', 'WeChat', '掃描', '網絡', '地產', '接收', '優惠', '關注', '條件', '比較', '登入', '註冊'])):
+                            if (not _ZUO_RE.match(text) and 
+                                text not in _INVALID_FOR_ESTATE and
+                                not _NAV_ESTATE_INVALID_KW_RE.search(text)):
                                 estate_name = text
         
         # 方法4: 从页面文本中查找关键词（备用方法）
@@ -1569,60 +2152,49 @@ class CentanetCrawler:
             
             # 尝试从页面文本中查找面包屑序列
             # 注意：页面文本格式可能不同，需要更灵活的模式
-            breadcrumb_sequence_patterns = [
-                r'主頁\s+買樓\s+新界西\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)',
-                r'主頁\s+買樓\s+新界東\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)',
-                r'買樓\s+新界西\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)',
-                r'買樓\s+新界東\s+([^\s|]+)\s+([^\s|]+)\s+([^\s|]+)',
-                # 更灵活的模式，允许中间有其他文本
-                r'新界西[^\s]*([^\s|]{2,10})[^\s]*([^\s|]{2,10})[^\s]*([^\s|]{2,10})',
-                r'新界東[^\s]*([^\s|]{2,10})[^\s]*([^\s|]{2,10})[^\s]*([^\s|]{2,10})',
-            ]
             
-            for pattern in breadcrumb_sequence_patterns:
-                match = re.search(pattern, page_text)
-                if match:
-                    items = match.groups()
-                    # 处理"|"分隔符和过滤无效项
-                    processed_items = []
-                    invalid_items = ['屋苑', '我的優惠', '我的關注', '搜尋條件', '樓盤比較', '按揭轉介', '按揭計算', '地圖搵樓']
-                    for item in items:
-                        if '|' in item:
-                            item = item.split('|')[0].strip()
-                        # 排除座数、无效项和太短的项
-                        if (not re.match(r'^\d+座$', item) and 
-                            item not in invalid_items and
-                            len(item) >= 2 and
-                            not any(kw in item for kw in ['優惠', '關注', '條件', '比較', '轉介', '計算', '搵樓', '地圖'])):
-                            processed_items.append(item)
-                    
-                    if len(processed_items) >= 1 and not district:
-                        district = processed_items[0]
-                    if len(processed_items) >= 2 and not district_level2:
-                        district_level2 = processed_items[1]
-                    if len(processed_items) >= 3 and not estate_name:
-                        estate_name = processed_items[2]
-                    elif len(processed_items) >= 2 and not estate_name:
-                        # 如果只有2个，第二个可能是estate_name
-                        estate_name = processed_items[1]
-                    
-                    if district or district_level2 or estate_name:
-                        break
+            for match in _iter_first_matches(page_text, _BREADCRUMB_SEQUENCE_PATTERNS, _BREADCRUMB_SEQUENCE_UNION):
+                items = match.groups()
+                # 处理"|"分隔符和过滤无效项
+                processed_items = []
+                invalid_items = ['屋苑', '我的優惠', '我的關注', '搜尋條件', '樓盤比較', '按揭轉介', '按揭計算', '地圖搵樓']
+                for item in items:
+                    if '|' in item:
+                        item = item.split('|')[0].strip()
+                    # 排除座数、无效项和太短的项
+                    if (not _ZUO_RE.match(item) and 
+                        item not in invalid_items and
+                        len(item) >= 2 and
+                        not any(kw in item for kw in ['優惠', '關注', '條件', '比較', '轉介', '計算', '搵樓', '地圖'])):
+                        processed_items.append(item)
+                
+                if len(processed_items) >= 1 and not district:
+                    district = processed_items[0]
+                if len(processed_items) >= 2 and not district_level2:
+                    district_level2 = processed_items[1]
+                if len(processed_items) >= 3 and not estate_name:
+                    estate_name = processed_items[2]
+                elif len(processed_items) >= 2 and not estate_name:
+                    # 如果只有2个，第二个可能是estate_name
+                    estate_name = processed_items[1]
+                
+                if district or district_level2 or estate_name:
+                    break
         
         # 方法6: 从页面中查找包含"|"分隔符的面包屑文本（最后的备用方法）
         # 根据网页内容，面包屑可能是：主頁 買樓 新界西 荃灣 | 麗城 荃灣西 映日灣
         # 注意：由于面包屑可能通过JavaScript动态加载，HTML中可能没有完整文本
         # 但根据已知的region和estate_name，可以推断
         if not district_level2 or not sub_district:
-            # 首先尝试从HTML中查找
-            all_elements = soup.find_all(['a', 'span', 'div', 'li', 'nav'])
+            # 首先尝试从HTML中查找（整页文本中没有"|"和"荃灣"时不会有符合的元素，跳过遍历）
+            all_elements = soup.find_all(['a', 'span', 'div', 'li', 'nav']) if '|' in page_text and '荃灣' in page_text else []
             for elem in all_elements:
                 text = elem.get_text(separator=' ', strip=True)
                 # 检查是否包含完整的面包屑模式
                 if '|' in text and '荃灣' in text:
                     # 提取包含"|"的部分
                     # 模式可能是："荃灣 | 麗城"
-                    pipe_match = re.search(r'([^\s]+\s*\|\s*[^\s]+)', text)
+                    pipe_match = _PIPE_ITEM_RE.search(text)
                     if pipe_match:
                         district_level2_text = pipe_match.group(1).strip()
                         if not district_level2:
@@ -1896,7 +2468,7 @@ class CentanetCrawler:
                 break
         
         # 获取完整页面文本用于提取（提前定义，避免变量作用域问题）
-        desc_text = soup.get_text() if soup else ""
+        desc_text = ''.join(page_strings)
         
         # 从页面文本中提取价格（优先从price_elem，如果没有则从整个页面文本）
         price_source_text = None
@@ -1911,17 +2483,11 @@ class CentanetCrawler:
         if price_source_text:
             # 查找所有价格数字（可能有多个价格，如"售$0萬$2,480萬"，需要排除"0萬"）
             # 匹配格式：数字+萬 或 数字+万
-            price_patterns = [
-                r'\$(\d+(?:,\d+)*)\s*萬',  # $数字萬（优先匹配带$的，通常是实际价格）
-                r'(\d+(?:,\d+)*)\s*萬',    # 数字萬
-                r'(\d+(?:,\d+)*)\s*万',    # 数字万
-                r'HK\$\s*(\d+(?:,\d+)*)',  # HK$数字
-            ]
             
             all_prices = []
             price_matches = []
-            for pattern in price_patterns:
-                matches = re.findall(pattern, price_source_text)
+            for pattern in _PRICE_PATTERNS:
+                matches = pattern.findall(price_source_text)
                 for match in matches:
                     try:
                         price_num = float(match.replace(',', ''))
@@ -1929,7 +2495,7 @@ class CentanetCrawler:
                         if price_num > 10:  # 排除小于10的价格（可能是错误匹配）
                             # 如果是"万"单位，转换为港币
                             if '萬' in price_source_text or '万' in price_source_text:
-                                if pattern.endswith('萬') or pattern.endswith('万'):
+                                if pattern.pattern.endswith(('萬', '万')):
                                     price_num *= 10000
                             all_prices.append(price_num)
                             price_matches.append((price_num, match, pattern))
@@ -1945,23 +2511,21 @@ class CentanetCrawler:
                 
                 # 提取price_display（找到对应的价格文本）
                 # 优先查找"$数字萬"格式
-                price_display_match = re.search(r'\$(\d+(?:,\d+)*)\s*[萬万]', price_source_text)
+                price_display_match = _PRICE_DISPLAY_RE.search(price_source_text)
                 if price_display_match:
                     price_text = f"{price_display_match.group(1)} 萬"
                 else:
                     # 如果没有找到带$的，查找最大的数字萬
                     max_price_match = None
                     max_price_val = 0
-                    for pattern in [r'(\d+(?:,\d+)*)\s*[萬万]']:
-                        matches = re.finditer(pattern, price_source_text)
-                        for match in matches:
-                            try:
-                                val = float(match.group(1).replace(',', ''))
-                                if val > max_price_val and val > 10:  # 排除0和很小的数字
-                                    max_price_val = val
-                                    max_price_match = match
-                            except:
-                                pass
+                    for match in _WAN_PRICE_RE.finditer(price_source_text):
+                        try:
+                            val = float(match.group(1).replace(',', ''))
+                            if val > max_price_val and val > 10:  # 排除0和很小的数字
+                                max_price_val = val
+                                max_price_match = match
+                        except:
+                            pass
                     if max_price_match:
                         price_text = f"{max_price_match.group(1)} 萬"
                     else:
@@ -1972,13 +2536,13 @@ class CentanetCrawler:
                             price_text = f"{int(price_value)} 萬"
             else:
                 # 如果没有找到带单位的，尝试直接提取数字
-                price_match = re.search(r'(\d+(?:,\d+)*)', price_source_text.replace(',', ''))
+                price_match = _NUMBER_RE.search(price_source_text.replace(',', ''))
                 if price_match:
                     price_value = float(price_match.group())
                     if '萬' in price_source_text or '万' in price_source_text:
                         price_value *= 10000
                 # 清理price_text
-                price_text = re.sub(r'\s+', ' ', price_source_text).strip()
+                price_text = _WS_RE.sub(' ', price_source_text).strip()
         
         # ========================================================================
         # 月供提取（Monthly Mortgage Payment）
@@ -1989,25 +2553,20 @@ class CentanetCrawler:
         # - 如果提取失败，返回None
         monthly_mortgage_payment = None
         # 从价格文本或页面文本中提取月供信息
-        mortgage_patterns = [
-            r'月供[：:]\s*\$?\s*([\d,]+)',  # 月供：$30,885
-            r'月供\s*\$?\s*([\d,]+)',      # 月供 $30,885
-            r'月供[：:]\s*([\d,]+)',      # 月供：30,885
-        ]
         
         # 从价格元素中提取
         if price_elem:
             mortgage_text = price_elem.get_text()
-            for pattern in mortgage_patterns:
-                mortgage_match = re.search(pattern, mortgage_text)
+            for pattern in _MORTGAGE_PATTERNS:
+                mortgage_match = pattern.search(mortgage_text)
                 if mortgage_match:
                     monthly_mortgage_payment = f"${mortgage_match.group(1)}"
                     break
         
         # 如果还没找到，从页面文本中提取
         if not monthly_mortgage_payment:
-            for pattern in mortgage_patterns:
-                mortgage_match = re.search(pattern, desc_text)
+            for pattern in _MORTGAGE_PATTERNS:
+                mortgage_match = pattern.search(desc_text)
                 if mortgage_match:
                     monthly_mortgage_payment = f"${mortgage_match.group(1)}"
                     break
@@ -2025,7 +2584,7 @@ class CentanetCrawler:
         if area_elem:
             area_text = area_elem.get_text(strip=True)
             # 解析面积数字（平方呎）
-            area_match = re.search(r'[\d.]+', area_text)
+            area_match = _DECIMAL_RE.search(area_text)
             if area_match:
                 area_value = float(area_match.group())
         
@@ -2053,13 +2612,8 @@ class CentanetCrawler:
         if not title or title in ['屋苑', '偏好設定', '偏好设置', '網上搵樓', '网上搵楼']:
             # 从description中查找可能的标题模式
             # 模式：屋苑名称 + 期数 + 座数 + 楼层 + 室号
-            title_patterns = [
-                r'([^\s]{2,15}(?:花園|苑|邨|中心|居|軒|灣|城|山|臺|台|半山|新|豪|庭|門))\s*(\d+期)?\s*(\d+座)?\s*([低中高]層)?\s*([A-Z]室)?',
-                r'([^\s]{2,15})\s*(\d+期)\s*(\d+座)\s*([低中高]層)\s*([A-Z]室)',
-                r'([A-Z]\.?[A-Z]?[^\s]{0,10})\s*(高層|中層|低層)',  # Y.I高層
-            ]
-            for pattern in title_patterns:
-                match = re.search(pattern, desc_text)
+            for pattern in _TITLE_PATTERNS:
+                match = pattern.search(desc_text)
                 if match:
                     # 组合所有非空组
                     parts = [g for g in match.groups() if g]
@@ -2079,8 +2633,8 @@ class CentanetCrawler:
                 title_parts = title.split()
                 for part in title_parts:
                     # 排除座数、期数、楼层等
-                    if (not re.match(r'^\d+座$', part) and 
-                        not re.match(r'^\d+期$', part) and
+                    if (not _ZUO_RE.match(part) and 
+                        not _QI_RE.match(part) and
                         part not in ['高層', '中層', '低層', '层', '層'] and
                         part not in invalid_estate_names and
                         len(part) > 1 and
@@ -2111,8 +2665,7 @@ class CentanetCrawler:
         # 如果没找到，尝试从description中提取地址
         if not location:
             # 查找地址模式（通常在"景秀里"这样的格式）
-            address_pattern = r'[^\s]{2,10}(?:里|路|街|道|邨|村|苑|花園|花園|中心)'
-            address_match = re.search(address_pattern, desc_text)
+            address_match = _ADDRESS_RE.search(desc_text)
             if address_match:
                 location = address_match.group()
         
@@ -2136,7 +2689,7 @@ class CentanetCrawler:
                 if type_text:
                     property_type = type_text
                     # 从房型文本中提取卧室数
-                    bedroom_match = re.search(r'(\d+)\s*房', type_text)
+                    bedroom_match = _BEDROOM_RE.search(type_text)
                     if bedroom_match:
                         bedrooms = int(bedroom_match.group(1))
                     break
@@ -2144,8 +2697,7 @@ class CentanetCrawler:
         # 如果没找到，从description中提取
         if not property_type:
             # 查找"間隔X 房"或"X房"模式
-            room_pattern = r'間隔\s*(\d+)\s*房|(\d+)\s*房'
-            room_match = re.search(room_pattern, desc_text)
+            room_match = _ROOM_RE.search(desc_text)
             if room_match:
                 bedrooms = int(room_match.group(1) or room_match.group(2))
                 property_type = f"{bedrooms}房"
@@ -2153,15 +2705,9 @@ class CentanetCrawler:
         # 提取浴室数（bathrooms）
         bathrooms = None
         # 从"X 房(Y 套房)"或"X 房(Y 浴室)"模式中提取
-        bathroom_patterns = [
-            r'(\d+)\s*套房',  # "1 套房"
-            r'(\d+)\s*浴室',  # "2 浴室"
-            r'\((\d+)\s*套房\)',  # "(1 套房)"
-            r'(\d+)\s*廁',    # "2 廁"
-        ]
         
-        for pattern in bathroom_patterns:
-            bathroom_match = re.search(pattern, desc_text)
+        for pattern in _BATHROOM_PATTERNS:
+            bathroom_match = pattern.search(desc_text)
             if bathroom_match:
                 bathrooms = int(bathroom_match.group(1))
                 break
@@ -2173,8 +2719,7 @@ class CentanetCrawler:
         
         # 先尝试提取完整的地址信息（屋苑名称 + 街道）
         # 模式：屋苑名称 + 期数 + 座/居 + 街道
-        full_address_pattern = r'([^\s]{2,15}(?:花園|苑|邨|中心|居|軒|灣|城|山|臺|台|半山|新|豪|庭))\s*(?:\d+期[A-Z]?)?\s*([^\s]{2,10}(?:居|座|軒|苑))?\s*([^\s]{2,10}(?:徑|路|街|道|里))'
-        full_address_match = re.search(full_address_pattern, desc_text)
+        full_address_match = _FULL_ADDRESS_RE.search(desc_text)
         
         # 无效的area_name列表
         invalid_area_names = [
@@ -2197,17 +2742,13 @@ class CentanetCrawler:
         # 如果没找到完整模式，分别查找
         if not street:
             # 查找街道模式：XXX徑、XXX路、XXX街、XXX道
-            street_patterns = [
-                r'([^\s]{2,15}(?:徑|路|街|道|里))',  # 街道名称
-                r'([^\s]{2,10}(?:徑|路|街|道))',     # 简化版
-            ]
             
-            for pattern in street_patterns:
-                street_match = re.search(pattern, desc_text)
+            for pattern in _STREET_PATTERNS:
+                street_match = pattern.search(desc_text)
                 if street_match:
                     street = street_match.group(1).strip()
                     # 清理可能的标点符号
-                    street = re.sub(r'[()（）]', '', street)
+                    street = _PAREN_RE.sub('', street)
                     if street and len(street) > 1:
                         break
         
@@ -2215,10 +2756,6 @@ class CentanetCrawler:
         if not area_name:
             # 从description中提取屋苑名称（通常在地址信息中）
             # 模式：XXX花園、XXX苑、XXX邨、XXX中心等
-            area_patterns = [
-                r'([^\s]{2,15}(?:花園|苑|邨|中心|居|軒|灣|城|山|臺|台|半山|新|豪|庭))',  # 屋苑名称
-                r'([^\s]{2,10}(?:花園|苑|邨))',  # 简化版
-            ]
             
             # 排除无效的area_name
             invalid_area_names = [
@@ -2226,12 +2763,12 @@ class CentanetCrawler:
                 '屋苑', '單位', '物業', '專頁', 'QRcode', 'WeChat', '掃描'
             ]
             
-            for pattern in area_patterns:
-                area_match = re.search(pattern, desc_text)
+            for pattern in _AREA_NAME_PATTERNS:
+                area_match = pattern.search(desc_text)
                 if area_match:
                     potential_area = area_match.group(1).strip()
                     # 清理可能的标点符号
-                    potential_area = re.sub(r'[()（）]', '', potential_area)
+                    potential_area = _PAREN_RE.sub('', potential_area)
                     if (potential_area and len(potential_area) > 1 and
                         potential_area not in invalid_area_names and
                         not any(kw in potential_area for kw in ['QRcode', 'WeChat', '掃描', '網絡', '地產', '接收', '心水', '樓盤', '最新'])):
@@ -2350,15 +2887,8 @@ class CentanetCrawler:
         
         # 从description中提取楼层
         if not floor:
-            floor_patterns = [
-                r'(\d+)\s*樓',
-                r'(\d+)\s*层',
-                r'(\d+)\s*層',
-                r'(\d+)\s*F',
-                r'(\d+)\s*座',  # 有时用"座"表示
-            ]
-            for pattern in floor_patterns:
-                floor_match = re.search(pattern, desc_text)
+            for pattern in _FLOOR_PATTERNS:
+                floor_match = pattern.search(desc_text)
                 if floor_match:
                     floor = floor_match.group(1)
                     break
@@ -2380,13 +2910,8 @@ class CentanetCrawler:
         # 从description中提取朝向
         if not orientation:
             # 查找"座向XXX"或"向XXX"模式
-            orient_patterns = [
-                r'座向([東西南北東南東北西南西北]+)',
-                r'向([東西南北東南東北西南西北]+)',
-                r'([東西南北東南東北西南西北]+)向',
-            ]
-            for pattern in orient_patterns:
-                orient_match = re.search(pattern, desc_text)
+            for pattern in _ORIENTATION_PATTERNS:
+                orient_match = pattern.search(desc_text)
                 if orient_match:
                     orientation = orient_match.group(1)
                     break
@@ -2403,15 +2928,9 @@ class CentanetCrawler:
         # 提取楼龄（building_age）
         building_age = None
         # 查找"X年"或"X歲"模式
-        age_patterns = [
-            r'(\d+)\s*年',
-            r'(\d+)\s*歲',
-            r'樓齡[：:]\s*(\d+)',
-            r'屋齡[：:]\s*(\d+)',
-        ]
         
-        for pattern in age_patterns:
-            age_match = re.search(pattern, desc_text)
+        for pattern in _AGE_PATTERNS:
+            age_match = pattern.search(desc_text)
             if age_match:
                 try:
                     building_age = int(age_match.group(1))
@@ -2425,9 +2944,8 @@ class CentanetCrawler:
         
         # 提取更新日期
         update_date = None
-        date_pattern = r'更新日期[：:]\s*(\d{4}[-/]\d{1,2}[-/]\d{1,2})'
-        desc_text = soup.get_text() if soup else ""
-        date_match = re.search(date_pattern, desc_text)
+        desc_text = ''.join(page_strings)
+        date_match = _UPDATE_DATE_RE.search(desc_text)
         if date_match:
             date_str = date_match.group(1)
             try:
@@ -2717,6 +3235,11 @@ class CentanetCrawler:
                 - None: 不筛选地区
                 注意：如果指定了region，会在爬取详情页后根据提取的region字段进行过滤
         """
+        # 未通过 async with 打开共享浏览器时，自动打开并在结束后关闭
+        if self._crawler is None:
+            async with self:
+                return await self.crawl_all(max_pages, max_properties, category, region)
+        
         print("="*70)
         print("开始爬取中原地产数据")
         print("="*70)
@@ -2733,69 +3256,64 @@ class CentanetCrawler:
         print("="*70)
         
         # 爬取列表页
-        # 关键：创建单个crawler实例，确保在同一浏览器会话中执行所有操作
-        # 这样JavaScript点击分页按钮后，可以获取更新后的HTML
-        browser_config = BrowserConfig(
-            headless=True,
-            user_agent=self.config.user_agent,
-        )
-        
+        # 关键：列表页和详情页共用同一个浏览器实例，确保在同一浏览器会话中执行所有操作
+        # 这样JavaScript点击分页按钮后，可以获取更新后的HTML，也避免重复启动浏览器
         all_property_urls = []
         
-        # 使用单个crawler实例处理所有页面
-        async with AsyncWebCrawler(config=browser_config) as crawler:
-            for page in range(1, max_pages + 1):
-                # Centanet使用AJAX分页，所有页面使用相同的URL
-                # 需要通过JavaScript点击分页按钮来加载不同页面的内容
-                # list_url 已在上面根据 category 构建
-                
-                print(f"\n[列表页 {page}/{max_pages}] URL: {list_url} (通过点击分页按钮加载)")
-                # 传递crawler实例，确保在同一浏览器会话中执行
-                property_urls = await self.crawl_list_page(list_url, page, crawler=crawler)
-                
-                # 确保property_urls不是None
-                if property_urls is None:
-                    print(f"  ⚠ 警告: 列表页 {page} 返回了None，使用空列表")
-                    property_urls = []
-                
-                print(f"  本页提取到 {len(property_urls)} 个房产URL")
-                
-                # 检查是否有重复URL（与之前页面比较）
-                if property_urls and all_property_urls:
-                    new_urls = [url for url in property_urls if url not in all_property_urls]
-                    duplicate_urls = [url for url in property_urls if url in all_property_urls]
-                    print(f"    新URL: {len(new_urls)} 个")
-                    print(f"    重复URL: {len(duplicate_urls)} 个")
-                    if duplicate_urls and page > 1:
-                        print(f"    ⚠ 警告: 本页有 {len(duplicate_urls)} 个URL与之前页面重复")
-                        if len(duplicate_urls) == len(property_urls):
-                            print(f"    ⚠ 严重: 本页所有URL都是重复的！")
-                            print(f"    可能原因: JavaScript分页按钮点击失败，页面内容未更新")
-                            print(f"    重复URL示例: {duplicate_urls[0][:80]}...")
-                
-                print(f"  累计提取到 {len(all_property_urls) + len(property_urls)} 个房产URL")
-                
-                if not property_urls:
-                    print(f"  ⚠ 列表页 {page} 没有找到房产，可能已到最后一页")
-                    # 如果连续2页都没有找到房产，停止爬取
-                    if page > 1:
-                        print(f"  停止爬取（连续页面无数据）")
-                        break
-                else:
-                    all_property_urls.extend(property_urls)
-                
-                # 如果已达到最大数量限制
-                if max_properties and len(all_property_urls) >= max_properties:
-                    all_property_urls = all_property_urls[:max_properties]
-                    print(f"  已达到最大数量限制 ({max_properties})，停止爬取列表页")
+        # 使用共享的crawler实例处理所有页面
+        crawler = self._crawler
+        for page in range(1, max_pages + 1):
+            # Centanet使用AJAX分页，所有页面使用相同的URL
+            # 需要通过JavaScript点击分页按钮来加载不同页面的内容
+            # list_url 已在上面根据 category 构建
+            
+            print(f"\n[列表页 {page}/{max_pages}] URL: {list_url} (通过点击分页按钮加载)")
+            # 传递crawler实例，确保在同一浏览器会话中执行
+            property_urls = await self.crawl_list_page(list_url, page, crawler=crawler)
+            
+            # 确保property_urls不是None
+            if property_urls is None:
+                print(f"  ⚠ 警告: 列表页 {page} 返回了None，使用空列表")
+                property_urls = []
+            
+            print(f"  本页提取到 {len(property_urls)} 个房产URL")
+            
+            # 检查是否有重复URL（与之前页面比较）
+            if property_urls and all_property_urls:
+                new_urls = [url for url in property_urls if url not in all_property_urls]
+                duplicate_urls = [url for url in property_urls if url in all_property_urls]
+                print(f"    新URL: {len(new_urls)} 个")
+                print(f"    重复URL: {len(duplicate_urls)} 个")
+                if duplicate_urls and page > 1:
+                    print(f"    ⚠ 警告: 本页有 {len(duplicate_urls)} 个URL与之前页面重复")
+                    if len(duplicate_urls) == len(property_urls):
+                        print(f"    ⚠ 严重: 本页所有URL都是重复的！")
+                        print(f"    可能原因: JavaScript分页按钮点击失败，页面内容未更新")
+                        print(f"    重复URL示例: {duplicate_urls[0][:80]}...")
+            
+            print(f"  累计提取到 {len(all_property_urls) + len(property_urls)} 个房产URL")
+            
+            if not property_urls:
+                print(f"  ⚠ 列表页 {page} 没有找到房产，可能已到最后一页")
+                # 如果连续2页都没有找到房产，停止爬取
+                if page > 1:
+                    print(f"  停止爬取（连续页面无数据）")
                     break
-                
-                # 请求间隔
-                await asyncio.sleep(self.config.rate_limit)
-        
-        # 去重
+            else:
+                all_property_urls.extend(property_urls)
+            
+            # 如果已达到最大数量限制
+            if max_properties and len(all_property_urls) >= max_properties:
+                all_property_urls = all_property_urls[:max_properties]
+                print(f"  已达到最大数量限制 ({max_properties})，停止爬取列表页")
+                break
+            
+            # 请求间隔
+            await asyncio.sleep(self.config.rate_limit)
+    
+        # 去重（dict.fromkeys 一次遍历完成，并保留URL的发现顺序）
         original_count = len(all_property_urls)
-        all_property_urls = list(set(all_property_urls))
+        all_property_urls = list(dict.fromkeys(all_property_urls))
         duplicate_count = original_count - len(all_property_urls)
         print(f"\n总共找到 {original_count} 个房产URL")
         if duplicate_count > 0:
@@ -2818,23 +3336,11 @@ class CentanetCrawler:
         # 爬取详情页（并发控制）
         print(f"\n开始爬取详情页...")
         print(f"  待爬取URL总数: {len(all_property_urls)}")
-        semaphore = asyncio.Semaphore(self.config.max_concurrent)
-        
-        # 添加进度跟踪
-        completed_count = 0
-        total_count = len(all_property_urls)
+        # 共享浏览器，由 arun_many 批量并发导航（不可用时回退为逐个爬取）
+        results = await self.crawl_detail_pages(all_property_urls, crawler=crawler)
         
-        async def crawl_with_limit(url, index):
-            nonlocal completed_count
-            async with semaphore:
-                result = await self.crawl_detail_page(url)
-                completed_count += 1
-                if completed_count % 10 == 0 or completed_count == total_count:
-                    print(f"  进度: {completed_count}/{total_count} ({completed_count*100//total_count}%)")
-                return result
-        
-        tasks = [crawl_with_limit(url, i) for i, url in enumerate(all_property_urls)]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # 增量模式：保存本次新爬取的URL到历史
+        self._save_crawl_history()
         
         # 统计
         success_count = sum(1 for r in results if r and not isinstance(r, Exception))
@@ -2909,8 +3415,12 @@ class CentanetCrawler:
         # 保存为JSON
         json_file = self.output_dir / f"properties_{timestamp}.json"
         data = [prop.to_dict() for prop in self.properties]
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        if HAS_ORJSON:
+            # orjson 为C实现，编码速度远快于标准库json（输出同样是UTF-8、不转义中文）
+            json_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(json_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
         print(f"\n✓ JSON数据已保存到: {json_file}")
         print(f"  共 {len(data)} 条记录")
         
@@ -2947,10 +3457,12 @@ async def main():
                        help='类别筛选: buy/買樓, rent/租樓, transaction/成交')
     parser.add_argument('--region', type=str, default=None,
                        help='地区筛选: 港島, 九龍, 新界東, 新界西 等')
+    parser.add_argument('--incremental', action='store_true',
+                       help='增量爬取：跳过之前运行中已成功爬取的详情页')
     
     args = parser.parse_args()
     
-    crawler = CentanetCrawler()
+    crawler = CentanetCrawler(incremental=args.incremental)
     
     # 先测试爬取少量数据
     print("开始测试爬取...")
@@ -2971,6 +3483,10 @@ async def main():
     print("4. 检查保存的数据文件确认数据质量")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop（基于libuv的C实现事件循环）比默认事件循环快，未安装时使用 asyncio 默认实现
+    if HAS_UVLOOP:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
 
 
@@ -19,6 +19,41 @@ REQUIRED_PACKAGES = {
 }
 
 OPTIONAL_PACKAGES = {
+    "lxml": {
+        "required": False,
+        "description": "基于libxml2的HTML解析库，用于加速页面解析",
+        "used_in": ["28hse_crawler.py", "28hse_explorer.py", "centanet_crawler.py"]
+    },
+    "pybloom_live": {
+        "required": False,
+        "description": "Bloom过滤器库（pip包名: pybloom-live），用于增量爬取和本次运行的URL去重",
+        "used_in": ["28hse_crawler.py", "centanet_crawler.py"]
+    },
+    "orjson": {
+        "required": False,
+        "description": "高性能JSON序列化库，用于加速数据保存",
+        "used_in": ["28hse_crawler.py", "centanet_crawler.py"]
+    },
+    "ahocorasick": {
+        "required": False,
+        "description": "Aho-Corasick多模式匹配库（pip包名: pyahocorasick），用于地区筛选和链接匹配",
+        "used_in": ["28hse_crawler.py", "28hse_explorer.py"]
+    },
+    "pyarrow": {
+        "required": False,
+        "description": "Apache Arrow列式数据库，用于加速CSV数据保存和输出Parquet文件",
+        "used_in": ["28hse_crawler.py"]
+    },
+    "uvloop": {
+        "required": False,
+        "description": "基于libuv的asyncio事件循环（不支持Windows），用于加速异步爬取",
+        "used_in": ["28hse_crawler.py", "centanet_crawler.py"]
+    },
+    "hyperscan": {
+        "required": False,
+        "description": "Intel Hyperscan多正则匹配引擎，用于页面结构探索",
+        "used_in": ["28hse_explorer.py"]
+    },
     "psutil": {
         "required": False,
         "description": "系统进程和系统利用率库，用于内存监控",
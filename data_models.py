@@ -4,12 +4,16 @@
 定义房产数据的结构
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import List, Optional
 from datetime import datetime
 
+# Python 3.10+ 的 dataclass 支持 slots=True：实例不再带 __dict__，大量房产记录时内存占用明显减少
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class PropertyData:
     """房产数据模型"""
     # 基本信息（无默认值的字段在前）
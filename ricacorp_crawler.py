@@ -44,6 +44,40 @@ class RicacorpCrawler:
         self.crawled_urls: set[str] = set()
         self.properties: List[PropertyData] = []
         self.failed_urls: List[str] = []
+        self._browser_config = BrowserConfig(headless=True, user_agent=self.config.user_agent)
+        self._crawler: Optional[AsyncWebCrawler] = None  # 共享瀏覽器實例（通過 async with 打開）
+        # async with 的嵌套層數：併發調用可能同時進入，只有最外層退出時才關閉瀏覽器
+        self._enter_depth = 0
+        self._crawler_lock = asyncio.Lock()
+        # 限制同時進行的詳情頁請求數（所有 crawl_detail_page 調用共用）
+        self._detail_semaphore = asyncio.Semaphore(self.config.max_concurrent)
+
+    async def __aenter__(self):
+        """
+        打開共享的瀏覽器實例
+
+        列表頁和詳情頁都複用這個實例，避免每個詳情頁都冷啟動一個新的瀏覽器。
+        用法: async with RicacorpCrawler() as crawler: ...
+        可以重入：併發調用各自進入時共用同一個瀏覽器，瀏覽器啟動完成後才對其他調用可見。
+        """
+        self._enter_depth += 1
+        try:
+            async with self._crawler_lock:
+                if self._crawler is None:
+                    crawler = AsyncWebCrawler(config=self._browser_config)
+                    await crawler.__aenter__()
+                    self._crawler = crawler
+        except BaseException:
+            self._enter_depth -= 1
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        """退出最外層的 async with 時關閉共享的瀏覽器實例"""
+        self._enter_depth -= 1
+        if self._enter_depth == 0 and self._crawler is not None:
+            crawler, self._crawler = self._crawler, None
+            await crawler.__aexit__(exc_type, exc, tb)
 
     # -----------------------------
     # URL helpers
@@ -111,13 +145,13 @@ class RicacorpCrawler:
         self, url: str, page_num: int = 1, crawler: Optional[AsyncWebCrawler] = None
     ) -> List[str]:
         """
-        爬取列表頁並回傳詳情頁 URL 清單
+        爬取列表頁並回傳詳情頁 URL 清單（未傳入 crawler 時使用共享瀏覽器）
         """
-        browser_config = BrowserConfig(headless=True, user_agent=self.config.user_agent)
-        if crawler is not None:
-            return await self._crawl_list_page_with_crawler(crawler, url, page_num)
-        async with AsyncWebCrawler(config=browser_config) as new_crawler:
-            return await self._crawl_list_page_with_crawler(new_crawler, url, page_num)
+        # 未傳入 crawler 時，調用期間持有一層共享瀏覽器（未打開時臨時打開），併發的其他調用退出時不會關閉它
+        if crawler is None:
+            async with self:
+                return await self.crawl_list_page(url, page_num, crawler=self._crawler)
+        return await self._crawl_list_page_with_crawler(crawler, url, page_num)
 
     async def _crawl_list_page_with_crawler(
         self, crawler: AsyncWebCrawler, url: str, page_num: int
@@ -273,33 +307,45 @@ class RicacorpCrawler:
     # -----------------------------
     # Detail crawling
     # -----------------------------
-    async def crawl_detail_page(self, url: str) -> Optional[PropertyData]:
+    async def crawl_detail_page(
+        self, url: str, crawler: Optional[AsyncWebCrawler] = None
+    ) -> Optional[PropertyData]:
+        """
+        爬取單個詳情頁
+
+        預設使用共享瀏覽器（未打開時臨時打開一個），同時進行的請求數由 self._detail_semaphore 限制，
+        因此可以直接用 asyncio.gather 併發調用。
+        """
         if not url or not url.startswith("http"):
             return None
         url = self._normalize_url(url)
         if url in self.crawled_urls:
             return None
+
+        # 未傳入 crawler 時，調用期間持有一層共享瀏覽器（未打開時臨時打開），併發的其他調用退出時不會關閉它
+        if crawler is None:
+            async with self:
+                return await self.crawl_detail_page(url, crawler=self._crawler)
         self.crawled_urls.add(url)
 
-        browser_config = BrowserConfig(headless=True, user_agent=self.config.user_agent)
         try:
-            async with AsyncWebCrawler(config=browser_config) as crawler:
+            async with self._detail_semaphore:
                 result = await crawler.arun(
                     url=url,
                     timeout=max(self.config.timeout, 60),
                     wait_for="networkidle",
                 )
-                if not result or not result.success:
-                    print(f"  ✗ 無法訪問: {url[:90]}...")
-                    self.failed_urls.append(url)
-                    return None
-
-                prop = self._parse_detail_page(result.html, url)
-                if prop:
-                    self.properties.append(prop)
-                    return prop
+            if not result or not result.success:
+                print(f"  ✗ 無法訪問: {url[:90]}...")
                 self.failed_urls.append(url)
                 return None
+
+            prop = self._parse_detail_page(result.html, url)
+            if prop:
+                self.properties.append(prop)
+                return prop
+            self.failed_urls.append(url)
+            return None
         except Exception as e:
             print(f"  ✗ 爬取失敗: {url[:90]}... 錯誤: {str(e)[:120]}")
             self.failed_urls.append(url)
@@ -948,6 +994,11 @@ class RicacorpCrawler:
         category: Optional[str] = None,
         region: Optional[str] = None,
     ):
+        # 未通過 async with 打開共享瀏覽器時，自動打開並在結束後關閉
+        if self._crawler is None:
+            async with self:
+                return await self.crawl_all(max_pages, max_properties, category, region)
+
         print("=" * 70)
         print("開始爬取 Ricacorp 資料")
         print("=" * 70)
@@ -962,28 +1013,25 @@ class RicacorpCrawler:
         print(f"最大房產數: {max_properties or '不限制'}")
         print("=" * 70)
 
-        browser_config = BrowserConfig(headless=True, user_agent=self.config.user_agent)
-
         all_property_urls: List[str] = []
-        async with AsyncWebCrawler(config=browser_config) as crawler:
-            for page in range(1, max_pages + 1):
-                print(f"\n[列表頁 {page}/{max_pages}]")
-                urls = await self.crawl_list_page(list_url, page, crawler=crawler)
-                print(f"  本頁擷取到 {len(urls)} 個 URL")
-                if not urls:
-                    if page > 1:
-                        break
-                else:
-                    all_property_urls.extend(urls)
-
-                if max_properties and len(all_property_urls) >= max_properties:
-                    all_property_urls = all_property_urls[:max_properties]
+        for page in range(1, max_pages + 1):
+            print(f"\n[列表頁 {page}/{max_pages}]")
+            urls = await self.crawl_list_page(list_url, page)
+            print(f"  本頁擷取到 {len(urls)} 個 URL")
+            if not urls:
+                if page > 1:
                     break
+            else:
+                all_property_urls.extend(urls)
+
+            if max_properties and len(all_property_urls) >= max_properties:
+                all_property_urls = all_property_urls[:max_properties]
+                break
 
-                await asyncio.sleep(self.config.rate_limit)
+            await asyncio.sleep(self.config.rate_limit)
 
-        # 去重
-        all_property_urls = list(set(all_property_urls))
+        # 去重（dict.fromkeys 一次遍歷完成，並保留 URL 的發現順序）
+        all_property_urls = list(dict.fromkeys(all_property_urls))
         print(f"\n總共找到 {len(all_property_urls)} 個唯一 URL")
         if not all_property_urls:
             print("沒有找到任何房產 URL（可能需要調整 Ricacorp 的 URL 規則）")
@@ -993,20 +1041,19 @@ class RicacorpCrawler:
             all_property_urls = all_property_urls[:max_properties]
 
         print("\n開始爬取詳情頁...")
-        semaphore = asyncio.Semaphore(self.config.max_concurrent)
         completed = 0
         total = len(all_property_urls)
 
-        async def crawl_with_limit(u: str):
+        async def crawl_with_progress(u: str):
             nonlocal completed
-            async with semaphore:
-                r = await self.crawl_detail_page(u)
-                completed += 1
-                if completed % 10 == 0 or completed == total:
-                    print(f"  進度: {completed}/{total} ({completed * 100 // total}%)")
-                return r
-
-        results = await asyncio.gather(*[crawl_with_limit(u) for u in all_property_urls], return_exceptions=True)
+            r = await self.crawl_detail_page(u)
+            completed += 1
+            if completed % 10 == 0 or completed == total:
+                print(f"  進度: {completed}/{total} ({completed * 100 // total}%)")
+            return r
+
+        # 併發數由 crawl_detail_page 內的 self._detail_semaphore 限制
+        results = await asyncio.gather(*[crawl_with_progress(u) for u in all_property_urls], return_exceptions=True)
         success_count = sum(1 for r in results if r and not isinstance(r, Exception))
         error_count = sum(1 for r in results if isinstance(r, Exception))
 